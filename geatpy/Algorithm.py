@@ -1,9 +1,31 @@
 # -*- coding: utf-8 -*-
+import os
+import pickle
+import random
+import threading
 import time
 import warnings
 import numpy as np
 import geatpy as ea
 
+CHECKPOINT_VERSION = 2
+
+
+def writeCheckpoint(fileName, data):
+
+    """
+    描述:
+        把已序列化的断点数据写入临时文件，再原子地替换断点文件，确保断点文件总是完整的。
+
+    """
+
+    tempName = fileName + '.tmp'
+    with open(tempName, 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tempName, fileName)
+
 
 class Algorithm:
     """
@@ -54,6 +76,34 @@ Algorithm : class - 算法类的顶级父类
     dirName         : str      - 用于指明文件保存的路径。用于把绘图文件保存在此目录下。
                                  当缺省或为None时，默认dirName=''，此时如果绘制图片，图片会被保存在执行文件的所在目录下。
 
+    evaluator       : class <Evaluator> - 评价器对象，用于控制种群目标函数值的计算方式（串行、多线程或多进程）。
+                                 当为None时，直接调用问题类的evaluation()进行串行评价。
+                                 例如：algorithm.evaluator = ea.ProcessEvaluator(8)，表示采用8个进程并行评价。
+
+    deltaEval       : bool     - 表示是否启用增量评价，默认为False。设置为True并且问题类实现了evalDelta()时，
+                                 call_aimFunc()会直接由进化操作前的个体的目标函数值增量地计算新个体的目标函数值，
+                                 此时不经过评价器evaluator（评价器的并行、缓存等设置对这些评价不起作用），详见call_aimFunc()。
+
+    checkpoint      : str      - 断点文件的路径。设置后每隔checkpointTras代把完整的搜索状态（传入terminated()的种群、
+                                 getState()返回的状态以及numpy和random的随机数发生器状态）保存到该文件中，
+                                 之后可以通过resume()或optimize()的resume参数从该断点继续进化，结果与不中断时完全一致。
+                                 序列化在主线程中完成，写文件在后台线程中进行。当为None时，不保存断点。
+                                 只有采用了断点协议（即设置了stateAttrs）的算法类才支持断点，详见getState()。
+                                 注意：异步评价（submit_aimFunc()）中尚未完成的任务不属于断点的一部分。
+
+    checkpointTras  : int      - 每多少代保存一次断点。
+
+    rng             : numpy.random.Generator - 算法类自己的随机数发生器。算法类在Python代码中（而不是内核中）产生的随机数都来自它，
+                                 设置了相同种子的运行得到的随机数序列也相同。可以通过setSeed()设置种子，
+                                 通过spawnRng()派生出相互独立的子随机数发生器，供岛屿、子种群或评价进程使用。
+                                 没有设置种子时，rng在initialization()中才从numpy的全局随机数发生器取一个种子来构建（见initRng()），
+                                 在此之前为None，因此先调用np.random.seed()再执行run()同样可以得到可重复的结果。
+
+    seed            : int      - 通过setSeed()设置的随机数种子，为None时表示rng的种子取自numpy的全局随机数发生器。
+                                 注意：setSeed()只控制rng，内核中的进化算子（选择、重组、变异、染色体的创建等）
+                                 使用的是numpy的全局随机数发生器。因此要得到可重复的结果，仍需在执行run()前调用np.random.seed()
+                                 （optimize()的seed参数会同时设置两者）；在多个线程中并发执行的算法共用这一全局状态，彼此并不独立。
+
 函数:
     __init__()       : 构造函数，定义一些属性，并初始化一些静态参数。
 
@@ -69,14 +119,45 @@ Algorithm : class - 算法类的顶级父类
 
     finishing ()     : 进化完成后调用的函数，具体功能需要在继承类中实现。
 
+    checkpointing()  : 在terminated()的开头被调用，用于保存断点。
+
+    close()          : 释放算法类在进化过程中占用的后台资源（例如后台指标计算器的子进程）。
+                       run()正常结束时会在finishing()中自动释放；run()因异常而中断时，optimize()会调用它，
+                       直接调用run()时可以用“with algorithm:”语句或在finally中调用它。
+
+    resume()         : 读取断点文件，使下一次执行run()时从该断点继续进化。
+
+    restore()        : 在run()中恢复resume()读取的断点，返回断点中保存的种群。
+
+    getState()       : 返回用于保存断点的搜索状态。
+
+    setState()       : 用getState()返回的搜索状态恢复算法类。
+
+    setSeed()        : 设置算法类的随机数发生器rng的种子。
+
+    spawnRng()       : 从rng派生出若干个相互独立的子随机数发生器。
+
+    initRng()        : 没有设置种子时，在initialization()中从numpy的全局随机数发生器重新构建rng。
+
     check()          : 用于检查种群对象的ObjV和CV的数据是否有误。
 
     call_aimFunc()   : 用于调用问题类中的aimFunc()或evalVars()进行计算ObjV和CV(若有约束)。
 
+    submit_aimFunc() : 用于异步地提交评价任务，需与collect_aimFunc()配合使用。
+
+    getAsyncEvaluator(): 返回异步评价所用的评价器。
+
+    collect_aimFunc(): 用于取回任意一个已完成的异步评价任务的结果。
+
+    checkEvaluation(): 用于检查评价得到的ObjV和CV的格式是否合法。
+
     display()        : 用于在进化过程中进行一些输出，需要依赖属性verbose和log属性。
 
 """
 
+    dynamicAttrs = ('currentGen', 'passTime', 'evalsNum', 'log', 'stopMsg', 'rng', 'seedSequence')  # 属于搜索状态的动态属性
+    stateAttrs = None  # 算法类保存进化循环状态的属性，为None表示该算法类还没有采用断点协议，详见getState()
+
     def __init__(self,
                  problem,
                  population,
@@ -113,6 +194,14 @@ Algorithm : class - 算法类的顶级父类
         self.verbose = True if verbose is None else verbose
         self.outFunc = outFunc
         self.dirName = dirName
+        self.evaluator = None
+        self.fallbackEvaluator = None  # 没有设置evaluator时异步评价所用的串行评价器，见getAsyncEvaluator()
+        self.deltaEval = False
+        self.checkpoint = None
+        self.checkpointTras = 10
+        self.resumeState = None  # 由resume()读取的断点状态，在run()中恢复后被重置为None
+        self.checkpointThread = None  # 正在写断点文件的后台线程
+        self.setSeed(None)  # rng在initialization()中才从numpy的全局随机数发生器取种子构建
         # 动态属性
         self.currentGen = None
         self.timeSlot = None
@@ -187,17 +276,257 @@ Algorithm : class - 算法类的顶级父类
                     "Warning: Some elements of CV are Inf, please check the calculation of CV.(CV的部分元素为Inf，请检查CV的计算。)",
                     RuntimeWarning)
 
-    def call_aimFunc(self, pop):
+    def setSeed(self, seed):
+
+        """
+        描述: 设置算法类的随机数发生器rng的种子。
+
+        输入参数:
+            seed : int - 随机数种子。为None时rng被置为None，
+                         之后每次执行run()时都会在initialization()中从numpy的全局随机数发生器取种子构建rng（见initRng()）。
+
+        输出参数:
+            无输出参数。
+
+        """
+
+        self.seed = seed
+        self.seedSequence = np.random.SeedSequence(seed) if seed is not None else None
+        self.rng = np.random.default_rng(self.seedSequence) if seed is not None else None
+
+    def initRng(self):
+
+        """
+        描述: 在initialization()中被调用。没有通过setSeed()设置种子时，从numpy的全局随机数发生器取一个种子重新构建rng，
+             使rng与np.random.seed()设置的全局状态保持一致；设置了种子时rng保持不变。
+
+        """
+
+        if self.seed is None:
+            # 显式指定dtype，否则在默认整数为32位的平台（Windows上的numpy<2）上2 ** 32会越界
+            self.seedSequence = np.random.SeedSequence(int(np.random.randint(2 ** 32, dtype=np.uint64)))
+            self.rng = np.random.default_rng(self.seedSequence)
+
+    def spawnRng(self, n):
+
+        """
+        描述: 从算法类的随机数发生器派生出n个相互独立的子随机数发生器。
+             派生的结果只取决于种子以及之前派生的次数，因此可以用于在岛屿模型或并行评价中得到可重复的结果。
+
+        输入参数:
+            n : int - 需要的子随机数发生器的个数。
+
+        输出参数:
+            rngs : list - 由numpy.random.Generator组成的列表。
+
+        """
+
+        if self.seedSequence is None:  # 在initialization()之前派生时先构建rng
+            self.initRng()
+        return [np.random.default_rng(seedSequence) for seedSequence in self.seedSequence.spawn(n)]
+
+    def resume(self, fileName):
+
+        """
+        描述: 读取断点文件，使下一次执行run()时从该断点继续进化。
+             run()在调用initialization()之后通过restore()恢复断点中保存的搜索状态，并跳过进化前的准备工作。
+
+        输入参数:
+            fileName : str - 断点文件的路径。
+
+        输出参数:
+            无输出参数。
+
+        """
+
+        self.checkStateProtocol()
+        with open(fileName, 'rb') as file:
+            state = pickle.load(file)
+        if not isinstance(state, dict) or state.get('version') != CHECKPOINT_VERSION:
+            raise RuntimeError('error in resume: ' + fileName + ' is not a valid checkpoint. '
+                               '(' + fileName + '不是合法的断点文件。)')
+        if state['name'] != self.name:
+            raise RuntimeError('error in resume: the checkpoint was saved by ' + state['name'] + '. '
+                               '(该断点文件是由其他算法保存的。)')
+        self.resumeState = state
+
+    def restore(self):
+
+        """
+        描述: 恢复由resume()读取的断点，包括算法类的搜索状态以及numpy和random的随机数发生器状态。
+             采用了断点协议的算法类在run()中调用initialization()之后调用该函数，
+             若它返回的种群不为None，则用它代替进化前的准备工作（初始化种群、评价等）得到的种群。
+
+        输入参数:
+            无输入参数。
+
+        输出参数:
+            pop : class <Population> - 断点中保存的种群对象（即保存断点时传入terminated()的种群）。
+                                       若没有需要恢复的断点，则返回None。
+
+        """
+
+        if self.resumeState is None:
+            return None
+        state = self.resumeState
+        self.resumeState = None
+        self.setState(state['state'])
+        np.random.set_state(state['numpy'])
+        random.setstate(state['random'])
+        self.timeSlot = time.time()
+        return state['population']
+
+    def getState(self):
+
+        """
+        描述: 返回用于保存断点的搜索状态，它是由dynamicAttrs和stateAttrs中的属性组成的字典。
+             支持断点的算法类需要把进化循环中除当前种群以外的全部状态（存档、参考点、步长等）保存在算法类的属性中，
+             并把这些属性名设置到类属性stateAttrs中（没有这样的状态时设置为空元组）；
+             需要特殊处理的算法类可以重写getState()和setState()。
+             stateAttrs为None的算法类不支持断点，此时设置checkpoint或调用resume()会报错。
+
+        输入参数:
+            无输入参数。
+
+        输出参数:
+            state : dict - 搜索状态，键为属性名。
+
+        """
+
+        self.checkStateProtocol()
+        return {key: getattr(self, key) for key in self.dynamicAttrs + self.stateAttrs}
+
+    def setState(self, state):
+
+        """
+        描述: 用getState()返回的搜索状态恢复算法类的属性。
+
+        输入参数:
+            state : dict - 搜索状态。
+
+        输出参数:
+            无输出参数。
+
+        """
+
+        self.checkStateProtocol()
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    def checkStateProtocol(self):
+
+        """
+        描述: 检查算法类是否采用了断点协议，没有采用时报错。
+
+        """
+
+        if self.stateAttrs is None:
+            raise RuntimeError('error: ' + self.name + ' does not support checkpoints. '
+                               '(该算法类没有采用断点协议（见Algorithm.getState()），不支持保存断点或从断点恢复。)')
+
+    def checkpointing(self, pop):
+
+        """
+        描述: 用于保存断点，它在terminated()的开头（即每一代开始时）被调用。
+             断点包含传入的种群、getState()返回的搜索状态以及numpy和random的随机数发生器状态。
+
+        输入参数:
+            pop : class <Population> - 传入terminated()的种群对象。
+
+        输出参数:
+            无输出参数。
+
+        """
+
+        if self.checkpoint is None or self.currentGen % self.checkpointTras != 0:
+            return
+        state = {'version': CHECKPOINT_VERSION,
+                 'name': self.name,
+                 'population': pop,
+                 'state': self.getState(),
+                 'numpy': np.random.get_state(),
+                 'random': random.getstate()}
+        data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)  # 在主线程中完成序列化，得到一致的快照
+        self.waitCheckpoint()
+        self.checkpointThread = threading.Thread(target=writeCheckpoint, args=(self.checkpoint, data))
+        self.checkpointThread.start()
+
+    def waitCheckpoint(self):
+
+        """
+        描述: 等待正在后台写入的断点文件写完。
+
+        """
+
+        if self.checkpointThread is not None:
+            self.checkpointThread.join()
+            self.checkpointThread = None
+
+    def close(self):
+
+        """
+        描述: 释放算法类在进化过程中占用的后台资源。
+
+        """
+
+        self.waitCheckpoint()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def call_aimFunc(self, pop, basePop=None, bounds=None):
 
         """
         描述: 调用问题类的aimFunc()或evalVars()完成种群目标函数值和违反约束程度的计算。
+             若设置了评价器evaluator，则由评价器负责调用（例如把种群划分成若干分块并行评价）。
+             若deltaEval为True、传入了basePop并且问题类实现了增量评价函数evalDelta()，
+             则调用问题类的deltaEvaluation()直接由basePop的目标函数值增量地计算，此时不经过评价器。
 
         例如：population为一个种群对象，则调用call_aimFunc(population)即可完成目标函数值的计算。
              之后可通过population.ObjV得到求得的目标函数值，population.CV得到违反约束程度矩阵。
 
+        输入参数:
+            pop     : class <Population> - 种群对象。
+
+            basePop : class <Population> - (可选参数)pop在进化操作之前的种群对象，其个体与pop中的个体一一对应并且已被评价过。
+
+            bounds  : tuple - (可选参数)各个体相对于basePop发生变化的区间，详见问题类的deltaEvaluation()。
+
+        输出参数:
+            无输出参数。
+
+        """
+
+        pop.Phen = pop.decoding()  # 染色体解码
+        if self.problem is None:
+            raise RuntimeError('error: problem has not been initialized. (算法类中的问题对象未被初始化。)')
+        evalsNum = None  # 实际评价的个体数，为None时表示种群的全部个体都被评价了
+        if not self.deltaEval or basePop is None or not self.problem.deltaEvaluation(pop, basePop, bounds):  # 增量评价
+            if self.evaluator is None:
+                self.problem.evaluation(pop)  # 调用问题类的evaluation()
+            else:
+                evalsNum = self.evaluator.do(self.problem, pop)  # 通过评价器调用问题类的evaluation()
+        if evalsNum is None:
+            evalsNum = pop.sizes
+        self.evalsNum = self.evalsNum + evalsNum if self.evalsNum is not None else evalsNum  # 更新评价次数
+        self.checkEvaluation(pop)  # 格式检查
+
+    def submit_aimFunc(self, pop, tag=None):
+
+        """
+        描述: 异步地调用问题类的aimFunc()或evalVars()计算种群的目标函数值和违反约束程度。
+             与call_aimFunc()不同，该函数把评价任务提交给评价器后立即返回，之后需调用collect_aimFunc()取回评价结果。
+             若没有设置评价器，则采用getAsyncEvaluator()中的后备串行评价器，此时评价在提交时即已完成，
+             并且不会修改evaluator，因此call_aimFunc()的行为不受影响。
+
         输入参数:
             pop : class <Population> - 种群对象。
 
+            tag : any - (可选参数)任务标记，会在collect_aimFunc()中原样返回。
+
         输出参数:
             无输出参数。
 
@@ -206,9 +535,56 @@ Algorithm : class - 算法类的顶级父类
         pop.Phen = pop.decoding()  # 染色体解码
         if self.problem is None:
             raise RuntimeError('error: problem has not been initialized. (算法类中的问题对象未被初始化。)')
-        self.problem.evaluation(pop)  # 调用问题类的evaluation()
+        self.getAsyncEvaluator().submit(self.problem, pop.Phen, (pop, tag))
+
+    def getAsyncEvaluator(self):
+
+        """
+        描述: 返回异步评价所用的评价器。设置了evaluator时即为evaluator，
+             否则为第一次调用时创建的后备串行评价器fallbackEvaluator（evaluator本身保持为None）。
+
+        """
+
+        if self.evaluator is not None:
+            return self.evaluator
+        if self.fallbackEvaluator is None:
+            self.fallbackEvaluator = ea.SerialEvaluator()
+        return self.fallbackEvaluator
+
+    def collect_aimFunc(self):
+
+        """
+        描述: 等待任意一个由submit_aimFunc()提交的评价任务完成，把结果写回对应种群对象的ObjV和CV，并更新评价次数。
+
+        输入参数:
+            无输入参数。
+
+        输出参数:
+            pop : class <Population> - 完成了评价的种群对象（即提交时传入的种群对象）。
+
+            tag : any - 提交时传入的任务标记。
+
+        """
+
+        (pop, tag), ObjV, CV = self.getAsyncEvaluator().collect()
+        pop.ObjV, pop.CV = ObjV, CV
         self.evalsNum = self.evalsNum + pop.sizes if self.evalsNum is not None else pop.sizes  # 更新评价次数
-        # 格式检查
+        self.checkEvaluation(pop)  # 格式检查
+        return pop, tag
+
+    def checkEvaluation(self, pop):
+
+        """
+        描述: 检查评价得到的目标函数值矩阵和违反约束程度矩阵的格式是否合法。
+
+        输入参数:
+            pop : class <Population> - 种群对象。
+
+        输出参数:
+            无输出参数。
+
+        """
+
         if not isinstance(pop.ObjV, np.ndarray) or pop.ObjV.ndim != 2 or pop.ObjV.shape[0] != pop.sizes or \
                 pop.ObjV.shape[1] != self.problem.M:
             raise RuntimeError('error: ObjV is illegal. (目标函数值矩阵ObjV的数据格式不合法，请检查目标函数的计算。)')
@@ -274,10 +650,25 @@ class MoeaAlgorithm(Algorithm):  # 多目标优化算法类的父类
                                2表示实时绘制目标空间动态图；
                                3表示实时绘制决策空间动态图。
 
+        indicatorTras  : int  - 每多少代计算一次GD、IGD、HV和Spacing指标（只在记录日志的代中计算），
+                                未计算指标的日志记录中这些指标记为None。
+                                当为None时，每次记录日志都计算；设置为0表示在进化过程中不计算这些指标。
+                                无论如何设置，最后一代的日志都会采用ReferObjV完整地计算这些指标。
+
+        tinyRefer      : bool - 表示在进化过程中是否用TinyReferObjV代替ReferObjV计算指标，以减少记录日志的耗时。
+
+        asyncIndicators : bool - 表示是否把各代的目标函数值快照交给后台子进程（见IndicatorWorker）异步地计算指标，
+                                 此时主循环不等待指标的计算，日志中的指标先记为None，计算完成后再按代数写回log，
+                                 并在finishing()中等待全部计算完成，因此最终得到的log是完整的。
+
         draw()         : 绘图函数。
 
+        calIndicators(pop) : 计算种群中非支配个体的GD、IGD、HV和Spacing指标，可以在outFunc中调用以按需计算。
+
     """
 
+    dynamicAttrs = Algorithm.dynamicAttrs + ('indicatorsFull',)
+
     def __init__(self,
                  problem,
                  population,
@@ -300,8 +691,25 @@ class MoeaAlgorithm(Algorithm):  # 多目标优化算法类的父类
 
         super().__init__(problem, population, MAXGEN, MAXTIME, MAXEVALS, MAXSIZE, logTras, verbose, outFunc, dirName)  # 先调用父类构造函数
         self.drawing = 1 if drawing is None else drawing
+        self.indicatorTras = None
+        self.tinyRefer = False
+        self.asyncIndicators = False
         # 以下为用户不需要设置的属性
         self.plotter = None  # 存储绘图对象
+        self.indicatorWorker = None  # 后台指标计算器，在第一次异步地计算指标时才创建
+        self.indicatorsFull = False  # 最后一条日志记录的指标是否采用ReferObjV完整地计算
+
+    def close(self):
+
+        """
+        描述: 释放算法类在进化过程中占用的后台资源，不等待后台指标计算器中尚未完成的计算任务，直接终止其子进程。
+
+        """
+
+        if self.indicatorWorker is not None:
+            self.indicatorWorker.close(wait=False)
+            self.indicatorWorker = None
+        super().close()
 
     def __str__(self):
         info = {}
@@ -327,6 +735,13 @@ class MoeaAlgorithm(Algorithm):  # 多目标优化算法类的父类
         self.currentGen = 0  # 初始为第0代
         self.evalsNum = 0  # 初始化评价次数为0
         self.log = {'gen': [], 'eval': []} if self.logTras != 0 else None  # 初始化log
+        self.indicatorsFull = False
+        if self.indicatorWorker is not None:  # 关闭上一次运行（例如因异常而中断）残留的后台指标计算器
+            self.indicatorWorker.close(wait=False)
+            self.indicatorWorker = None
+        if self.checkpoint is not None or self.resumeState is not None:
+            self.checkStateProtocol()  # 未采用断点协议的算法类不能保存断点或从断点恢复
+        self.initRng()  # 初始化随机数发生器
         self.timeSlot = time.time()  # 开始计时
 
     def logging(self, pop):
@@ -352,19 +767,58 @@ class MoeaAlgorithm(Algorithm):  # 多目标优化算法类的父类
             self.log['spacing'] = []
         self.log['gen'].append(self.currentGen)
         self.log['eval'].append(self.evalsNum)  # 记录评价次数
-        [levels, _] = ea.ndsortDED(pop.ObjV, needLevel=1, CV=pop.CV, maxormins=self.problem.maxormins)  # 非支配分层
-        NDSet = pop[np.where(levels == 1)[0]]  # 只保留种群中的非支配个体，形成一个非支配种群
-        if self.problem.ReferObjV is not None:
-            self.log['gd'].append(ea.indicator.GD(NDSet.ObjV, self.problem.ReferObjV))  # 计算GD指标
-            self.log['igd'].append(ea.indicator.IGD(NDSet.ObjV, self.problem.ReferObjV))  # 计算IGD指标
-            self.log['hv'].append(ea.indicator.HV(NDSet.ObjV, self.problem.ReferObjV))  # 计算HV指标
+        # 按照indicatorTras决定本代是否计算指标
+        if self.indicatorTras is None or (self.indicatorTras != 0 and self.currentGen % self.indicatorTras == 0):
+            if self.asyncIndicators:  # 交给后台子进程计算，计算结果之后再写回log
+                if self.indicatorWorker is None:
+                    self.indicatorWorker = ea.IndicatorWorker(self.problem)
+                self.indicatorWorker.submit(self.currentGen, pop.ObjV, pop.CV, self.tinyRefer)
+                indicators = {}
+            else:
+                indicators = self.calIndicators(pop, self.tinyRefer)
+            self.indicatorsFull = not self.tinyRefer
         else:
-            self.log['gd'].append(None)
-            self.log['igd'].append(None)
-            self.log['hv'].append(ea.indicator.HV(NDSet.ObjV))  # 计算HV指标
-        self.log['spacing'].append(ea.indicator.Spacing(NDSet.ObjV))  # 计算Spacing指标
+            indicators = {}
+            self.indicatorsFull = False
+        for key in ['gd', 'igd', 'hv', 'spacing']:
+            self.log[key].append(indicators.get(key))
+        if self.indicatorWorker is not None:
+            self.fillIndicators(self.indicatorWorker.collect())  # 写回后台子进程已完成计算的指标
         self.timeSlot = time.time()  # 更新时间戳
 
+    def fillIndicators(self, results):
+
+        """
+        描述:
+            把按代数存储的指标计算结果（即IndicatorWorker.collect()的返回值）写回日志中对应的记录。
+
+        """
+
+        gens = self.log['gen']
+        for gen, indicators in results.items():
+            idx = len(gens) - 1 - gens[::-1].index(gen)  # 该代最后一条日志记录的位置
+            for key in indicators:
+                self.log[key][idx] = indicators[key]
+
+    def calIndicators(self, pop, tiny=False):
+
+        """
+        描述:
+            计算种群中非支配个体的GD、IGD、HV和Spacing指标。当问题没有目标函数参考值时，GD和IGD为None。
+
+        输入参数:
+            pop  : class <Population> - 种群对象。
+
+            tiny : bool - 表示是否用TinyReferObjV代替ReferObjV计算指标。
+
+        输出参数:
+            indicators : dict - 以'gd'、'igd'、'hv'和'spacing'为键的指标字典。
+
+        """
+
+        ReferObjV = self.problem.TinyReferObjV if tiny else self.problem.ReferObjV
+        return ea.IndicatorWorker.calIndicators(pop.ObjV, pop.CV, self.problem.maxormins, ReferObjV)
+
     def draw(self, pop, EndFlag=False):
 
         """
@@ -463,6 +917,7 @@ class MoeaAlgorithm(Algorithm):  # 多目标优化算法类的父类
             
         """
 
+        self.checkpointing(pop)  # 保存断点
         self.check(pop)  # 检查种群对象的关键属性是否有误
         self.stat(pop)  # 进行统计分析
         self.passTime += time.time() - self.timeSlot  # 更新耗时
@@ -516,15 +971,35 @@ class MoeaAlgorithm(Algorithm):  # 多目标优化算法类的父类
             NDSet = NDSet[np.unique(NDSet.ObjV,return_index=True,axis=0)[1]]
         else:
             NDSet = globalNDSet
+        updated = False  # 最后一条日志记录是否有更新
         if self.logTras != 0 and NDSet.sizes != 0 and (
-                len(self.log['gen']) == 0 or self.log['gen'][-1] != self.currentGen):  # 补充记录日志和输出
+                len(self.log['gen']) == 0 or self.log['gen'][-1] != self.currentGen):  # 补充记录日志
             self.logging(NDSet)
-            if self.verbose:
+            updated = True
+        if self.indicatorWorker is not None:  # 等待后台子进程完成全部计算，把结果写回log后关闭子进程
+            self.passTime += time.time() - self.timeSlot  # 更新用时记录，不计算等待的耗时
+            results = self.indicatorWorker.collect(wait=True)
+            self.fillIndicators(results)
+            self.indicatorWorker.close()
+            self.indicatorWorker = None
+            updated = updated or self.log['gen'][-1] in results
+            self.timeSlot = time.time()  # 更新时间戳
+        if self.logTras != 0 and NDSet.sizes != 0:
+            if not self.indicatorsFull:  # 最后一代的指标没有完整地计算，补充计算
+                self.passTime += time.time() - self.timeSlot  # 更新用时记录，不计算指标的耗时
+                indicators = self.calIndicators(NDSet)
+                for key in indicators:
+                    self.log[key][-1] = indicators[key]
+                self.indicatorsFull = True
+                updated = True
+                self.timeSlot = time.time()  # 更新时间戳
+            if updated and self.verbose:
                 self.display()
         self.passTime += time.time() - self.timeSlot  # 更新用时记录，因为已经要结束，因此不用再更新时间戳
         self.draw(NDSet, EndFlag=True)  # 显示最终结果图
         if self.plotter is not None:
             self.plotter.show()
+        self.waitCheckpoint()  # 确保最后一个断点已写入文件
         # 返回帕累托最优个体以及最后一代种群
         return [NDSet, pop]
 
@@ -562,6 +1037,8 @@ class SoeaAlgorithm(Algorithm):  # 单目标优化算法类父类
         
     """
 
+    dynamicAttrs = Algorithm.dynamicAttrs + ('BestIndi', 'trace', 'trappedCount')
+
     def __init__(self,
                  problem,
                  population,
@@ -622,6 +1099,9 @@ class SoeaAlgorithm(Algorithm):  # 单目标优化算法类父类
         self.BestIndi = ea.Population(None, None, 0)  # 初始化BestIndi为空的种群对象
         self.log = {'gen': [], 'eval': []} if self.logTras != 0 else None  # 初始化log
         self.trace = {'f_best': [], 'f_avg': []}  # 重置trace
+        if self.checkpoint is not None or self.resumeState is not None:
+            self.checkStateProtocol()  # 未采用断点协议的算法类不能保存断点或从断点恢复
+        self.initRng()  # 初始化随机数发生器
         # 开始计时
         self.timeSlot = time.time()
 
@@ -771,6 +1251,7 @@ class SoeaAlgorithm(Algorithm):  # 单目标优化算法类父类
 
         """
 
+        self.checkpointing(pop)  # 保存断点
         self.check(pop)  # 检查种群对象的关键属性是否有误
         self.stat(pop)  # 分析记录当代种群的数据
         self.passTime += time.time() - self.timeSlot  # 更新耗时
@@ -830,5 +1311,6 @@ class SoeaAlgorithm(Algorithm):  # 单目标优化算法类父类
         self.draw(pop, EndFlag=True)  # 显示最终结果图
         if self.plotter:
             self.plotter.show()
+        self.waitCheckpoint()  # 确保最后一个断点已写入文件
         # 返回最优个体以及最后一代种群
         return [self.BestIndi, pop]
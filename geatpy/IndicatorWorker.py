@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import multiprocessing as mp
+
+import numpy as np
+import geatpy as ea
+
+workerProblem = None  # 子进程中常驻的问题类对象
+
+
+def initWorker(problem):
+
+    """
+    描述:
+        子进程启动时调用一次，保存问题类对象，之后的计算任务只需传入目标函数值的快照。
+        目标函数参考值在子进程第一次用到时才通过问题类对象读取或计算，不会阻塞主进程。
+
+    """
+
+    global workerProblem
+    workerProblem = problem
+
+
+def workerIndicators(ObjV, CV, tiny):
+
+    """
+    描述:
+        在子进程中计算一个目标函数值快照的各项指标。
+
+    """
+
+    ReferObjV = workerProblem.TinyReferObjV if tiny else workerProblem.ReferObjV
+    return IndicatorWorker.calIndicators(ObjV, CV, workerProblem.maxormins, ReferObjV)
+
+
+class IndicatorWorker:
+    """
+    IndicatorWorker - class : 后台指标计算器，在一个常驻的子进程中异步地计算种群目标函数值快照的GD、IGD、HV和Spacing指标，
+                              使进化算法的主循环不必等待指标的计算，计算结果之后再按代数取回。
+                              问题类对象只在子进程启动时传入一次，之后每个计算任务只传递目标函数值矩阵和违反约束程度矩阵，
+                              非支配排序也在子进程中进行。
+                              目标函数参考值在子进程第一次计算指标时才读取或计算（主进程中已经得到的会随问题类对象一起传入），
+                              因此创建后台指标计算器不会使主进程等待参考值的计算，也不会打断prefetchReferObjV()的后台预取。
+
+    属性:
+        pending : dict - 尚未取回的计算任务，键为代数，值为对应的multiprocessing.pool.AsyncResult对象。
+
+    注意:
+        与multiprocessing的要求一样，使用后台指标计算器时，程序必须以“if __name__ == '__main__':”作为入口。
+        当子进程不是通过fork启动时，问题类对象会被pickle后传给子进程，因此它必须是可以被pickle的，详见ProcessEvaluator。
+
+    """
+
+    def __init__(self, problem):
+        self.pool = mp.Pool(1, initWorker, (problem,))
+        self.pending = {}
+
+    @staticmethod
+    def calIndicators(ObjV, CV, maxormins, ReferObjV=None):
+
+        """
+        描述:
+            计算目标函数值矩阵中非支配个体的GD、IGD、HV和Spacing指标。当ReferObjV为None时，GD和IGD为None。
+
+        输出参数:
+            indicators : dict - 以'gd'、'igd'、'hv'和'spacing'为键的指标字典。
+
+        """
+
+        [levels, _] = ea.ndsortDED(ObjV, needLevel=1, CV=CV, maxormins=maxormins)  # 非支配分层
+        NDObjV = ObjV[np.where(levels == 1)[0]]  # 只保留非支配个体的目标函数值
+        indicators = {'gd': None, 'igd': None}
+        if ReferObjV is not None:
+            indicators['gd'] = ea.indicator.GD(NDObjV, ReferObjV)  # 计算GD指标
+            indicators['igd'] = ea.indicator.IGD(NDObjV, ReferObjV)  # 计算IGD指标
+            indicators['hv'] = ea.indicator.HV(NDObjV, ReferObjV)  # 计算HV指标
+        else:
+            indicators['hv'] = ea.indicator.HV(NDObjV)  # 计算HV指标
+        indicators['spacing'] = ea.indicator.Spacing(NDObjV)  # 计算Spacing指标
+        return indicators
+
+    def submit(self, gen, ObjV, CV=None, tiny=False):
+
+        """
+        描述:
+            异步地提交第gen代的目标函数值快照，立即返回。tiny表示是否用TinyReferObjV代替ReferObjV计算指标。
+
+        """
+
+        self.pending[gen] = self.pool.apply_async(workerIndicators,
+                                                  (np.array(ObjV), np.array(CV) if CV is not None else None, tiny))
+
+    def collect(self, wait=False):
+
+        """
+        描述:
+            取回已完成的计算结果。wait为True时等待全部任务完成。
+
+        输出参数:
+            results : dict - 键为代数，值为该代的指标字典。
+
+        """
+
+        results = {}
+        for gen in list(self.pending.keys()):
+            if wait or self.pending[gen].ready():
+                results[gen] = self.pending.pop(gen).get()
+        return results
+
+    def close(self, wait=True):
+
+        """
+        描述:
+            关闭子进程。wait为False时不等待尚未完成的计算任务，直接终止子进程（例如进化因异常而中断时）。
+
+        """
+
+        if wait:
+            self.pool.close()
+        else:
+            self.pool.terminate()
+        self.pool.join()
+        self.pending = {}
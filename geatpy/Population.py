@@ -1,9 +1,31 @@
 # -*- coding: utf-8 -*-
+import json
 import os
 import numpy as np
 import geatpy as ea
 
 
+def typedArray(name):
+
+    """
+    描述:
+        生成种群中按个体存储的矩阵所对应的属性：赋值时按照种群的dtypes自动转换数据类型。
+        矩阵本身仍存放在实例的__dict__中同名的键下，因此不影响种群对象的复制、序列化等操作。
+
+    """
+
+    def getter(self):
+        return self.__dict__.get(name)
+
+    def setter(self, value):
+        dtype = self.__dict__['dtypes'].get(name) if self.__dict__.get('dtypes') else None
+        if dtype is not None and isinstance(value, np.ndarray) and value.dtype != dtype:
+            value = value.astype(dtype)
+        self.__dict__[name] = value
+
+    return property(getter, setter)
+
+
 class Population:
     """
 Population : class - 种群类
@@ -46,13 +68,34 @@ Population : class - 种群类
                        注意：当没有设置约束条件时，CV设置为None。
     
     Phen     : array - 种群表现型矩阵（即种群各染色体解码后所代表的决策变量所组成的矩阵）。
+                       默认是可以原地修改的独立矩阵；对于'RI'和'P'编码，设置了phenView为True时它是Chrom的只读视图。
+    
+    decodedChrom : array - 'BG'编码的种群上一次解码时的染色体矩阵，即Phen所对应的染色体矩阵，用于只对发生了变化的个体进行解码。
+                       它随种群的切片、合并等操作一起维护，为None时表示下一次需要对所有个体进行解码。
+    
+    dtypes   : dict  - 各矩阵的数据类型，键为矩阵名（'Chrom', 'ObjV', 'FitnV', 'CV'或'Phen'），值为numpy的数据类型，
+                       例如{'Chrom': np.int16, 'ObjV': np.float32}表示用int16存储排列编码的染色体、用float32存储目标函数值。
+                       设置后，无论这些矩阵在何处被赋值，都会被自动转换成对应的数据类型，
+                       从而在个体数或基因数很多时减少内存占用并提高缓存命中率；没有设置的矩阵保持被赋值时的数据类型。
+                       注意：需要保证所选的数据类型能表示矩阵中的所有值（例如整数编码的取值范围），转换时不做溢出检查。
+
+    phenView : bool  - 表示'RI'和'P'编码的种群解码时是否直接把Chrom的只读视图作为Phen，从而省去一次复制，默认为False。
+                       设置为True时，目标函数不能原地修改Vars或pop.Phen（例如原地修复、取整），否则会报错。
+                       该设置会随种群的复制、切片和合并传递给得到的新种群。
     
 函数:
     详见源码。
 
 """
 
-    def __init__(self, Encoding, Field=None, NIND=None, Chrom=None, ObjV=None, FitnV=None, CV=None, Phen=None):
+    Chrom = typedArray('Chrom')
+    ObjV = typedArray('ObjV')
+    FitnV = typedArray('FitnV')
+    CV = typedArray('CV')
+    Phen = typedArray('Phen')
+
+    def __init__(self, Encoding, Field=None, NIND=None, Chrom=None, ObjV=None, FitnV=None, CV=None, Phen=None,
+                 dtypes=None, phenView=False):
 
         """
         描述: 种群类的构造函数，用于实例化种群对象，例如：
@@ -67,9 +110,17 @@ Population : class - 种群类
                 可以利用ea.Population(Encoding, Field, 0)来创建一个“空种群”,即不含任何个体的种群对象。
              特殊用法2：
                 直接用ea.Population(Encoding)构建一个只包含编码信息的空种群。
+             特殊用法3：
+                ea.Population(Encoding, Field, NIND, dtypes={'Chrom': np.int32, 'ObjV': np.float32})
+                构建一个指定了各矩阵数据类型的种群，详见dtypes属性。
+             特殊用法4：
+                ea.Population(Encoding, Field, NIND, phenView=True)
+                构建一个解码时不复制染色体矩阵的种群，详见phenView属性。
              
         """
 
+        self.dtypes = dict(dtypes) if dtypes is not None else {}
+        self.phenView = phenView
         if NIND is None:
             NIND = 0
         if isinstance(NIND, int) and NIND >= 0:
@@ -96,6 +147,12 @@ Population : class - 种群类
         self.FitnV = FitnV.copy() if FitnV is not None else None
         self.CV = CV.copy() if CV is not None else None
         self.Phen = Phen.copy() if Phen is not None else None
+        self.capacity = None  # 预分配存储模式下的容量，为None时表示没有开启预分配存储模式
+        self.buffers = None  # 预分配存储模式下的存储空间，键为矩阵名，值为两块交替使用的预分配矩阵组成的列表
+        self.bufferIdx = 0  # 当前使用的是哪一块预分配矩阵
+        self.bufferDir = None  # 预分配存储所映射到的文件所在的目录，为None时预分配存储位于内存中
+        self.bufferVersion = 0  # 已分配的映射文件的批次数，用于为映射文件命名
+        self.decodedChrom = None
 
     def initChrom(self, NIND=None):
 
@@ -115,6 +172,7 @@ Population : class - 种群类
             self.sizes = NIND  # 重新设置种群规模
         self.Chrom = ea.crtpc(self.Encoding, self.sizes, self.Field)  # 生成染色体矩阵
         self.Lind = self.Chrom.shape[1]  # 计算染色体的长度
+        self.decodedChrom = None
         self.ObjV = None
         self.FitnV = None
         self.CV = None
@@ -122,19 +180,35 @@ Population : class - 种群类
     def decoding(self):
 
         """
-        描述: 种群染色体解码。
+        描述: 种群染色体解码，返回解码得到的表现型矩阵，同时把它保存到种群的Phen属性中。
+             对于'RI'和'P'编码，染色体本身就是决策变量，此时返回Chrom的副本；若phenView为True，则直接返回Chrom的只读视图，不进行复制；
+             对于'BG'编码，只对染色体与decodedChrom（即上一次解码时的染色体）不同的个体调用bs2ri进行解码，
+             其余个体沿用原有的Phen，因此当大部分个体自上一次解码以来没有变化时可以省去大部分解码开销。
         
         """
 
         if self.Encoding == 'BG':  # 此时Field实际上为FieldD
-            Phen = ea.bs2ri(self.Chrom, self.Field)  # 把二进制/格雷码转化为实整数
+            if self.decodedChrom is not None and self.Phen is not None and \
+                    self.decodedChrom.shape == self.Chrom.shape and self.Phen.shape[0] == self.sizes:
+                dirty = np.any(self.Chrom != self.decodedChrom, axis=1)  # 自上一次解码以来发生了变化的个体
+                Phen = self.Phen.copy()
+                if np.any(dirty):
+                    Phen[dirty] = ea.bs2ri(self.Chrom[dirty], self.Field)  # 把二进制/格雷码转化为实整数
+            else:
+                Phen = ea.bs2ri(self.Chrom, self.Field)  # 把二进制/格雷码转化为实整数
+            self.decodedChrom = self.Chrom.copy()
         elif self.Encoding == 'RI' or self.Encoding == 'P':
-            Phen = self.Chrom.copy()
+            if self.phenView:
+                Phen = self.Chrom.view()
+                Phen.flags.writeable = False
+            else:
+                Phen = self.Chrom.copy()
         else:
             raise RuntimeError(
                 'error in Population.decoding: Encoding must be ''BG'' or ''RI'' or ''P''. ('
                 '编码设置有误，解码时Encoding必须为''BG'', ''RI'' 或 ''P''。)')
-        return Phen
+        self.Phen = Phen
+        return self.Phen
 
     def copy(self):
 
@@ -145,14 +219,18 @@ Population : class - 种群类
             
         """
 
-        return Population(self.Encoding,
-                          self.Field,
-                          self.sizes,
-                          self.Chrom,
-                          self.ObjV,
-                          self.FitnV,
-                          self.CV,
-                          self.Phen)
+        pop = Population(self.Encoding,
+                         self.Field,
+                         self.sizes,
+                         self.Chrom,
+                         self.ObjV,
+                         self.FitnV,
+                         self.CV,
+                         self.Phen,
+                         self.dtypes,
+                         self.phenView)
+        pop.decodedChrom = self.decodedChrom.copy() if self.decodedChrom is not None else None
+        return pop
 
     def __getitem__(self, index):
 
@@ -164,52 +242,98 @@ Population : class - 种群类
 
         注意: index必须为一个slice或者为一个Numpy ndarray类型的一维数组或者为一个list类型的列表或者为一个整数，
              该函数不对传入的index参数的合法性进行更详细的检查。
+             得到的新种群不与原种群共享内存，各矩阵只被复制一次（若需要共享内存的切片，请使用view()）。
              
         """
 
-        # 计算切片后的长度以及对index进行格式处理
+        index_array, NIND = self.parseIndex(index)
+        return self.subset(index_array, NIND, False)
+
+    def view(self, index):
+
+        """
+        描述: 种群的视图切片。当index为slice或者整数时，返回的新种群与原种群共享Chrom、ObjV、FitnV、CV和Phen的内存，
+             不发生任何复制，因此对视图中这些矩阵的原地修改（例如view.ObjV[:] = 0）会同步到原种群中，
+             而对视图的属性重新赋值（例如view.ObjV = ObjV）则不会影响原种群。
+             当index为列表或数组时，Numpy无法构造视图，此时与pop[index]一样返回一个副本。
+
+        用法: 假设pop是一个种群对象，那么pop1 = pop.view(slice(0, 10))即可得到由pop的前10个个体组成的视图种群。
+
+        """
+
+        if not isinstance(index, (slice, np.ndarray, list)) and 'int' in str(type(index)):
+            index = index + self.sizes if index < 0 else index
+            index = slice(index, index + 1)  # 把整数转换为slice，从而可以得到视图
+        index_array, NIND = self.parseIndex(index)
+        return self.subset(index_array, NIND, isinstance(index_array, slice))
+
+    def parseIndex(self, index):
+
+        """
+        描述: 对传入__getitem__()或view()的index进行格式检查和处理，返回处理后的index以及它所选出的个体数。
+
+        """
+
         if not isinstance(index, (slice, np.ndarray, list)):
             if 'int' not in str(type(index)):
                 raise RuntimeError(
                     'error in Population: index must be an integer, a 1-D list, or a 1-D array. ('
                     'index必须是一个整数，一维的列表或者一维的向量。)')
         if isinstance(index, slice):
-            NIND = (index.stop - (index.start if index.start is not None else 0)) // (
-                index.step if index.step is not None else 1)
-            index_array = index
+            return index, len(range(self.sizes)[index])
+        index_array = np.array(index).reshape(-1)
+        if index_array.dtype == bool:
+            NIND = int(np.sum(index_array))
         else:
-            index_array = np.array(index).reshape(-1)
-            if index_array.dtype == bool:
-                NIND = int(np.sum(index_array))
-            else:
-                NIND = len(index_array)
-            if len(index_array) == 0:
-                index_array = []
-        if self.Encoding is None:
-            NewChrom = None
-        else:
-            if self.Chrom is None:
-                raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
-            NewChrom = self.Chrom[index_array]
-        return Population(self.Encoding,
-                          self.Field,
-                          NIND,
-                          NewChrom,
-                          self.ObjV[index_array] if self.ObjV is not None else None,
-                          self.FitnV[index_array] if self.FitnV is not None else None,
-                          self.CV[index_array] if self.CV is not None else None,
-                          self.Phen[index_array] if self.Phen is not None else None)
+            NIND = len(index_array)
+        if len(index_array) == 0:
+            index_array = []
+        return index_array, NIND
+
+    @staticmethod
+    def takeRows(arr, index_array, share):
 
-    def shuffle(self):
+        """
+        描述: 从矩阵arr中取出index_array对应的行。
+             基本切片得到的是视图，当share为False时需要复制一次；花式索引得到的已经是副本，不再复制。
+
+        """
+
+        if arr is None:
+            return None
+        rows = arr[index_array]
+        if not share and isinstance(index_array, slice):
+            rows = rows.copy()
+        return rows
+
+    def subset(self, index_array, NIND, share):
+
+        """
+        描述: 用parseIndex()处理后的index_array选出个体组成新的种群，share表示是否与原种群共享内存。
+
+        """
+
+        if self.Encoding is not None and self.Chrom is None:
+            raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
+        pop = Population(self.Encoding, self.Field, NIND, dtypes=self.dtypes, phenView=self.phenView)
+        pop.setArrays({name: self.takeRows(arr, index_array, share) for name, arr in self.getArrays().items()})
+        return pop
+
+    def shuffle(self, rng=None):
 
         """
         shuffle : function - 打乱种群个体的个体顺序
         用法: 假设pop是一个种群矩阵，那么，pop.shuffle()即可完成对pop种群个体顺序的打乱。
+             可以传入numpy.random.Generator对象rng（例如算法类的rng属性）来指定所用的随机数发生器，
+             缺省时使用numpy的全局随机数发生器。
         
         """
 
         shuff = np.arange(self.sizes)
-        np.random.shuffle(shuff)  # 打乱顺序
+        if rng is None:
+            np.random.shuffle(shuff)  # 打乱顺序
+        else:
+            rng.shuffle(shuff)
         if self.Encoding is None:
             self.Chrom = None
         else:
@@ -220,6 +344,7 @@ Population : class - 种群类
         self.FitnV = self.FitnV[shuff] if self.FitnV is not None else None
         self.CV = self.CV[shuff, :] if self.CV is not None else None
         self.Phen = self.Phen[shuff, :] if self.Phen is not None else None
+        self.decodedChrom = self.decodedChrom[shuff, :] if self.decodedChrom is not None else None
 
     def __setitem__(self, index, pop):  # 种群个体赋值（种群个体替换）
 
@@ -270,7 +395,14 @@ Population : class - 种群类
         if self.Phen is not None:
             if pop.Phen is None:
                 raise RuntimeError('error in Population: Phen disagree. (两者的表现型矩阵必须要么同时为None要么同时不为None。)')
+            if not self.Phen.flags.writeable:  # Phen是Chrom的只读视图，写入前先复制
+                self.Phen = self.Phen.copy()
             self.Phen[index_array] = pop.Phen
+        if self.decodedChrom is not None:
+            if pop.decodedChrom is None:
+                self.decodedChrom = None  # 无法得知被替换的个体的解码状态，下一次解码时对所有个体进行解码
+            else:
+                self.decodedChrom[index_array] = pop.decodedChrom
         self.sizes = self.Phen.shape[0]  # 更新种群规模
 
     def __add__(self, pop):
@@ -287,9 +419,229 @@ Population : class - 种群类
             
         """
 
-        if self.Encoding is None:
-            NewChrom = None
-        else:
+        self.checkMerge(pop)
+        NIND = self.sizes + pop.sizes  # 得到合并种群的个体数
+        others = pop.getArrays()
+        newPop = Population(self.Encoding, self.Field, NIND, dtypes=self.dtypes, phenView=self.phenView)
+        newPop.setArrays({name: np.vstack([arr, others[name]]) if arr is not None and others[name] is not None
+                          else None for name, arr in self.getArrays().items()})
+        return newPop
+
+    def __iadd__(self, pop):
+
+        """
+        描述: 种群个体原地合并。
+
+        用法: pop1 += pop2。
+             若pop1开启了预分配存储模式（详见reserve()），则pop2的个体会被直接写入pop1的预分配空间，不再分配新的内存，
+             此时之前取得的pop1的矩阵视图可能失效（详见reserve()）；否则与pop1 = pop1 + pop2等价。
+
+        """
+
+        if self.buffers is None:
+            return self + pop
+        self.checkMerge(pop)
+        NIND = self.sizes + pop.sizes
+        if NIND > self.capacity:
+            self.capacity = max(NIND, 2 * self.capacity)  # 容量不足时扩大为原来的两倍
+        self.syncBuffers()
+        others = pop.getArrays()
+        arrays = {}
+        for name, arr in self.getArrays().items():
+            if arr is None or others[name] is None:
+                arrays[name] = None
+                continue
+            buffer = self.buffers[name][self.bufferIdx]
+            buffer[self.sizes:NIND] = others[name]
+            arrays[name] = buffer[:NIND]
+        self.sizes = NIND
+        self.setArrays(arrays)
+        self.writeBufferState()
+        return self
+
+    def reserve(self, capacity, dirName=None):
+
+        """
+        描述: 为种群预分配能容纳capacity个个体的存储空间，开启预分配存储模式。
+             此后用pop += offspring合并种群时，offspring的个体被直接写入预分配空间；
+             用pop.keep(index)选择个体时，被选中的个体被写入另一块同样大小的预分配空间（两块空间交替使用）。
+             因此在精英保留策略的“父子合并-选择”过程中不再反复分配内存，例如可以设置capacity为种群规模的2倍。
+             在预分配存储模式下，Chrom、ObjV、FitnV、CV和Phen是预分配空间的前sizes行的视图；
+             若这些属性被重新赋值（例如pop.FitnV = ea.scaling(...)），下一次合并或选择时会自动把新值写回预分配空间。
+             当个体数超过capacity时，预分配空间会自动扩大。
+             注意：由于两块预分配空间交替使用，在pop += offspring或pop.keep(index)之前取得的这些矩阵（或它们的视图，
+             例如pop.view(...)得到的种群）在合并或选择之后会被覆盖而失效，需要保留时应先复制（例如pop.copy()或pop[index]）。
+             若设置了dirName（或者事先设置了种群的bufferDir属性），预分配空间将是映射到该目录下的.npy文件的numpy.memmap，
+             从而支持超出内存容量的大规模种群或超高维染色体（此时合并与选择都直接在映射文件上进行）；
+             同时该目录下的state.json记录着当前个体数以及各矩阵当前所在的文件，
+             其他进程可以在运行过程中通过ea.Population.loadMapped(dirName)只读地查看当前种群。
+             映射文件在运行结束后不会被自动删除。
+
+        输入参数:
+            capacity : int - 预分配的个体数。
+
+            dirName  : str - (可选参数)映射文件所在的目录，不存在时会自动创建。
+
+        输出参数:
+            无输出参数。
+
+        """
+
+        if dirName is not None:
+            self.bufferDir = dirName
+        if self.bufferDir is not None:
+            os.makedirs(self.bufferDir, exist_ok=True)
+        self.capacity = max(capacity, self.sizes, 1)
+        self.buffers = {}
+        self.bufferIdx = 0
+        self.syncBuffers()
+
+    def syncBuffers(self):
+
+        """
+        描述: 确保各矩阵都存放在当前的预分配空间中：按需（重新）分配预分配空间，并写回被重新赋值过的矩阵。
+
+        """
+
+        arrays = self.getArrays()
+        for name, arr in arrays.items():
+            if arr is None:
+                self.removeBufferFiles(self.buffers.pop(name, None))
+                continue
+            buffers = oldBuffers = self.buffers.get(name)
+            if buffers is None or buffers[0].shape[0] < self.capacity or buffers[0].shape[1:] != arr.shape[1:] or \
+                    buffers[0].dtype != arr.dtype or \
+                    self.bufferDir is not None and getattr(buffers[0], 'filename', None) is None:  # 例如从断点恢复后
+                buffers = self.allocateBuffers(name, (self.capacity,) + arr.shape[1:], arr.dtype)
+                self.buffers[name] = buffers
+            buffer = buffers[self.bufferIdx]
+            if not self.inBuffer(arr, buffer, self.sizes):  # 矩阵不是预分配空间的前sizes行，需要写回
+                buffer[:self.sizes] = arr
+            arrays[name] = buffer[:self.sizes]
+            if buffers is not oldBuffers:
+                self.removeBufferFiles(oldBuffers)
+        self.setArrays(arrays)
+        self.writeBufferState()
+
+    @staticmethod
+    def inBuffer(arr, buffer, NIND):
+
+        """
+        描述: 判断arr是否恰好就是预分配矩阵buffer的前NIND行，即与buffer[:NIND]有相同的起始地址、形状、步长和数据类型，
+             并且确实位于buffer的内存中。被截断或转置的视图、其他数组等都不满足该条件。
+
+        """
+
+        return arr.shape == (NIND,) + buffer.shape[1:] and arr.strides == buffer.strides and \
+            arr.dtype == buffer.dtype and \
+            arr.__array_interface__['data'][0] == buffer.__array_interface__['data'][0] and \
+            np.shares_memory(arr, buffer)
+
+    def allocateBuffers(self, name, shape, dtype):
+
+        """
+        描述: 为名为name的矩阵分配两块交替使用的预分配矩阵，设置了bufferDir时它们是映射到文件的numpy.memmap。
+
+        """
+
+        if self.bufferDir is None:
+            return [np.empty(shape, dtype=dtype) for _ in range(2)]
+        self.bufferVersion += 1  # 每次分配都使用新的文件名，以免覆盖仍在使用中的旧文件
+        fileNames = [os.path.join(self.bufferDir, '%s.%d.%d.npy' % (name, self.bufferVersion, i)) for i in range(2)]
+        return [np.lib.format.open_memmap(fileName, mode='w+', dtype=dtype, shape=shape) for fileName in fileNames]
+
+    @staticmethod
+    def removeBufferFiles(buffers):  # 删除不再使用的预分配矩阵所映射的文件（已映射的内存在删除后仍然有效）
+        if buffers is None:
+            return
+        for buffer in buffers:
+            if isinstance(buffer, np.memmap) and buffer.filename is not None:
+                try:
+                    os.remove(buffer.filename)
+                except OSError:  # 例如Windows下不能删除仍被映射着的文件
+                    pass
+
+    def writeBufferState(self):
+
+        """
+        描述: 在设置了bufferDir时，把当前个体数以及各矩阵当前所在的映射文件写入bufferDir下的state.json，
+             供其他进程通过loadMapped()查看。由于选择时个体被写入另一块预分配矩阵，
+             state.json所指向的文件中的前sizes行在下一次选择完成之前不会被改写。
+
+        """
+
+        if self.bufferDir is None:
+            return
+        state = {'sizes': self.sizes,
+                 'files': {name: os.path.basename(buffers[self.bufferIdx].filename)
+                           for name, buffers in self.buffers.items()}}
+        fileName = os.path.join(self.bufferDir, 'state.json')
+        with open(fileName + '.tmp', 'w') as file:
+            json.dump(state, file)
+        os.replace(fileName + '.tmp', fileName)
+
+    @staticmethod
+    def loadMapped(dirName):
+
+        """
+        描述: 只读地打开由映射到文件的预分配存储（详见reserve()）所保存的种群数据。
+
+        输入参数:
+            dirName : str - 映射文件所在的目录。
+
+        输出参数:
+            arrays  : dict - 键为矩阵名（如'Chrom', 'ObjV'），值为由当前种群各个体对应的行组成的只读矩阵。
+
+        """
+
+        with open(os.path.join(dirName, 'state.json')) as file:
+            state = json.load(file)
+        return {name: np.load(os.path.join(dirName, fileName), mmap_mode='r')[:state['sizes']]
+                for name, fileName in state['files'].items()}
+
+    def keep(self, index):
+
+        """
+        描述: 原地选择个体，即只保留index所对应的个体，index的格式与pop[index]的一致。
+             在预分配存储模式下，被选中的个体被直接写入另一块预分配空间，不再分配新的内存，
+             此时之前取得的Chrom、ObjV等矩阵的视图可能被覆盖（详见reserve()）；
+             否则与pop = pop[index]等价（但pop对象本身保持不变）。
+
+        用法: pop.keep(chooseFlag)。
+
+        输出参数:
+            pop : class <Population> - 种群对象本身，以便链式调用。
+
+        """
+
+        index_array, NIND = self.parseIndex(index)
+        if self.buffers is None:
+            self.setArrays(self.subset(index_array, NIND, False).getArrays())
+            self.sizes = NIND
+            return self
+        self.syncBuffers()
+        index_array = np.arange(self.sizes)[index_array]  # 统一转换为非负的整数下标
+        other = 1 - self.bufferIdx
+        arrays = {}
+        for name, arr in self.getArrays().items():
+            if arr is None:
+                arrays[name] = None
+                continue
+            arrays[name] = np.take(arr, index_array, axis=0, out=self.buffers[name][other][:NIND], mode='clip')
+        self.bufferIdx = other
+        self.sizes = NIND
+        self.setArrays(arrays)
+        self.writeBufferState()
+        return self
+
+    def checkMerge(self, pop):
+
+        """
+        描述: 检查pop能否与当前种群合并。
+
+        """
+
+        if self.Encoding is not None:
             if self.Encoding != pop.Encoding:
                 raise RuntimeError('error in Population: Encoding disagree. (两种群染色体的编码方式必须一致。)')
             if self.Chrom is None or pop.Chrom is None:
@@ -297,17 +649,32 @@ Population : class - 种群类
             if self.Field is not None and pop.Field is not None:
                 if not np.all(self.Field == pop.Field):
                     raise RuntimeError('error in Population: Field disagree. (两者的译码矩阵必须一致。)')
-            NewChrom = np.vstack([self.Chrom, pop.Chrom])
-        NIND = self.sizes + pop.sizes  # 得到合并种群的个体数
-        return Population(self.Encoding,
-                          self.Field,
-                          NIND,
-                          NewChrom,
-                          np.vstack([self.ObjV, pop.ObjV]) if self.ObjV is not None and pop.ObjV is not None else None,
-                          np.vstack(
-                              [self.FitnV, pop.FitnV]) if self.FitnV is not None and pop.FitnV is not None else None,
-                          np.vstack([self.CV, pop.CV]) if self.CV is not None and pop.CV is not None else None,
-                          np.vstack([self.Phen, pop.Phen]) if self.Phen is not None and pop.Phen is not None else None)
+
+    def getArrays(self):
+
+        """
+        描述: 返回由种群中各个按个体存储的矩阵组成的字典，键为矩阵名。
+
+        """
+
+        return {'Chrom': self.Chrom, 'ObjV': self.ObjV, 'FitnV': self.FitnV, 'CV': self.CV, 'Phen': self.Phen,
+                'decodedChrom': self.decodedChrom}
+
+    def setArrays(self, arrays):
+
+        """
+        描述: 用getArrays()格式的字典设置种群中各个按个体存储的矩阵。
+
+        """
+
+        if self.Encoding is not None:
+            self.Chrom = arrays['Chrom']
+            self.Lind = self.Chrom.shape[1] if self.Chrom is not None else 0
+            self.decodedChrom = arrays['decodedChrom']
+        self.ObjV = arrays['ObjV']
+        self.FitnV = arrays['FitnV']
+        self.CV = arrays['CV']
+        self.Phen = arrays['Phen']
 
     def __len__(self):
 
@@ -321,10 +688,14 @@ Population : class - 种群类
 
         return self.sizes
 
-    def save(self, dirName='Population Info'):
+    def save(self, dirName='Population Info', compress=False):
 
         """
-        描述: 该函数将在字符串dirName所指向的文件夹下保存种群的信息，其中：
+        描述: 保存种群的信息。
+        当dirName以'.npz'结尾时，种群的所有信息（编码方式、译码矩阵、各矩阵及其数据类型）被保存到以dirName为文件名的单个二进制文件中，
+        可以用ea.Population.load(dirName)完整地读取回来。二进制格式不损失精度，文件更小，读写也远快于csv格式；
+        此时若compress为True，则对文件进行压缩（更小但更慢）。
+        否则该函数将在字符串dirName所指向的文件夹下以csv格式保存种群的信息，其中：
         "Encoding.txt"保存种群的染色体编码；
         "Field.csv"保存种群染色体的译码矩阵；
         "Chrom.csv"保存种群的染色体矩阵；
@@ -336,6 +707,9 @@ Population : class - 种群类
         
         """
 
+        if dirName.endswith('.npz'):
+            self.saveBinary(dirName, compress)
+            return
         if self.sizes > 0:
             if not os.path.exists(dirName):
                 os.makedirs(dirName)
@@ -354,6 +728,73 @@ Population : class - 种群类
             if self.Phen is not None:
                 np.savetxt(dirName + '/Phen.csv', self.Phen, delimiter=',')
 
+    def saveBinary(self, fileName, compress=False):
+
+        """
+        描述: 把种群保存到二进制文件fileName(.npz)中。种群的编码方式等信息以JSON字符串的形式保存在其中名为'meta'的数组里，
+             各矩阵按原有的数据类型保存，因此读取时不需要启用pickle。
+
+        """
+
+        meta, arrays = self.getSaveData()
+        arrays = {name: arr for name, arr in arrays.items() if arr is not None}
+        arrays['meta'] = np.array(json.dumps(meta))
+        dirName = os.path.dirname(fileName)
+        if dirName != '' and not os.path.exists(dirName):
+            os.makedirs(dirName)
+        if compress:
+            np.savez_compressed(fileName, **arrays)
+        else:
+            np.savez(fileName, **arrays)
+
+    def getSaveData(self):
+
+        """
+        描述: 返回保存种群时所需的信息(meta, arrays)，其中meta是可以转换成JSON的字典，arrays是由要保存的矩阵组成的字典。
+
+        """
+
+        meta = {'Type': 'Population',
+                'sizes': self.sizes,
+                'Encoding': self.Encoding,
+                'dtypes': {name: np.dtype(dtype).str for name, dtype in self.dtypes.items()}}
+        arrays = {'Field': self.Field if self.Encoding is not None else None,
+                  'Chrom': self.Chrom, 'ObjV': self.ObjV, 'FitnV': self.FitnV, 'CV': self.CV, 'Phen': self.Phen}
+        return meta, arrays
+
+    @staticmethod
+    def fromSaveData(meta, arrays):  # 用getSaveData()格式的信息构建种群
+        pop = Population(meta['Encoding'], arrays.get('Field'), meta['sizes'],
+                         dtypes={name: np.dtype(dtype) for name, dtype in meta['dtypes'].items()})
+        if pop.Encoding is not None:
+            pop.Chrom = arrays.get('Chrom')
+            pop.Lind = pop.Chrom.shape[1] if pop.Chrom is not None else 0
+        pop.ObjV = arrays.get('ObjV')
+        pop.FitnV = arrays.get('FitnV')
+        pop.CV = arrays.get('CV')
+        pop.Phen = arrays.get('Phen')
+        return pop
+
+    @staticmethod
+    def load(fileName):
+
+        """
+        描述: 读取由save()保存的二进制种群文件（.npz），得到与保存时一致的种群对象。
+
+        用法: pop = ea.Population.load('optPop.npz')，保存的是PsyPopulation对象时得到的也是PsyPopulation对象。
+
+        输出参数:
+            pop : class <Population> or <PsyPopulation> - 读取得到的种群对象。
+
+        """
+
+        with np.load(fileName) as data:
+            meta = json.loads(str(data['meta']))
+            arrays = {name: data[name] for name in data.files if name != 'meta'}
+        if meta['Type'] == 'PsyPopulation':
+            return ea.PsyPopulation.fromSaveData(meta, arrays)
+        return Population.fromSaveData(meta, arrays)
+
     def getInfo(self):
         """
         获取种群的设置信息。
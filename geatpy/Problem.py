@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import inspect
 import os
+import re
+import tempfile
+import threading
 
 import numpy as np
 
@@ -34,8 +39,14 @@ class Problem:
                             0表示范围中不含边界，1表示范围包含边界。
 
         ReferObjV : array - 存储着目标函数参考值的矩阵，每一行对应一组目标函数参考值，每一列对应一个目标函数。
+                            它在第一次被访问时才通过getReferObjV()读取或计算，因此构造问题对象几乎不需要时间；
+                            也可以调用prefetchReferObjV()在后台线程中提前计算，使计算与算法的前几代进化同时进行。
 
-        TinyReferObjV : array - 从ReferObjV中均匀抽取的数目更少的目标函数参考值矩阵。
+        TinyReferObjV : array - 从ReferObjV中均匀抽取的数目更少的目标函数参考值矩阵，同样在第一次被访问时才计算。
+
+        referenceDir : str - (类属性)目标函数参考值的缓存目录。当为None时，依次使用环境变量GEATPY_CACHE_DIR所指定的目录、
+                             或者用户缓存目录（$XDG_CACHE_HOME或~/.cache）下的geatpy/referenceObjV目录。
+                             可以通过ea.Problem.referenceDir = '...'为所有问题统一设置。
 
     函数:
         aimFunc(pop)      : 目标函数，需要在继承类即自定义的问题类中实现，或是传入已实现的函数。
@@ -52,11 +63,22 @@ class Problem:
 
         evaluation(pop)   : 调用aimFunc()或evalVars()计算传入种群的目标函数值和违反约束程度。
 
+        evalDelta(Vars, OldVars, OldObjV, OldCV, start, end) : (可选)增量评价函数，可以在继承类中实现。
+                            用于根据决策变量发生变化的区间，由变化前的目标函数值更新得到新的目标函数值。
+
+        deltaEvaluation(pop, basePop, bounds) : 调用evalDelta()对由basePop经过少量改动得到的种群pop进行增量评价。
+
+        changedBounds(Vars, OldVars) : 求出两个决策变量矩阵的各行之间发生变化的区间。
+
         calReferObjV()    : 计算目标函数参考值，需要在继承类中实现，或是传入已实现的函数。
 
         getReferObjV()    : 获取目标函数参考值。
+
+        prefetchReferObjV() : 在后台线程中获取目标函数参考值。
     """
 
+    referenceDir = None
+
     def __init__(self,
                  name,
                  M,
@@ -88,16 +110,63 @@ class Problem:
         self.aimFunc = aimFunc if aimFunc is not None else self.aimFunc  # 初始化目标函数接口
         self.evalVars = evalVars if evalVars is not None else self.evalVars
         self.calReferObjV = calReferObjV if calReferObjV is not None else self.calReferObjV  # 初始化理论最优值计算函数接口
-        self.ReferObjV = self.getReferObjV()  # 计算目标函数参考值
-        if self.ReferObjV is not None:
-            if self.ReferObjV.shape[0] > 100:
-                chooseIdx = np.linspace(0, self.ReferObjV.shape[0] - 1,
+        # 目标函数参考值ReferObjV和TinyReferObjV在第一次被访问时才计算
+
+    @property
+    def ReferObjV(self):
+        if 'ReferObjV' not in self.__dict__:
+            thread = self.__dict__.get('referenceThread')
+            if thread is not None:  # 等待后台线程完成计算
+                thread.join()
+            if 'ReferObjV' not in self.__dict__:  # 没有后台线程，或者后台线程计算失败（此时重新计算以便抛出异常）
+                self.getReferObjV()
+        return self.__dict__['ReferObjV']
+
+    @ReferObjV.setter
+    def ReferObjV(self, referenceObjV):
+        self.__dict__['ReferObjV'] = referenceObjV
+        self.__dict__.pop('TinyReferObjV', None)
+
+    @property
+    def TinyReferObjV(self):
+        if 'TinyReferObjV' not in self.__dict__:
+            referenceObjV = self.ReferObjV
+            if referenceObjV is not None and referenceObjV.shape[0] > 100:
+                chooseIdx = np.linspace(0, referenceObjV.shape[0] - 1,
                                         100).astype(np.int32)
-                self.TinyReferObjV = self.ReferObjV[chooseIdx, :]
+                self.__dict__['TinyReferObjV'] = referenceObjV[chooseIdx, :]
             else:
-                self.TinyReferObjV = self.ReferObjV
-        else:
-            self.TinyReferObjV = None
+                self.__dict__['TinyReferObjV'] = referenceObjV
+        return self.__dict__['TinyReferObjV']
+
+    @TinyReferObjV.setter
+    def TinyReferObjV(self, referenceObjV):
+        self.__dict__['TinyReferObjV'] = referenceObjV
+
+    def prefetchReferObjV(self):
+        """prefetchReferObjV.
+
+        描述:
+            在后台线程中调用getReferObjV()获取目标函数参考值，之后访问ReferObjV时会等待该线程完成。
+            适用于calReferObjV()计算量较大的问题（例如WFG系列），此时可以在构造问题对象后立即调用它，
+            让计算与种群初始化以及前几代的进化同时进行。已经获取过目标函数参考值时不做任何事情。
+        """
+        if 'ReferObjV' in self.__dict__ or self.__dict__.get('referenceThread') is not None:
+            return
+
+        def target():
+            try:
+                self.getReferObjV()
+            except Exception:  # 异常会在主线程访问ReferObjV时重新计算并抛出
+                pass
+
+        self.referenceThread = threading.Thread(target=target, daemon=True)
+        self.referenceThread.start()
+
+    def __getstate__(self):  # 序列化时（例如多进程评价或者保存断点时）不包含后台线程
+        state = self.__dict__.copy()
+        state.pop('referenceThread', None)
+        return state
 
     def aimFunc(self, pop):
         """aimFunc.
@@ -206,6 +275,93 @@ class Problem:
                 'one of the function aimFunc and evalVars should be rewritten. '
                 '(aimFunc和evalVars两个函数必须至少有一个被子类重写。)')
 
+    def evalDelta(self, Vars, OldVars, OldObjV, OldCV, start, end):
+        """evalDelta.
+
+        描述:
+            (可选)增量评价函数，可以在继承类中重写。当Vars中的每组决策变量都是由OldVars中的对应行经过少量改动得到时
+            （例如排列编码的逆转、交换、移位变异只改变染色体上的一个片段），
+            可以只根据发生变化的区间由变化前的目标函数值更新得到新的目标函数值，而不必完整地重新计算。
+            没有重写该函数的问题类不进行增量评价。
+            只返回ObjV时认为违反约束程度没有变化，此时种群的CV被设置为OldCV的副本。
+
+        用法:
+            ObjV = evalDelta(Vars, OldVars, OldObjV, OldCV, start, end)
+            ObjV, CV = evalDelta(Vars, OldVars, OldObjV, OldCV, start, end)
+
+        输入参数:
+            Vars    : array - 决策变量矩阵。每一行代表一组决策变量。
+
+            OldVars : array - 变化前的决策变量矩阵，与Vars逐行对应。
+
+            OldObjV : array - OldVars对应的目标函数值矩阵。
+
+            OldCV   : array - OldVars对应的违反约束程度矩阵，没有约束时为None。
+
+            start   : array - 由各行发生变化的第一个位置组成的整数向量。
+
+            end     : array - 由各行发生变化的最后一个位置加1组成的整数向量。第i行只有Vars[i, start[i]:end[i]]可能与OldVars不同，
+                              start[i]等于end[i]时表示第i行没有变化。
+
+        输出参数:
+            ObjV : array - 目标函数值矩阵。
+
+            CV : array - 违反约束程度矩阵。
+        """
+        raise RuntimeError(
+            'error in Problem: delta evaluation is not supported. (该问题类不支持增量评价。)'
+        )
+
+    def deltaEvaluation(self, pop, basePop, bounds=None):
+        """函数deltaEvaluation.
+
+        描述:
+            调用evalDelta()对种群进行增量评价，其中pop的每个个体都是由basePop中的对应个体变化得到的。
+            当问题类没有重写evalDelta()，或者basePop与pop不对应（个体数或决策变量维数不同、basePop没有被评价过）时，
+            不进行增量评价，此时需要调用evaluation()完整地评价。
+
+        输入参数:
+            pop     : class <Population> - 待评价的种群对象。
+
+            basePop : class <Population> - 变化前的种群对象，它的个体必须已被评价过。
+
+            bounds  : tuple - (可选参数)各个体发生变化的区间(start, end)，含义详见evalDelta()，
+                              例如调用者自己实现的只改动染色体已知片段的变异所对应的区间。
+                              缺省时调用changedBounds()比较pop与basePop的决策变量得到。
+
+        输出参数:
+            flag : bool - 是否完成了增量评价。
+        """
+        if type(self).evalDelta is Problem.evalDelta or basePop is None or basePop.ObjV is None:
+            return False
+        OldVars = basePop.Phen if basePop.Phen is not None else basePop.decoding()
+        if OldVars.shape != pop.Phen.shape or basePop.ObjV.shape[0] != pop.sizes:
+            return False
+        start, end = bounds if bounds is not None else self.changedBounds(pop.Phen, OldVars)
+        return_object = self.evalDelta(pop.Phen, OldVars, basePop.ObjV, basePop.CV, start, end)
+        if type(return_object) != tuple:
+            pop.ObjV = return_object
+            pop.CV = basePop.CV.copy() if basePop.CV is not None else None
+        else:
+            pop.ObjV, pop.CV = return_object
+        return True
+
+    @staticmethod
+    def changedBounds(Vars, OldVars):
+        """changedBounds.
+
+        描述:
+            求出Vars的各行与OldVars的对应行之间发生变化的区间，返回(start, end)，含义详见evalDelta()。
+
+        """
+        changed = Vars != OldVars
+        start = np.argmax(changed, 1)
+        end = changed.shape[1] - np.argmax(changed[:, ::-1], 1)
+        same = ~changed[np.arange(changed.shape[0]), start]  # 没有发生变化的行
+        start[same] = 0
+        end[same] = 0
+        return start, end
+
     def calReferObjV(self):
         """calReferObjV.
 
@@ -214,54 +370,109 @@ class Problem:
         """
         return None
 
-    def getReferObjV(self, reCalculate=False):
+    def getReferObjV(self, reCalculate=False, **kwargs):
         """getReferObjV.
 
         描述:
             该函数用于读取/计算问题的目标函数参考值，这个参考值可以是理论上的全局最优解的目标函数值，也可以是人为设定的非最优的目标函数参考值。
             在获取或计算出理论全局最优解后，
-            结果将被按照“问题名称_目标维数_决策变量个数.csv”的文件命名保存到referenceObjV文件夹内。
+            结果将被以.npy二进制格式保存到缓存目录（详见referenceDir属性）中，文件名为“问题名称_M目标维数_D决策变量个数_摘要.npy”，
+            其中摘要是根据问题类的源代码、目标维数以及决策变量个数计算得到的，因此问题类的代码被修改后会自动重新计算。
+            读取时以只读的内存映射方式打开缓存文件，不需要解析文本。
+            缓存文件先写入临时文件再原子地替换，因此多个进程可以同时创建同一个缓存文件。
+            为了兼容旧版本，当缓存不存在而当前工作目录的referenceObjV文件夹中存在“问题名称_M目标维数_D决策变量个数.csv”时，
+            会读取该文件（并写入缓存）。
+            其余的关键字参数会被传给calReferObjV()，例如WFG系列问题可以用getReferObjV(N=...)指定参考点的数目，
+            这些参数也会被写进缓存文件的文件名和摘要中，因此不同参数的结果分别缓存。
 
         输入参数:
             reCalculate : bool - 表示是否要调用calReferObjV()来重新计算目标函数参考值。
                                  当缺省时默认为False。
 
+            kwargs      : dict - (可选)传给calReferObjV()的关键字参数。
+
         输出参数:
             referenceObjV : array - 存储着目标函数参考值的矩阵，每一行对应一组目标函数参考值，每一列对应一个目标函数。
+                                    从缓存中读取时是只读的。
         """
+        if self.calReferObjV.__module__ == 'geatpy.Problem':  # 没有重写calReferObjV()，即没有目标函数参考值
+            self.ReferObjV = None
+            return None
+        fileName = self.getReferenceFileName(**kwargs)
+        referenceObjV = None
         if not reCalculate:
-            if self.calReferObjV.__module__ != 'geatpy.Problem':
-                # 尝试读取数据
-                if os.path.exists('referenceObjV'):
-                    if os.path.exists('referenceObjV/' + self.name + '_M'
-                                      + str(self.M) + '_D' + str(self.Dim)
-                                      + '.csv'):
-                        return np.atleast_2d(
-                            np.loadtxt(
-                                'referenceObjV/' + self.name + '_M'
-                                + str(self.M) + '_D' + str(self.Dim) + '.csv',
-                                delimiter=','))
-        # 若找不到数据，则调用calReferObjV()计算目标函数参考值
-        referenceObjV = self.calReferObjV()
-        if referenceObjV is not None:
-            # 简单检查referenceObjV的合法性
-            if not isinstance(
-                    referenceObjV, np.ndarray
-            ) or referenceObjV.ndim != 2 or referenceObjV.shape[1] != self.M:
-                raise RuntimeError(
-                    'error: ReferenceObjV is illegal. (目标函数参考值矩阵的数据格式不合法，请检查自定义问题类中的calReferObjV('
-                    ')函数的代码，假如没有目标函数参考值，则在问题类中不需要定义calReferObjV()函数。)')
-            # 保存数据
-            if not os.path.exists('referenceObjV'):
-                os.makedirs('referenceObjV')
-            np.savetxt(
-                'referenceObjV/' + self.name + '_M' + str(self.M) + '_D'
-                + str(self.Dim) + '.csv',
-                referenceObjV,
-                delimiter=',')
+            # 尝试读取数据
+            try:
+                referenceObjV = np.load(fileName, mmap_mode='r')
+            except (OSError, ValueError):  # 缓存不存在或者已损坏
+                legacyName = 'referenceObjV/' + self.name + '_M' + str(self.M) + '_D' + str(self.Dim) + '.csv'
+                if not kwargs and os.path.exists(legacyName):
+                    referenceObjV = np.atleast_2d(np.loadtxt(legacyName, delimiter=','))
+                    self.saveReferObjV(fileName, referenceObjV)
+        if referenceObjV is None:
+            # 若找不到数据，则调用calReferObjV()计算目标函数参考值
+            referenceObjV = self.calReferObjV(**kwargs)
+            if referenceObjV is not None:
+                # 简单检查referenceObjV的合法性
+                if not isinstance(
+                        referenceObjV, np.ndarray
+                ) or referenceObjV.ndim != 2 or referenceObjV.shape[1] != self.M:
+                    raise RuntimeError(
+                        'error: ReferenceObjV is illegal. (目标函数参考值矩阵的数据格式不合法，请检查自定义问题类中的calReferObjV('
+                        ')函数的代码，假如没有目标函数参考值，则在问题类中不需要定义calReferObjV()函数。)')
+                # 保存数据
+                self.saveReferObjV(fileName, referenceObjV)
         self.ReferObjV = referenceObjV
         return referenceObjV
 
+    def getReferenceFileName(self, **kwargs):
+        """getReferenceFileName.
+
+        描述:
+            返回目标函数参考值的缓存文件的路径。文件名中的摘要由问题类（以及单独传入的calReferObjV函数）的源代码、
+            目标维数、决策变量个数以及传给calReferObjV()的关键字参数kwargs计算得到；
+            无法获取源代码时（例如在交互式环境中定义的类）用类的完整名称代替。
+            kwargs不为空时，文件名中还会依次加上各参数，例如“_N10000”。
+        """
+        referenceDir = Problem.referenceDir
+        if referenceDir is None:
+            referenceDir = os.environ.get('GEATPY_CACHE_DIR')
+        if referenceDir is None:
+            cacheHome = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+            referenceDir = os.path.join(cacheHome, 'geatpy', 'referenceObjV')
+        sources = []
+        for item in (type(self), self.calReferObjV):
+            try:
+                sources.append(inspect.getsource(item))
+            except (OSError, TypeError):
+                sources.append(getattr(item, '__module__', '') + '.' + getattr(item, '__qualname__', ''))
+        params = [str(key) + repr(kwargs[key]) for key in sorted(kwargs)]
+        key = hashlib.blake2b('\n'.join(sources + [str(self.M), str(self.Dim)] + params).encode('utf-8'),
+                              digest_size=8).hexdigest()
+        name = re.sub(r'[^\w.-]', '_', '_'.join([str(self.name) + '_M' + str(self.M) + '_D' + str(self.Dim)] + params))
+        return os.path.join(referenceDir, name + '_' + key + '.npy')
+
+    @staticmethod
+    def saveReferObjV(fileName, referenceObjV):
+        """saveReferObjV.
+
+        描述:
+            把目标函数参考值写入缓存文件：先写入同一目录下的临时文件，再用os.replace()原子地替换，
+            因此并发的进程只会读到完整的文件。缓存目录不可写时不保存，也不报错。
+        """
+        try:
+            os.makedirs(os.path.dirname(fileName), exist_ok=True)
+            fd, tempName = tempfile.mkstemp(dir=os.path.dirname(fileName), suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                np.save(file, np.asarray(referenceObjV))
+            os.replace(tempName, fileName)
+        except OSError:
+            if os.path.exists(tempName):
+                os.remove(tempName)
+
     def __str__(self):
         info = {}
         info['name'] = self.name
@@ -4,6 +4,44 @@ import numpy as np
 import geatpy as ea
 
 
+class ChromList(list):
+    """
+    ChromList - class : PsyPopulation的Chroms属性所返回的列表，其元素是各染色体矩阵，即种群连续存储矩阵中对应列的视图。
+                        对其元素赋值（例如pop.Chroms[i] = ...）时，新的染色体矩阵会被写回种群的连续存储矩阵中。
+                        若种群的Phen是该连续存储矩阵的视图（见PsyPopulation的phenView属性），
+                        则先复制连续存储矩阵再写入（写时复制），因此已取得的Phen不会被悄悄修改。
+                        视图种群（见Population类的view()）的连续存储矩阵是原种群的视图，对其元素赋值时同样先复制，
+                        因此与Population类一样，对视图的染色体重新赋值不会影响原种群。
+                        但原种群并不知道有哪些视图，对原种群的元素赋值会直接写入共享的连续存储矩阵，
+                        因而会同步到此前取得的视图中，若要避免这一点，应对原种群的Chroms属性整体赋值。
+
+    """
+
+    def __init__(self, pop, Chroms):
+        super().__init__(Chroms)
+        self.pop = pop
+
+    def __setitem__(self, i, Chrom):
+        pop = self.pop
+        if pop.ChromBuffers is not None and isinstance(i, int) and isinstance(Chrom, np.ndarray):
+            Chrom = pop.castChrom(Chrom)
+            g, start, end = pop.ChromLayout[i]
+            buffer = pop.ChromBuffers[g]
+            if Chrom.shape == (buffer.shape[0], end - start) and Chrom.dtype == buffer.dtype:  # 直接写回连续存储矩阵
+                # 该矩阵是原种群的视图，或者Phen是该矩阵的视图，写时复制
+                if not buffer.flags.owndata or pop.Phen is not None and np.shares_memory(pop.Phen, buffer):
+                    buffer = buffer.copy()
+                    pop.ChromBuffers[g] = buffer
+                buffer[:, start:end] = Chrom
+                super().__setitem__(i, buffer[:, start:end])
+                return
+        # 染色体的形状或数据类型发生了变化，重新组织连续存储矩阵
+        Chroms = list(self)
+        Chroms[i] = Chrom
+        pop.Chroms = Chroms
+        super().__setitem__(slice(None), pop.Chroms)
+
+
 class PsyPopulation(ea.Population):
     """
 PsyPopulation : class - 多染色体种群类(Popysomy Population)
@@ -47,17 +85,31 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
                         注意：当没有设置约束条件时，CV设置为None。
     
     Phen      : array - 种群表现型矩阵（即染色体解码后所代表的决策变量所组成的矩阵）。
+                        默认是可以原地修改的独立矩阵；当所有染色体都是'RI'或'P'编码且数据类型相同时，
+                        设置了phenView为True时它是连续存储矩阵的只读视图。
 
     EncoIdxs  : list  - 表示每个染色体编码哪些变量。
                         例如：EncoIdxs = [[0], [1,2,3,4]]，表示一共有5个变量，其中第一个变量编码成第一条子染色体；后4个变量编码成第
                         二条子染色体。
+
+    dtypes    : dict  - 各矩阵的数据类型，详见Population类。其中'Chrom'对应的数据类型作用于所有染色体矩阵。
+
+    ChromBuffers : list - 染色体的连续存储矩阵组成的列表。数据类型相同的各染色体矩阵按顺序依次存放在同一个二维矩阵的相邻列中，
+                        因此种群的切片、合并、个体替换等操作对每种数据类型只需要进行一次矩阵运算，而不必逐条染色体处理。
+                        Chroms列表的元素就是这些矩阵中对应列的视图。当有染色体矩阵尚未初始化时为None。
+
+    ChromLayout  : tuple - 各染色体在连续存储矩阵中的位置，第i个元素为(所在的矩阵序号, 起始列, 终止列)。
+
+    phenView  : bool  - 表示解码时是否直接把连续存储矩阵的只读视图作为Phen，从而省去一次复制，默认为False，详见Population类。
+                        此后通过Chroms[i] = ...修改染色体时会先复制连续存储矩阵，不会改变已取得的Phen。
     
 函数:
     详见源码。
 
 """
 
-    def __init__(self, Encodings, Fields=None, NIND=None, Chroms=None, ObjV=None, FitnV=None, CV=None, Phen=None, EncoIdxs=None):
+    def __init__(self, Encodings, Fields=None, NIND=None, Chroms=None, ObjV=None, FitnV=None, CV=None, Phen=None, EncoIdxs=None,
+                 dtypes=None, phenView=False):
 
         """
         描述: 种群类的构造函数，用于实例化种群对象，例如：
@@ -75,6 +127,10 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
              
         """
 
+        self.dtypes = dict(dtypes) if dtypes is not None else {}
+        self.phenView = phenView
+        self.ChromBuffers = None
+        self.ChromLayout = None
         if NIND is None:
             NIND = 0
         if isinstance(NIND, int) and NIND >= 0:
@@ -114,21 +170,68 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
                         self.Fields.append(ea.crtfld(Encoding, *params))
                 else:
                     self.Fields = Fields.copy()
-            self.Chroms = [None] * self.ChromNum  # 初始化Chroms为元素是None的列表
-            self.Linds = []
             if Chroms is None:
-                self.Linds = [0] * self.ChromNum
-            else:
-                for i in range(self.ChromNum):
-                    if Chroms[i] is not None:
-                        self.Linds.append(Chroms[i].shape[1])
-                        self.Chroms[i] = Chroms[i].copy() if Chroms[i] is not None else None
-                    else:
-                        self.Linds.append(0)
+                Chroms = [None] * self.ChromNum  # 初始化Chroms为元素是None的列表
+            self.Chroms = Chroms  # 所有染色体矩阵都不为None时会被复制到连续存储矩阵中
         self.ObjV = ObjV.copy() if ObjV is not None else None
         self.FitnV = FitnV.copy() if FitnV is not None else None
         self.CV = CV.copy() if CV is not None else None
         self.Phen = Phen.copy() if Phen is not None else None
+        self.capacity = None  # 预分配存储模式下的容量，详见Population类的reserve()
+        self.buffers = None
+        self.bufferIdx = 0
+        self.bufferDir = None
+        self.bufferVersion = 0
+
+    @property
+    def Chroms(self):
+        if self.__dict__.get('ChromBuffers') is None:
+            Chroms = self.__dict__.get('Chroms')
+            return ChromList(self, Chroms) if Chroms is not None else None
+        return ChromList(self, [self.ChromBuffers[g][:, start:end] for g, start, end in self.ChromLayout])
+
+    @Chroms.setter
+    def Chroms(self, Chroms):
+
+        """
+        描述: 设置各染色体矩阵。当所有染色体矩阵都不为None时，把它们按数据类型复制到连续存储矩阵ChromBuffers中。
+
+        """
+
+        if Chroms is None or any(Chrom is None for Chrom in Chroms):
+            self.ChromBuffers = None
+            self.ChromLayout = None
+            self.__dict__['Chroms'] = list(Chroms) if Chroms is not None else None
+            if Chroms is not None:
+                self.Linds = [Chrom.shape[1] if Chrom is not None else 0 for Chrom in Chroms]
+            return
+        Chroms = [self.castChrom(np.asarray(Chrom)) for Chrom in Chroms]
+        groups = {}  # 由数据类型到连续存储矩阵序号的映射
+        widths = []
+        layout = []
+        for Chrom in Chroms:
+            g = groups.setdefault(Chrom.dtype, len(groups))
+            if g == len(widths):
+                widths.append(0)
+            layout.append((g, widths[g], widths[g] + Chrom.shape[1]))
+            widths[g] += Chrom.shape[1]
+        self.ChromBuffers = [np.hstack([Chrom for Chrom, item in zip(Chroms, layout) if item[0] == g])
+                             for g in range(len(widths))]
+        self.ChromLayout = tuple(layout)
+        self.Linds = [end - start for _, start, end in layout]
+        self.__dict__['Chroms'] = None
+
+    def castChrom(self, Chrom):
+
+        """
+        描述: 按照dtypes把染色体矩阵转换成对应的数据类型，数据类型已经一致时直接返回原矩阵。
+
+        """
+
+        dtype = self.dtypes.get('Chrom')
+        if dtype is not None and isinstance(Chrom, np.ndarray) and Chrom.dtype != dtype:
+            return Chrom.astype(dtype)
+        return Chrom
 
     def initChrom(self, NIND=None):
 
@@ -146,10 +249,8 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
 
         if NIND is not None:
             self.sizes = NIND  # 重新设置种群规模
-        # 遍历各染色体矩阵进行初始化
-        for i in range(self.ChromNum):
-            self.Chroms[i] = ea.crtpc(self.Encodings[i], self.sizes, self.Fields[i])  # 生成染色体矩阵
-            self.Linds.append(self.Chroms[i].shape[1])  # 计算染色体的长度
+        # 生成各染色体矩阵，并计算染色体的长度
+        self.Chroms = [ea.crtpc(self.Encodings[i], self.sizes, self.Fields[i]) for i in range(self.ChromNum)]
         self.ObjV = None
         self.FitnV = np.ones((self.sizes, 1))  # 默认适应度全为1
         self.CV = None
@@ -157,24 +258,39 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
     def decoding(self):
 
         """
-        描述: 种群染色体解码。
+        描述: 种群染色体解码，返回解码得到的表现型矩阵，同时把它保存到种群的Phen属性中。
+             当所有染色体都是'RI'或'P'编码且存放在同一个连续存储矩阵中时，返回该矩阵的副本；
+             若phenView为True，则直接返回该矩阵的只读视图，不进行复制；
+             否则一次性分配表现型矩阵，再把各染色体的解码结果写入对应的列中。
         
         """
 
-        Phen = np.ones((self.sizes, 0))  # 初始化一个空的矩阵
-        # 遍历各染色体矩阵进行解码
         for i in range(self.ChromNum):
-            if self.Encodings[i] == 'BG':  # 此时Field实际上为FieldD
-                tempPhen = ea.bs2ri(self.Chroms[i], self.Fields[i])  # 把二进制/格雷码转化为实整数
-            elif self.Encodings[i] == 'RI' or self.Encodings[i] == 'P':
-                tempPhen = self.Chroms[i].copy()
-            else:
+            if self.Encodings[i] not in ('BG', 'RI', 'P'):
                 raise RuntimeError(
                     'error in PsyPopulation.decoding: Encoding must be ''BG'' or ''RI'' or ''P''. ('
                     '编码设置有误，Encoding必须为''BG'', ''RI'' 或 ''P''。)')
-            Phen = np.hstack([Phen, tempPhen])
-
-        return Phen
+        if 'BG' not in self.Encodings and len(self.ChromBuffers) == 1:
+            if self.phenView:
+                Phen = self.ChromBuffers[0].view()
+                Phen.flags.writeable = False
+            else:
+                Phen = self.ChromBuffers[0].copy()
+        else:
+            decoded = []
+            for i, Chrom in enumerate(self.Chroms):
+                if self.Encodings[i] == 'BG':  # 此时Field实际上为FieldD
+                    decoded.append(ea.bs2ri(Chrom, self.Fields[i]))  # 把二进制/格雷码转化为实整数
+                else:
+                    decoded.append(Chrom)
+            Phen = np.empty((self.sizes, sum(item.shape[1] for item in decoded)),
+                            dtype=np.result_type(*decoded))
+            start = 0
+            for item in decoded:
+                Phen[:, start:start + item.shape[1]] = item
+                start += item.shape[1]
+        self.Phen = Phen
+        return self.Phen
 
     def copy(self):
 
@@ -193,71 +309,47 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
                              self.FitnV,
                              self.CV,
                              self.Phen,
-                             self.EncoIdxs)
+                             self.EncoIdxs,
+                             self.dtypes,
+                             self.phenView)
 
-    def __getitem__(self, index):
+    def subset(self, index_array, NIND, share):
 
         """
-        描述: 种群的切片，即根据index下标向量选出种群中相应的个体组成一个新的种群。
-        用法: 假设pop是一个包含多于2个个体的种群矩阵，那么：
-             pop1 = pop[[0,1]]即可得到由pop种群的第1、2个个体组成的种群。
-        注意: index必须为一个slice或者为一个Numpy ndarray类型的一维数组或者为一个list类型的列表或者为一个整数，
-             该函数不对传入的index参数的合法性进行更详细的检查。
-        
+        描述: 用parseIndex()处理后的index_array选出个体组成新的种群，share表示是否与原种群共享内存。
+             种群的切片pop[index]以及视图切片pop.view(index)都是通过它实现的，详见Population类。
+
         """
 
-        # 计算切片后的长度
-        if not isinstance(index, (slice, np.ndarray, list)):
-            if 'int' not in str(type(index)):
-                raise RuntimeError(
-                    'error in Population: index must be an integer, a 1-D list, or a 1-D array. ('
-                    'index必须是一个整数，一维的列表或者一维的向量。)')
-        if isinstance(index, slice):
-            NIND = (index.stop - (index.start if index.start is not None else 0)) // (
-                index.step if index.step is not None else 1)
-            index_array = index
-        else:
-            index_array = np.array(index).reshape(-1)
-            if index_array.dtype == bool:
-                NIND = int(np.sum(index_array))
-            else:
-                NIND = len(index_array)
-            if len(index_array) == 0:
-                index_array = []
-        if self.Encodings is None:
-            NewChroms = None
-        else:
-            NewChroms = []
-            for i in range(self.ChromNum):
-                if self.Chroms[i] is None:
-                    raise RuntimeError('error in PsyPopulation: Chrom[i] is None. (种群染色体矩阵未初始化。)')
-                NewChroms.append(self.Chroms[i][index_array])
-        return PsyPopulation(self.Encodings,
-                             self.Fields,
-                             NIND,
-                             NewChroms,
-                             self.ObjV[index_array] if self.ObjV is not None else None,
-                             self.FitnV[index_array] if self.FitnV is not None else None,
-                             self.CV[index_array] if self.CV is not None else None,
-                             self.Phen[index_array] if self.Phen is not None else None,
-                             self.EncoIdxs)
+        if self.Encodings is not None and self.ChromBuffers is None:
+            raise RuntimeError('error in PsyPopulation: Chrom[i] is None. (种群染色体矩阵未初始化。)')
+        pop = PsyPopulation(self.Encodings, self.Fields, NIND, EncoIdxs=self.EncoIdxs, dtypes=self.dtypes,
+                            phenView=self.phenView)
+        pop.ChromLayout = self.ChromLayout
+        pop.setArrays({name: self.takeRows(arr, index_array, share) for name, arr in self.getArrays().items()})
+        return pop
 
-    def shuffle(self):
+    def shuffle(self, rng=None):
 
         """
         shuffle : function - 打乱种群个体的个体顺序
         用法: 假设pop是一个种群矩阵，那么，pop.shuffle()即可完成对pop种群个体顺序的打乱。
+             可以传入numpy.random.Generator对象rng（例如算法类的rng属性）来指定所用的随机数发生器，
+             缺省时使用numpy的全局随机数发生器。
         
         """
 
         shuff = np.arange(self.sizes)
-        np.random.shuffle(shuff)  # 打乱顺序
+        if rng is None:
+            np.random.shuffle(shuff)  # 打乱顺序
+        else:
+            rng.shuffle(shuff)
         if self.Encodings is None:
             self.Chroms = None
-        for i in range(self.ChromNum):
-            if self.Chroms[i] is None:
-                raise RuntimeError('error in PsyPopulation: Chrom[i] is None. (种群染色体矩阵未初始化。)')
-            self.Chroms[i] = self.Chroms[i][shuff, :]
+        elif self.ChromBuffers is None:
+            raise RuntimeError('error in PsyPopulation: Chrom[i] is None. (种群染色体矩阵未初始化。)')
+        else:
+            self.ChromBuffers = [buffer[shuff, :] for buffer in self.ChromBuffers]
         self.ObjV = self.ObjV[shuff, :] if self.ObjV is not None else None
         self.FitnV = self.FitnV[shuff] if self.FitnV is not None else None
         self.CV = self.CV[shuff, :] if self.CV is not None else None
@@ -295,9 +387,10 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
                         raise RuntimeError('error in PsyPopulation: Encoding disagree. (两种群染色体的编码方式必须一致。)')
                     if not np.all(self.Fields[i] == pop.Fields[i]):
                         raise RuntimeError('error in PsyPopulation: Field disagree. (两者的译码矩阵必须一致。)')
-                    if self.Chroms[i] is None:
-                        raise RuntimeError('error in PsyPopulation: Chrom[i] is None. (种群染色体矩阵未初始化。)')
-                    self.Chroms[i][index_array] = pop.Chroms[i]
+                if self.ChromBuffers is None:
+                    raise RuntimeError('error in PsyPopulation: Chrom[i] is None. (种群染色体矩阵未初始化。)')
+                for buffer, popBuffer in zip(self.ChromBuffers, pop.ChromBuffers):
+                    buffer[index_array] = popBuffer
         if self.ObjV is not None:
             if pop.ObjV is None:
                 raise RuntimeError('error in PsyPopulation: ObjV disagree. (两者的目标函数值矩阵必须要么同时为None要么同时不为None。)')
@@ -313,6 +406,8 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
         if self.Phen is not None:
             if pop.Phen is None:
                 raise RuntimeError('error in PsyPopulation: Phen disagree. (两者的表现型矩阵必须要么同时为None要么同时不为None。)')
+            if not self.Phen.flags.writeable:  # Phen是连续存储矩阵的只读视图，写入前先复制
+                self.Phen = self.Phen.copy()
             self.Phen[index_array] = pop.Phen
         self.sizes = self.Phen.shape[0]  # 更新种群规模
 
@@ -328,31 +423,62 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
             
         """
 
-        if self.Encodings is None:
-            NewChroms = None
-        else:
-            NewChroms = [None] * self.ChromNum
+        self.checkMerge(pop)
+        NIND = self.sizes + pop.sizes  # 得到合并种群的个体数
+        others = pop.getArrays()
+        newPop = PsyPopulation(self.Encodings, self.Fields, NIND, EncoIdxs=self.EncoIdxs, dtypes=self.dtypes,
+                               phenView=self.phenView)
+        newPop.ChromLayout = self.ChromLayout
+        newPop.setArrays({name: np.vstack([arr, others[name]]) if arr is not None and others[name] is not None
+                          else None for name, arr in self.getArrays().items()})
+        return newPop
+
+    def checkMerge(self, pop):
+
+        """
+        描述: 检查pop能否与当前种群合并。
+
+        """
+
+        if self.Encodings is not None:
             for i in range(self.ChromNum):
                 if self.Encodings[i] != pop.Encodings[i]:
                     raise RuntimeError('error in PsyPopulation: Encoding disagree. (两种群染色体的编码方式必须一致。)')
                 if not np.all(self.Fields[i] == pop.Fields[i]):
                     raise RuntimeError('error in PsyPopulation: Field disagree. (两者的译码矩阵必须一致。)')
-                if self.Chroms[i] is None or pop.Chroms[i] is None:
-                    raise RuntimeError('error in PsyPopulation: Chrom is None. (种群染色体矩阵未初始化。)')
-                NewChroms[i] = np.vstack([self.Chroms[i], pop.Chroms[i]])
-        NIND = self.sizes + pop.sizes  # 得到合并种群的个体数
-        return PsyPopulation(self.Encodings,
-                             self.Fields,
-                             NIND,
-                             NewChroms,
-                             np.vstack(
-                                 [self.ObjV, pop.ObjV]) if self.ObjV is not None and pop.ObjV is not None else None,
-                             np.vstack(
-                                 [self.FitnV, pop.FitnV]) if self.FitnV is not None and pop.FitnV is not None else None,
-                             np.vstack([self.CV, pop.CV]) if self.CV is not None and pop.CV is not None else None,
-                             np.vstack(
-                                 [self.Phen, pop.Phen]) if self.Phen is not None and pop.Phen is not None else None,
-                             self.EncoIdxs)
+            if self.ChromBuffers is None or pop.ChromBuffers is None:
+                raise RuntimeError('error in PsyPopulation: Chrom is None. (种群染色体矩阵未初始化。)')
+            if pop.ChromLayout != self.ChromLayout:
+                raise RuntimeError('error in PsyPopulation: Chrom disagree. (两者的染色体长度或数据类型必须一致。)')
+
+    def getArrays(self):
+
+        """
+        描述: 返回由种群中各个按个体存储的矩阵组成的字典，第g个染色体连续存储矩阵的键为'ChromBuffer' + str(g)。
+
+        """
+
+        arrays = {'ObjV': self.ObjV, 'FitnV': self.FitnV, 'CV': self.CV, 'Phen': self.Phen}
+        if self.ChromBuffers is not None:
+            for g, buffer in enumerate(self.ChromBuffers):
+                arrays['ChromBuffer' + str(g)] = buffer
+        return arrays
+
+    def setArrays(self, arrays):
+
+        """
+        描述: 用getArrays()格式的字典设置种群中各个按个体存储的矩阵。
+
+        """
+
+        if self.Encodings is not None and self.ChromLayout is not None:
+            bufferNum = max(item[0] for item in self.ChromLayout) + 1
+            self.ChromBuffers = [arrays['ChromBuffer' + str(g)] for g in range(bufferNum)]
+            self.Linds = [end - start for _, start, end in self.ChromLayout]
+        self.ObjV = arrays['ObjV']
+        self.FitnV = arrays['FitnV']
+        self.CV = arrays['CV']
+        self.Phen = arrays['Phen']
 
     def __len__(self):
 
@@ -365,10 +491,12 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
 
         return self.sizes
 
-    def save(self, dirName='Population Info'):
+    def save(self, dirName='Population Info', compress=False):
 
         """
-        描述: 该函数将在字符串dirName所指向的文件夹下保存种群的信息，其中：
+        描述: 保存种群的信息。
+        当dirName以'.npz'结尾时，种群的所有信息被保存到单个二进制文件中，可以用ea.Population.load(dirName)读取回来，详见Population类。
+        否则该函数将在字符串dirName所指向的文件夹下以csv格式保存种群的信息，其中：
         "Encodingsi.txt"保存种群的染色体编码，i为0,1,2,3...；
         "Fieldsi.csv"保存种群染色体的译码矩阵，i为0,1,2,3...；
         "Chromsi.csv"保存种群的染色体矩阵，i为0,1,2,3...；
@@ -380,6 +508,9 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
         
         """
 
+        if dirName.endswith('.npz'):
+            self.saveBinary(dirName, compress)
+            return
         if self.sizes > 0:
             if not os.path.exists(dirName):
                 os.makedirs(dirName)
@@ -403,6 +534,42 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
                 with open(dirName + '/EncoIdxs.txt', 'w') as file:
                     file.write(str(self.EncoIdxs))
 
+    def getSaveData(self):
+
+        """
+        描述: 返回保存种群时所需的信息(meta, arrays)，第i条染色体的译码矩阵和染色体矩阵的键分别为'Field' + str(i)和'Chrom' + str(i)。
+
+        """
+
+        EncoIdxs = [[int(idx) for idx in item] for item in self.EncoIdxs] if self.EncoIdxs is not None else None
+        meta = {'Type': 'PsyPopulation',
+                'sizes': self.sizes,
+                'Encodings': self.Encodings,
+                'EncoIdxs': EncoIdxs,
+                'dtypes': {name: np.dtype(dtype).str for name, dtype in self.dtypes.items()}}
+        arrays = {'ObjV': self.ObjV, 'FitnV': self.FitnV, 'CV': self.CV, 'Phen': self.Phen}
+        if self.Encodings is not None:
+            for i in range(self.ChromNum):
+                arrays['Field' + str(i)] = self.Fields[i] if self.Fields is not None else None
+                arrays['Chrom' + str(i)] = self.Chroms[i]
+        return meta, arrays
+
+    @staticmethod
+    def fromSaveData(meta, arrays):  # 用getSaveData()格式的信息构建种群
+        Encodings = meta['Encodings']
+        Fields = Chroms = None
+        if Encodings is not None:
+            if 'Field0' in arrays:
+                Fields = [arrays['Field' + str(i)] for i in range(len(Encodings))]
+            Chroms = [arrays.get('Chrom' + str(i)) for i in range(len(Encodings))]
+        pop = PsyPopulation(Encodings, Fields, meta['sizes'], Chroms, EncoIdxs=meta['EncoIdxs'],
+                            dtypes={name: np.dtype(dtype) for name, dtype in meta['dtypes'].items()})
+        pop.ObjV = arrays.get('ObjV')
+        pop.FitnV = arrays.get('FitnV')
+        pop.CV = arrays.get('CV')
+        pop.Phen = arrays.get('Phen')
+        return pop
+
     def getInfo(self):
         """
         获取种群的设置信息。
@@ -9,6 +9,9 @@ __version__ = "2.7.0"
 from geatpy.Algorithm import Algorithm  # isort:skip
 from geatpy.Algorithm import MoeaAlgorithm  # isort:skip
 from geatpy.Algorithm import SoeaAlgorithm  # isort:skip
+from geatpy.hvExact import hvContribution  # isort:skip
+from geatpy.hvExact import hypervolume  # isort:skip
+from geatpy.IndicatorWorker import IndicatorWorker  # isort:skip
 from geatpy.optimize import optimize  # isort:skip
 from geatpy.Population import Population  # isort:skip
 from geatpy.Problem import Problem  # isort:skip
@@ -46,6 +49,8 @@ from geatpy.algorithms.moeas.rvea.moea_RVEA_RES_templet import \
     moea_RVEA_RES_templet
 from geatpy.algorithms.moeas.rvea.moea_RVEA_templet import moea_RVEA_templet
 # import soea algorithms
+from geatpy.algorithms.soeas.GA.soea_async_steadyGA_templet import \
+    soea_async_steadyGA_templet
 from geatpy.algorithms.soeas.DE.soea_DE_best_1_bin_templet import \
     soea_DE_best_1_bin_templet
 from geatpy.algorithms.soeas.DE.soea_DE_best_1_L_templet import \
@@ -169,6 +174,14 @@ from geatpy.core.xovsec import xovsec
 from geatpy.core.xovsh import xovsh
 from geatpy.core.xovsp import xovsp
 from geatpy.core.xovud import xovud
+# import evaluators
+from geatpy.evaluators.CacheEvaluator import CacheEvaluator
+from geatpy.evaluators.EvalStore import EvalStore
+from geatpy.evaluators.Evaluator import Evaluator
+from geatpy.evaluators.ProcessEvaluator import ProcessEvaluator
+from geatpy.evaluators.SerialEvaluator import SerialEvaluator
+from geatpy.evaluators.SharedMemoryEvaluator import SharedMemoryEvaluator
+from geatpy.evaluators.ThreadEvaluator import ThreadEvaluator
 # import operators
 from geatpy.operators.migration.Migrate import Migrate
 from geatpy.operators.mutation.Mutation import Mutation
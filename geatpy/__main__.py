@@ -8,4 +8,14 @@ parser.add_argument('-v',
                     help='show version',
                     action='version',
                     version='geatpy {}'.format(geatpy.__version__))
-parser.parse_args()
+parser.add_argument('--compact-store',
+                    help='remove duplicated records from evaluation store files',
+                    nargs='+',
+                    metavar='FILE')
+args = parser.parse_args()
+if args.compact_store is not None:
+    for fileName in args.compact_store:
+        store = geatpy.EvalStore(fileName)
+        store.compact()
+        print('{}: {} records'.format(fileName, store.sizes))
+        store.close()
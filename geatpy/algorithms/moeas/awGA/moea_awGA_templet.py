@@ -17,6 +17,8 @@ moea_awGA_templet : class - 多目标进化优化awGA算法类
         
     """
 
+    stateAttrs = ('NDSet',)  # 采用断点协议，进化循环的状态为种群以及全局非支配种群
+
     def __init__(self,
                  problem,
                  population,
@@ -50,6 +52,7 @@ moea_awGA_templet : class - 多目标进化优化awGA算法类
         else:
             raise RuntimeError('编码方式必须为''BG''、''RI''或''P''.')
         self.MAXSIZE = population.sizes  # 非支配解集大小限制
+        self.NDSet = None  # 全局非支配种群，在run()中初始化
 
     def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
         # ==========================初始化配置===========================
@@ -61,17 +64,20 @@ moea_awGA_templet : class - 多目标进化优化awGA算法类
             MAXSIZE = 2 * NIND
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
-        population.initChrom(NIND)  # 初始化种群染色体矩阵
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
-        NDSet = updateNDSet(population, problem.maxormins, MAXSIZE)  # 计算适应度和得到全局非支配种群
-        self.evalsNum = population.sizes  # 记录评价次数
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom(NIND)  # 初始化种群染色体矩阵
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            self.NDSet = updateNDSet(population, problem.maxormins, MAXSIZE)  # 计算适应度和得到全局非支配种群
+            self.evalsNum = population.sizes  # 记录评价次数
         # ===========================开始进化============================
         while not self.terminated(population):
-            uniChrom = np.unique(NDSet.Chrom, axis=0)
-            repRate = 1 - uniChrom.shape[0] / NDSet.sizes  # 计算NDSet中的重复率
+            uniChrom = np.unique(self.NDSet.Chrom, axis=0)
+            repRate = 1 - uniChrom.shape[0] / self.NDSet.sizes  # 计算NDSet中的重复率
             # 选择个体去进化形成子代
             offspring = population[ea.selecting(self.selFunc, population.FitnV, NIND)]
             offspring.Chrom = self.recOper.do(offspring.Chrom)  # 重组
@@ -80,9 +86,9 @@ moea_awGA_templet : class - 多目标进化优化awGA算法类
                 offspring.Chrom = self.extraMutOper.do(offspring.Encoding, offspring.Chrom, offspring.Field)  # 执行额外的变异
             self.call_aimFunc(offspring)  # 求进化后个体的目标函数值
             population = population + offspring  # 父代种群和育种种群合并
-            NDSet = updateNDSet(population, problem.maxormins, MAXSIZE, NDSet)  # 计算合并种群的适应度及更新NDSet
+            self.NDSet = updateNDSet(population, problem.maxormins, MAXSIZE, self.NDSet)  # 计算合并种群的适应度及更新NDSet
             # 保留个体到下一代
             population = population[ea.selecting('dup', population.FitnV, NIND)]  # 选择，保留NIND个个体
-        if NDSet.CV is not None:  # CV不为None说明有设置约束条件
-            NDSet = NDSet[np.where(np.all(NDSet.CV <= 0, 1))[0]]  # 最后要彻底排除非可行解
-        return self.finishing(population, NDSet)  # 调用finishing完成后续工作并返回结果
+        if self.NDSet.CV is not None:  # CV不为None说明有设置约束条件
+            self.NDSet = self.NDSet[np.where(np.all(self.NDSet.CV <= 0, 1))[0]]  # 最后要彻底排除非可行解
+        return self.finishing(population, self.NDSet)  # 调用finishing完成后续工作并返回结果
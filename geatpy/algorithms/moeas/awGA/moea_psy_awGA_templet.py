@@ -19,6 +19,8 @@ moea_psy_awGA_templet : class - 多染色体的多目标进化优化awGA算法
         
     """
 
+    stateAttrs = ('NDSet',)  # 采用断点协议，进化循环的状态为种群以及全局非支配种群
+
     def __init__(self,
                  problem,
                  population,
@@ -57,6 +59,7 @@ moea_psy_awGA_templet : class - 多染色体的多目标进化优化awGA算法
             self.mutOpers.append(mutOper)
         self.extraMutOper = ea.Mutgau(Pm=1 / self.problem.Dim, Sigma3=False, Middle=False)  # 额外生成一个高斯变异算子对象，对标准差放大3倍
         self.MAXSIZE = population.sizes  # 非支配解集大小限制
+        self.NDSet = None  # 全局非支配种群，在run()中初始化
 
     def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
         # ==========================初始化配置===========================
@@ -68,21 +71,24 @@ moea_psy_awGA_templet : class - 多染色体的多目标进化优化awGA算法
             MAXSIZE = 2 * NIND
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
-        population.initChrom(NIND)  # 初始化种群染色体矩阵
-        self.call_aimFunc(population)  # 计算种群的目标函数值
-        NDSet = updateNDSet(population, problem.maxormins, MAXSIZE)  # 计算适应度和得到全局非支配种群
-        self.evalsNum = population.sizes  # 记录评价次数
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查，故应确保prophetPop是一个种群类且拥有合法的Chrom、ObjV、Phen等属性）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom(NIND)  # 初始化种群染色体矩阵
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            self.NDSet = updateNDSet(population, problem.maxormins, MAXSIZE)  # 计算适应度和得到全局非支配种群
+            self.evalsNum = population.sizes  # 记录评价次数
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查，故应确保prophetPop是一个种群类且拥有合法的Chrom、ObjV、Phen等属性）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
         # ===========================开始进化============================
         while not self.terminated(population):
             # 选择个体去进化形成子代
             offspring = population[ea.selecting(self.selFunc, population.FitnV, NIND)]
             # 进行进化操作，分别对各个种群染色体矩阵进行重组和变异
             for i in range(population.ChromNum):
-                uniChrom = np.unique(NDSet.Chroms[i], axis=0)
-                repRate = 1 - uniChrom.shape[0] / NDSet.sizes  # 计算NDSet中的重复率
+                uniChrom = np.unique(self.NDSet.Chroms[i], axis=0)
+                repRate = 1 - uniChrom.shape[0] / self.NDSet.sizes  # 计算NDSet中的重复率
                 offspring.Chroms[i] = self.recOpers[i].do(offspring.Chroms[i])  # 重组
                 offspring.Chroms[i] = self.mutOpers[i].do(offspring.Encodings[i], offspring.Chroms[i],
                                                           offspring.Fields[i])  # 变异
@@ -92,9 +98,9 @@ moea_psy_awGA_templet : class - 多染色体的多目标进化优化awGA算法
             self.call_aimFunc(offspring)  # 求进化后个体的目标函数值
             # 父代种群和育种种群合并
             population = population + offspring
-            NDSet = updateNDSet(population, problem.maxormins, MAXSIZE, NDSet)  # 计算合并种群的适应度及更新NDSet
+            self.NDSet = updateNDSet(population, problem.maxormins, MAXSIZE, self.NDSet)  # 计算合并种群的适应度及更新NDSet
             # 保留个体到下一代
             population = population[ea.selecting('dup', population.FitnV, NIND)]  # 选择，保留NIND个个体
-        if NDSet.CV is not None:  # CV不为None说明有设置约束条件
-            NDSet = NDSet[np.where(np.all(NDSet.CV <= 0, 1))[0]]  # 最后要彻底排除非可行解
-        return self.finishing(population, NDSet)  # 调用finishing完成后续工作并返回结果
+        if self.NDSet.CV is not None:  # CV不为None说明有设置约束条件
+            self.NDSet = self.NDSet[np.where(np.all(self.NDSet.CV <= 0, 1))[0]]  # 最后要彻底排除非可行解
+        return self.finishing(population, self.NDSet)  # 调用finishing完成后续工作并返回结果
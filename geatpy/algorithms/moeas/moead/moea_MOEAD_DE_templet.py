@@ -18,6 +18,8 @@ moea_MOEAD_DE_templet : class - 多目标进化MOEA/D-DE算法类（采用可行
     
     """
 
+    stateAttrs = ('idealPoint',)  # 采用断点协议，进化循环的状态为种群以及理想点
+
     def __init__(self,
                  problem,
                  population,
@@ -49,6 +51,7 @@ moea_MOEAD_DE_templet : class - 多目标进化MOEA/D-DE算法类（采用可行
             self.decomposition = ea.pbi  # 采用pbi权重聚合法
         self.Ps = 0.9  # (Probability of Selection)表示进化时有多大的概率只从邻域中选择个体参与进化
         self.Nr = 2  # MOEAD-DE中的参数nr，默认为2
+        self.idealPoint = None  # 理想点，在run()中初始化
 
     def reinsertion(self, indices, population, offspring, idealPoint, referPoint):
 
@@ -71,11 +74,16 @@ moea_MOEAD_DE_templet : class - 多目标进化MOEA/D-DE算法类（采用可行
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
         uniformPoint, NIND = ea.crtup(self.problem.M, population.sizes)  # 生成在单位目标维度上均匀分布的参考点集
-        population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            # 计算理想点
+            self.idealPoint = ea.crtidp(population.ObjV, population.CV, self.problem.maxormins)
         # 确定邻域大小
         if self.neighborSize is None:
             self.neighborSize = population.sizes // 10
@@ -86,12 +94,10 @@ moea_MOEAD_DE_templet : class - 多目标进化MOEA/D-DE算法类（采用可行
         for i in range(population.sizes):
             neighborIdx_list.append(neighborIdx[i, :])
         offspring = ea.Population(population.Encoding, population.Field, 1)  # 实例化一个种群对象用于存储进化的后代（每一代只进化生成一个后代）
-        # 计算理想点
-        idealPoint = ea.crtidp(population.ObjV, population.CV, self.problem.maxormins)
         # ===========================开始进化============================
         while not self.terminated(population):
-            select_rands = np.random.rand(population.sizes)  # 生成一组随机数
-            Masks = np.random.rand(population.sizes, population.Lind) < self.Cr
+            select_rands = self.rng.random(population.sizes)  # 生成一组随机数
+            Masks = self.rng.random((population.sizes, population.Lind)) < self.Cr
             for i in range(population.sizes):
                 if select_rands[i] < self.Ps:
                     indices = neighborIdx_list[i]
@@ -106,7 +112,7 @@ moea_MOEAD_DE_templet : class - 多目标进化MOEA/D-DE算法类（采用可行
                 offspring.Chrom = self.mutOper.do(offspring.Encoding, offspring.Chrom, offspring.Field)  # 多项式变异
                 self.call_aimFunc(offspring)  # 求进化后个体的目标函数值
                 # 更新理想点
-                idealPoint = ea.crtidp(offspring.ObjV, offspring.CV, self.problem.maxormins, idealPoint)
+                self.idealPoint = ea.crtidp(offspring.ObjV, offspring.CV, self.problem.maxormins, self.idealPoint)
                 # 重插入更新种群个体
-                self.reinsertion(indices, population, offspring, idealPoint, uniformPoint)
+                self.reinsertion(indices, population, offspring, self.idealPoint, uniformPoint)
         return self.finishing(population)  # 调用finishing完成后续工作并返回结果
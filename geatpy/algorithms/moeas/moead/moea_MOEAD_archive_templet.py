@@ -17,6 +17,8 @@ moea_MOEAD_archive_templet : class - 带全局存档的多目标进化MOEA/D算
 
     """
 
+    stateAttrs = ('idealPoint', 'globalNDSet')  # 采用断点协议，进化循环的状态为种群、理想点以及全局存档
+
     def __init__(self,
                  problem,
                  population,
@@ -53,6 +55,8 @@ moea_MOEAD_archive_templet : class - 带全局存档的多目标进化MOEA/D算
             self.decomposition = ea.pbi  # 采用pbi权重聚合法
         self.Ps = 0.9  # (Probability of Selection)表示进化时有多大的概率只从邻域中选择个体参与进化
         self.MAXSIZE = None  # 全局非支配解存档的大小限制，这里设为None，表示后面将默认设为10倍的种群个体数
+        self.idealPoint = None  # 理想点，在run()中初始化
+        self.globalNDSet = None  # 全局非支配解存档，在run()中初始化
 
     def reinsertion(self, indices, population, offspring, idealPoint, referPoint):
 
@@ -97,11 +101,20 @@ moea_MOEAD_archive_templet : class - 带全局存档的多目标进化MOEA/D算
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
         uniformPoint, NIND = ea.crtup(self.problem.M, population.sizes)  # 生成在单位目标维度上均匀分布的参考点集
-        population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
+        if self.MAXSIZE is None:
+            self.MAXSIZE = 10 * NIND  # 全局存档的大小限制默认为10倍的种群个体数
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            # 计算理想点
+            self.idealPoint = ea.crtidp(population.ObjV, population.CV, self.problem.maxormins)
+            # 创建全局存档，该全局存档贯穿进化始终，随着进化不断更新
+            self.globalNDSet = self.updateNDSet(population)
         # 确定邻域大小
         if self.neighborSize is None:
             self.neighborSize = population.sizes
@@ -112,15 +125,9 @@ moea_MOEAD_archive_templet : class - 带全局存档的多目标进化MOEA/D算
         for i in range(population.sizes):
             neighborIdx_list.append(neighborIdx[i, :])
         offspring = ea.Population(population.Encoding, population.Field, 1)  # 实例化一个种群对象用于存储进化的后代（每一代只进化生成一个后代）
-        # 计算理想点
-        idealPoint = ea.crtidp(population.ObjV, population.CV, self.problem.maxormins)
-        # 创建全局存档
-        if self.MAXSIZE is None:
-            self.MAXSIZE = 10 * population.sizes  # 默认为10倍的种群个体数
-        globalNDSet = self.updateNDSet(population)  # 创建全局存档，该全局存档贯穿进化始终，随着进化不断更新
         # ===========================开始进化============================
         while not self.terminated(population):
-            select_rands = np.random.rand(population.sizes)  # 生成一组随机数
+            select_rands = self.rng.random(population.sizes)  # 生成一组随机数
             for i in range(population.sizes):
                 indices = neighborIdx_list[i]  # 得到邻居索引
                 if select_rands[i] < self.Ps:
@@ -133,9 +140,9 @@ moea_MOEAD_archive_templet : class - 带全局存档的多目标进化MOEA/D算
                 offspring.Chrom = self.mutOper.do(offspring.Encoding, offspring.Chrom, offspring.Field)  # 变异
                 self.call_aimFunc(offspring)  # 求进化后个体的目标函数值
                 # 更新理想点
-                idealPoint = ea.crtidp(offspring.ObjV, offspring.CV, self.problem.maxormins, idealPoint)
+                self.idealPoint = ea.crtidp(offspring.ObjV, offspring.CV, self.problem.maxormins, self.idealPoint)
                 # 重插入更新种群个体
-                self.reinsertion(indices, population, offspring, idealPoint, uniformPoint)
+                self.reinsertion(indices, population, offspring, self.idealPoint, uniformPoint)
             # 完成当代的进化后，更新全局存档
-            globalNDSet = self.updateNDSet(population, globalNDSet)
-        return self.finishing(population, globalNDSet)  # 调用finishing完成后续工作并返回结果
+            self.globalNDSet = self.updateNDSet(population, self.globalNDSet)
+        return self.finishing(population, self.globalNDSet)  # 调用finishing完成后续工作并返回结果
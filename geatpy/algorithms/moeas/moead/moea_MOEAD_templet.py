@@ -11,6 +11,10 @@ moea_MOEAD_templet : class - 多目标进化MOEA/D算法类（采用可行性法
 算法描述:
     采用MOEA/D（不设全局最优存档）进行多目标优化，算法详见参考文献[1]。
     注：MOEA/D不适合在Python上实现，在Python上，MOEA/D的性能会大幅度降低。
+    为此可以设置batchSize属性来启用批量模式：每次为batchSize个子问题同时生成后代，用一次call_aimFunc()完成评价，
+    然后以向量化的方式完成邻域更新。当多个后代争夺同一个邻居位置时，取在该位置的子问题上聚合函数值最小的后代。
+    注意同一批后代的母体都来自该批开始前的种群，因此批量模式与逐个进化的原始版本并不完全等价。
+    batchSize为None时（默认）采用逐个进化的原始版本。
 
 参考文献:
     [1] Qingfu Zhang, Hui Li. MOEA/D: A Multiobjective Evolutionary Algorithm 
@@ -18,6 +22,8 @@ moea_MOEAD_templet : class - 多目标进化MOEA/D算法类（采用可行性法
 
     """
 
+    stateAttrs = ('idealPoint',)  # 采用断点协议，进化循环的状态为种群以及理想点
+
     def __init__(self,
                  problem,
                  population,
@@ -53,6 +59,8 @@ moea_MOEAD_templet : class - 多目标进化MOEA/D算法类（采用可行性法
         else:
             self.decomposition = ea.pbi  # 采用pbi权重聚合法
         self.Ps = 0.9  # (Probability of Selection)表示进化时有多大的概率只从邻域中选择个体参与进化
+        self.batchSize = None  # 批量模式下每批同时进化的子问题数目，设置为种群规模时即整代一起进化；为None时逐个进化
+        self.idealPoint = None  # 理想点，在run()中初始化
 
     def reinsertion(self, indices, population, offspring, idealPoint, referPoint):
 
@@ -69,17 +77,65 @@ moea_MOEAD_templet : class - 多目标进化MOEA/D算法类（采用可行性法
         off_CombinObjV = self.decomposition(offspring.ObjV, weights, idealPoint, offspring.CV, self.problem.maxormins)
         population[indices[np.where(off_CombinObjV <= CombinObjV)[0]]] = offspring
 
+    def batchSelection(self, subIdx, neighborIdx, NIND):
+
+        """
+        描述:
+            批量地为subIdx中的各个子问题选择2个不同的母体，返回两个母体索引向量。
+            以概率Ps只从子问题的邻域中选择，否则从整个种群中选择。
+
+        """
+
+        batchSize = len(subIdx)
+        neighborSize = neighborIdx.shape[1]
+        inNeighbor = self.rng.random(batchSize) < self.Ps
+        poolSizes = np.where(inNeighbor, neighborSize, NIND)  # 各子问题的候选母体数目
+        first = (self.rng.random(batchSize) * poolSizes).astype(int)
+        second = (self.rng.random(batchSize) * (poolSizes - 1)).astype(int)
+        second += second >= first  # 确保两个母体互不相同
+        chooseIdx1 = np.where(inNeighbor, neighborIdx[subIdx, np.minimum(first, neighborSize - 1)], first)
+        chooseIdx2 = np.where(inNeighbor, neighborIdx[subIdx, np.minimum(second, neighborSize - 1)], second)
+        return chooseIdx1, chooseIdx2
+
+    def batchReinsertion(self, subIdx, neighborIdx, population, offspring, idealPoint, referPoint):
+
+        """
+        描述:
+            批量重插入更新种群个体。第k个后代是由子问题subIdx[k]产生的，它尝试替换该子问题邻域中的个体；
+            当多个后代都能替换同一个个体时，取在该个体对应的子问题上聚合函数值最小的后代。
+
+        """
+
+        offIdx = np.repeat(np.arange(offspring.sizes), neighborIdx.shape[1])  # 各(后代, 邻居)配对中后代的索引
+        popIdx = neighborIdx[subIdx, :].reshape(-1)  # 各(后代, 邻居)配对中邻居的索引
+        CombinObjV = self.decomposition(population.ObjV[popIdx, :], referPoint[popIdx, :], idealPoint,
+                                        population.CV[popIdx, :] if population.CV is not None else None,
+                                        self.problem.maxormins).reshape(-1)
+        off_CombinObjV = self.decomposition(offspring.ObjV[offIdx, :], referPoint[popIdx, :], idealPoint,
+                                            offspring.CV[offIdx, :] if offspring.CV is not None else None,
+                                            self.problem.maxormins).reshape(-1)
+        better = np.where(off_CombinObjV <= CombinObjV)[0]
+        better = better[np.lexsort((off_CombinObjV[better], popIdx[better]))]  # 按邻居索引、聚合函数值排序
+        replaceIdx, first = np.unique(popIdx[better], return_index=True)  # 每个邻居只取聚合函数值最小的后代
+        if len(replaceIdx) > 0:
+            population[replaceIdx] = offspring[offIdx[better[first]]]
+
     def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
         # ==========================初始化配置===========================
         population = self.population
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
         uniformPoint, NIND = ea.crtup(self.problem.M, population.sizes)  # 生成在单位目标维度上均匀分布的参考点集
-        population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            # 计算理想点
+            self.idealPoint = ea.crtidp(population.ObjV, population.CV, self.problem.maxormins)
         # 确定邻域大小
         if self.neighborSize is None:
             self.neighborSize = population.sizes
@@ -90,11 +146,27 @@ moea_MOEAD_templet : class - 多目标进化MOEA/D算法类（采用可行性法
         for i in range(population.sizes):
             neighborIdx_list.append(neighborIdx[i, :])
         offspring = ea.Population(population.Encoding, population.Field, 1)  # 实例化一个种群对象用于存储进化的后代（每一代只进化生成一个后代）
-        # 计算理想点
-        idealPoint = ea.crtidp(population.ObjV, population.CV, self.problem.maxormins)
         # ===========================开始进化============================
         while not self.terminated(population):
-            select_rands = np.random.rand(population.sizes)  # 生成一组随机数
+            if self.batchSize is not None:
+                for start in range(0, population.sizes, max(self.batchSize, 1)):
+                    subIdx = np.arange(start, min(start + max(self.batchSize, 1), population.sizes))
+                    chooseIdx1, chooseIdx2 = self.batchSelection(subIdx, neighborIdx, population.sizes)
+                    batchOffspring = ea.Population(population.Encoding, population.Field, len(subIdx))
+                    # 前一半与后一半染色体一一配对进行重组，每对产生一个后代
+                    batchOffspring.Chrom = self.recOper.do(np.vstack([population.Chrom[chooseIdx1, :],
+                                                                      population.Chrom[chooseIdx2, :]]))
+                    batchOffspring.Chrom = self.mutOper.do(batchOffspring.Encoding, batchOffspring.Chrom,
+                                                           batchOffspring.Field)  # 变异
+                    self.call_aimFunc(batchOffspring)  # 一次性求整批后代的目标函数值
+                    # 更新理想点
+                    self.idealPoint = ea.crtidp(batchOffspring.ObjV, batchOffspring.CV, self.problem.maxormins,
+                                                self.idealPoint)
+                    # 批量重插入更新种群个体
+                    self.batchReinsertion(subIdx, neighborIdx, population, batchOffspring, self.idealPoint,
+                                          uniformPoint)
+                continue
+            select_rands = self.rng.random(population.sizes)  # 生成一组随机数
             for i in range(population.sizes):
                 indices = neighborIdx_list[i]  # 得到邻居索引
                 if select_rands[i] < self.Ps:
@@ -107,7 +179,7 @@ moea_MOEAD_templet : class - 多目标进化MOEA/D算法类（采用可行性法
                 offspring.Chrom = self.mutOper.do(offspring.Encoding, offspring.Chrom, offspring.Field)  # 变异
                 self.call_aimFunc(offspring)  # 求进化后个体的目标函数值
                 # 更新理想点
-                idealPoint = ea.crtidp(offspring.ObjV, offspring.CV, self.problem.maxormins, idealPoint)
+                self.idealPoint = ea.crtidp(offspring.ObjV, offspring.CV, self.problem.maxormins, self.idealPoint)
                 # 重插入更新种群个体
-                self.reinsertion(indices, population, offspring, idealPoint, uniformPoint)
+                self.reinsertion(indices, population, offspring, self.idealPoint, uniformPoint)
         return self.finishing(population)  # 调用finishing完成后续工作并返回结果
@@ -14,6 +14,8 @@ moea_psy_NSGA2_archive_templet : class - 带全局存档的多染色体多目标
     
     """
 
+    stateAttrs = ('globalNDSet',)  # 采用断点协议，进化循环的状态为种群以及全局存档
+
     def __init__(self,
                  problem,
                  population,
@@ -55,6 +57,7 @@ moea_psy_NSGA2_archive_templet : class - 带全局存档的多染色体多目标
             self.recOpers.append(recOper)
             self.mutOpers.append(mutOper)
         self.MAXSIZE = 10 * population.sizes  # 全局非支配解存档的大小限制，默认为10倍的种群个体数
+        self.globalNDSet = None  # 全局非支配解存档，在run()中初始化
 
     def reinsertion(self, population, offspring, NUM, globalNDSet):
 
@@ -89,17 +92,20 @@ moea_psy_NSGA2_archive_templet : class - 带全局存档的多染色体多目标
         NIND = population.sizes
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
-        population.initChrom()  # 初始化种群染色体矩阵
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
-        [levels, criLevel] = self.ndSort(population.ObjV, NIND, None, population.CV,
-                                         self.problem.maxormins)  # 对NIND个个体进行非支配分层
-        population.FitnV = (1 / levels).reshape(-1, 1)  # 直接根据levels来计算初代个体的适应度
-        globalNDSet = population[np.where(levels == 1)[0]]  # 创建全局存档，该全局存档贯穿进化始终，随着进化不断更新
-        if globalNDSet.CV is not None:  # CV不为None说明有设置约束条件
-            globalNDSet = globalNDSet[np.where(np.all(globalNDSet.CV <= 0, 1))[0]]  # 排除非可行解
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom()  # 初始化种群染色体矩阵
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            [levels, criLevel] = self.ndSort(population.ObjV, NIND, None, population.CV,
+                                             self.problem.maxormins)  # 对NIND个个体进行非支配分层
+            population.FitnV = (1 / levels).reshape(-1, 1)  # 直接根据levels来计算初代个体的适应度
+            self.globalNDSet = population[np.where(levels == 1)[0]]  # 创建全局存档，该全局存档贯穿进化始终，随着进化不断更新
+            if self.globalNDSet.CV is not None:  # CV不为None说明有设置约束条件
+                self.globalNDSet = self.globalNDSet[np.where(np.all(self.globalNDSet.CV <= 0, 1))[0]]  # 排除非可行解
         # ===========================开始进化============================
         while not self.terminated(population):
             # 选择个体参与进化
@@ -110,5 +116,6 @@ moea_psy_NSGA2_archive_templet : class - 带全局存档的多染色体多目标
                 offspring.Chroms[i] = self.mutOpers[i].do(offspring.Encodings[i], offspring.Chroms[i],
                                                           offspring.Fields[i])  # 变异
             self.call_aimFunc(offspring)  # 求进化后个体的目标函数值
-            population, globalNDSet = self.reinsertion(population, offspring, NIND, globalNDSet)  # 重插入生成新一代种群，同时更新全局存档
-        return self.finishing(population, globalNDSet)  # 调用finishing完成后续工作并返回结果
+            # 重插入生成新一代种群，同时更新全局存档
+            population, self.globalNDSet = self.reinsertion(population, offspring, NIND, self.globalNDSet)
+        return self.finishing(population, self.globalNDSet)  # 调用finishing完成后续工作并返回结果
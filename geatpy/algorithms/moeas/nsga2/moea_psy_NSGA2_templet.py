@@ -19,6 +19,8 @@ moea_psy_NSGA2_templet : class - 多染色体的多目标进化NSGA-II算法类
 
     """
 
+    stateAttrs = ()  # 采用断点协议，进化循环中除种群以外没有其他状态
+
     def __init__(self,
                  problem,
                  population,
@@ -72,14 +74,14 @@ moea_psy_NSGA2_templet : class - 多染色体的多目标进化NSGA-II算法类
         """
 
         # 父子两代合并
-        population = population + offspring
+        population += offspring
         # 选择个体保留到下一代
         [levels, criLevel] = self.ndSort(population.ObjV, NUM, None, population.CV,
                                          self.problem.maxormins)  # 对NUM个个体进行非支配分层
         dis = ea.crowdis(population.ObjV, levels)  # 计算拥挤距离
         population.FitnV[:, 0] = np.argsort(np.lexsort(np.array([dis, -levels])), kind='mergesort')  # 计算适应度
         chooseFlag = ea.selecting('dup', population.FitnV, NUM)  # 调用低级选择算子dup进行基于适应度排序的选择，保留NUM个个体
-        return population[chooseFlag]
+        return population.keep(chooseFlag)
 
     def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
         # ==========================初始化配置===========================
@@ -87,14 +89,18 @@ moea_psy_NSGA2_templet : class - 多染色体的多目标进化NSGA-II算法类
         NIND = population.sizes
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
-        population.initChrom()  # 初始化种群染色体矩阵
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
-        [levels, criLevel] = self.ndSort(population.ObjV, NIND, None, population.CV,
-                                         self.problem.maxormins)  # 对NIND个个体进行非支配分层
-        population.FitnV = (1 / levels).reshape(-1, 1)  # 直接根据levels来计算初代个体的适应度
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom()  # 初始化种群染色体矩阵
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            [levels, criLevel] = self.ndSort(population.ObjV, NIND, None, population.CV,
+                                             self.problem.maxormins)  # 对NIND个个体进行非支配分层
+            population.FitnV = (1 / levels).reshape(-1, 1)  # 直接根据levels来计算初代个体的适应度
+            population.reserve(2 * NIND)  # 预分配父子合并所需的存储空间，使合并与选择都在原地进行
         # ===========================开始进化============================
         while not self.terminated(population):
             # 选择个体参与进化
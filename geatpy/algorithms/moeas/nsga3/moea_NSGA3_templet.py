@@ -18,6 +18,8 @@ moea_NSGA3_templet : class - 多目标进化优化NSGA-III算法类
     
     """
 
+    stateAttrs = ()  # 采用断点协议，进化循环中除种群以外没有其他状态
+
     def __init__(self,
                  problem,
                  population,
@@ -62,13 +64,13 @@ moea_NSGA3_templet : class - 多目标进化优化NSGA-III算法类
         """
 
         # 父子两代合并
-        population = population + offspring
+        population += offspring
         # 选择个体保留到下一代
         [levels, criLevel] = self.ndSort(population.ObjV, NUM, None, population.CV,
                                          self.problem.maxormins)  # 对NUM个个体进行非支配分层
         chooseFlag = ea.refselect(population.ObjV, levels, criLevel, NUM, uniformPoint,
                                   self.problem.maxormins)  # 根据参考点的“入龛”个体筛选
-        return population[chooseFlag]
+        return population.keep(chooseFlag)
 
     def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
         # ==========================初始化配置===========================
@@ -76,11 +78,15 @@ moea_NSGA3_templet : class - 多目标进化优化NSGA-III算法类
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
         uniformPoint, NIND = ea.crtup(self.problem.M, population.sizes)  # 生成在单位目标维度上均匀分布的参考点集
-        population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            population.reserve(2 * NIND)  # 预分配父子合并所需的存储空间，使合并与选择都在原地进行
         # ===========================开始进化============================
         while not self.terminated(population):
             # 选择个体参与进化
@@ -10,6 +10,11 @@ moea_PPS_MOEAD_DE_archive_templet : class - 基于pps策略的带全局存档的
 算法描述:
     采用PPS-MOEA/D-DE进行多目标优化，PPS策略详见参考文献[1]，
     注：MOEA/D不适合在Python上实现，在Python上，MOEA/D的性能会大幅度降低。
+    为此可以设置batchSize属性来启用批量模式：每次为batchSize个子问题同时生成DE试验向量，用一次call_aimFunc()完成评价，
+    然后以向量化的方式完成push stage或pull stage的重插入。每个后代仍最多替换Nr个个体；
+    当多个后代都能替换同一个个体时，取违反约束程度超出epsilon_k的部分最小、其次聚合函数值最小的后代。
+    同一批后代都基于该批开始前的种群产生，因此批量模式与逐个进化的原始版本并不完全等价。
+    batchSize为None时（默认）采用逐个进化的原始版本。
 
 参考文献:
     [1] Zhun Fan, Wenji Li, Xinye Cai*, Hui Li, Caimin Wei, Qingfu Zhang, 
@@ -19,6 +24,9 @@ moea_PPS_MOEAD_DE_archive_templet : class - 基于pps策略的带全局存档的
     
     """
 
+    stateAttrs = ('pushStage', 'rk', 'epsilon_k', 'epsilon_0', 'idealPoints', 'nadirPoints', 'idealPoint',
+                  'globalNDSet')  # 采用断点协议，进化循环的状态为种群、push/pull阶段的参数、历代的理想点和反理想点以及全局存档
+
     def __init__(self,
                  problem,
                  population,
@@ -50,6 +58,7 @@ moea_PPS_MOEAD_DE_archive_templet : class - 基于pps策略的带全局存档的
             self.decomposition = ea.pbi  # 采用pbi权重聚合法
         self.Ps = 0.9  # (Probability of Selection)表示进化时有多大的概率只从邻域中选择个体参与进化
         self.Nr = 2  # MOEAD-DE中的参数nr，默认为2
+        self.batchSize = None  # 批量模式下每批同时进化的子问题数目，设置为种群规模时即整代一起进化；为None时逐个进化
         self.MAXSIZE = population.sizes  # 全局非支配解存档的大小限制，这里设为等于初始设定的种群个体数
         # PPS策略的一些需要设置的参数
         self.Tc = 0.8  # 论文中的Tc，这里暂设为0.8，在run()函数中它将乘上MAXGEN
@@ -58,6 +67,15 @@ moea_PPS_MOEAD_DE_archive_templet : class - 基于pps策略的带全局存档的
         self.alpha = 0.95  # 论文中的α
         self.tao = 0.1  # 论文中的𝜏
         self.cp = 2  # 论文中的cp
+        # 进化循环的状态，在run()中初始化
+        self.pushStage = None  # 是否处于push stage
+        self.rk = None  # 论文中的rk
+        self.epsilon_k = None  # 论文中的𝜀(k)
+        self.epsilon_0 = None  # 论文中的𝜀(0)
+        self.idealPoints = None  # 存储历代的理想点的列表
+        self.nadirPoints = None  # 存储历代的反理想点的列表
+        self.idealPoint = None  # 理想点
+        self.globalNDSet = None  # 全局非支配解存档
 
     def create_offspring(self, population, Xr0, select_rand, Mask, neighbor_index, idealPoint):
 
@@ -83,6 +101,77 @@ moea_PPS_MOEAD_DE_archive_templet : class - 基于pps策略的带全局存档的
         idealPoint = ea.crtidp(offspring.ObjV, maxormins=self.problem.maxormins, old_idealPoint=idealPoint)
         return offspring, indices, idealPoint
 
+    def create_offspring_batch(self, population, subIdx, select_rands, Masks, neighborIdx, idealPoint):
+
+        """
+        描述:
+            create_offspring()的批量版本，一次性为subIdx中的各个子问题产生子代个体，求其目标函数值并更新理想点。
+            select_rands和Masks是与subIdx一一对应的随机数和交叉掩码。返回的inNeighbor表示各后代是否只在邻域中进化。
+
+        """
+
+        batchSize = len(subIdx)
+        neighborSize = neighborIdx.shape[1]
+        inNeighbor = select_rands < self.Ps
+        poolSizes = np.where(inNeighbor, neighborSize, population.sizes)  # 各子问题的候选个体数目
+        first = (self.rng.random(batchSize) * poolSizes).astype(int)
+        second = (self.rng.random(batchSize) * (poolSizes - 1)).astype(int)
+        second += second >= first  # 确保差分向量的两个索引互不相同
+        r1 = np.where(inNeighbor, neighborIdx[subIdx, np.minimum(first, neighborSize - 1)], first)
+        r2 = np.where(inNeighbor, neighborIdx[subIdx, np.minimum(second, neighborSize - 1)], second)
+        offspring = ea.Population(population.Encoding, population.Field, batchSize)  # 实例化一个种群对象用于存储这一批后代
+        offspring.Chrom = population.Chrom[subIdx, :] + self.F * Masks * (
+                    population.Chrom[r1, :] - population.Chrom[r2, :])
+        offspring.Chrom = self.mutOper.do(offspring.Encoding, offspring.Chrom, offspring.Field)  # 多项式变异
+        self.call_aimFunc(offspring)  # 一次性求整批后代的目标函数值
+        # 更新理想点
+        idealPoint = ea.crtidp(offspring.ObjV, maxormins=self.problem.maxormins, old_idealPoint=idealPoint)
+        return offspring, inNeighbor, idealPoint
+
+    def batch_reinsertion(self, subIdx, inNeighbor, neighborIdx, population, offspring, idealPoint, referPoint,
+                          epsilon_k=None):
+
+        """
+        描述:
+            push_stage_reinsertion()和pull_stage_reinsertion()的批量版本，epsilon_k为None时表示push stage。
+            第k个后代的替换范围是子问题subIdx[k]的邻域（inNeighbor[k]为True时）或整个种群。
+
+        """
+
+        NIND = population.sizes
+        nearIdx = np.where(inNeighbor)[0]
+        farIdx = np.where(~inNeighbor)[0]
+        # 生成所有(后代, 待替换个体)配对，按后代分组，组内保持与逐个进化时相同的个体顺序
+        offIdx = np.concatenate([np.repeat(nearIdx, neighborIdx.shape[1]), np.repeat(farIdx, NIND)])
+        popIdx = np.concatenate([neighborIdx[subIdx[nearIdx], :].reshape(-1), np.tile(np.arange(NIND), len(farIdx))])
+        order = np.argsort(offIdx, kind='mergesort')
+        offIdx, popIdx = offIdx[order], popIdx[order]
+        weights = referPoint[popIdx, :]
+        CombinObjV = self.decomposition(population.ObjV[popIdx, :], weights, idealPoint,
+                                        maxormins=self.problem.maxormins).reshape(-1)
+        off_CombinObjV = self.decomposition(offspring.ObjV[offIdx, :], weights, idealPoint,
+                                            maxormins=self.problem.maxormins).reshape(-1)
+        if epsilon_k is None:
+            replace = off_CombinObjV <= CombinObjV
+            priority = np.zeros(len(offIdx))
+        else:
+            Violation = ea.mergecv(population.CV[popIdx, :] if population.CV is not None else np.zeros(
+                (len(popIdx), 1))).reshape(-1)
+            off_Violation = ea.mergecv(offspring.CV[offIdx, :] if population.CV is not None else np.zeros(
+                (len(offIdx), 1))).reshape(-1)
+            replace = (off_CombinObjV <= CombinObjV) & ((Violation <= epsilon_k) & (off_Violation <= epsilon_k) | (
+                    Violation == off_Violation)) | (off_Violation < Violation)
+            priority = np.maximum(off_Violation - epsilon_k, 0)
+        better = np.where(replace)[0]
+        # 每个后代最多替换Nr个个体
+        _, starts, counts = np.unique(offIdx[better], return_index=True, return_counts=True)
+        better = better[np.arange(len(better)) - np.repeat(starts, counts) < self.Nr]
+        # 多个后代争夺同一个体时，取违反约束程度超出epsilon_k的部分最小、其次聚合函数值最小的后代
+        better = better[np.lexsort((off_CombinObjV[better], priority[better], popIdx[better]))]
+        replaceIdx, first = np.unique(popIdx[better], return_index=True)
+        if len(replaceIdx) > 0:
+            population[replaceIdx] = offspring[offIdx[better[first]]]
+
     def push_stage_reinsertion(self, indices, population, offspring, idealPoint, referPoint):
 
         """
@@ -116,6 +205,38 @@ moea_PPS_MOEAD_DE_archive_templet : class - 基于pps策略的带全局存档的
                                                  Violation == off_Violation)) |
                                      (off_Violation < Violation))[0]])[:self.Nr]] = offspring
 
+    def updateEpsilon(self, population, delta):
+
+        """
+        描述:
+            在每一代开始时更新rk、epsilon_k，并判断是否从push stage切换到pull stage。
+            delta为避免分母为0而设的小量。
+
+        """
+
+        if self.currentGen < self.Tc:
+            # 更新rk
+            if self.currentGen >= self.LastLGen:
+                past_gen = self.currentGen - self.LastLGen
+                idealPoints, nadirPoints = self.idealPoints, self.nadirPoints
+                self.rk = np.max(
+                    [np.abs((idealPoints[-1] - idealPoints[past_gen]) / np.max([idealPoints[past_gen], delta], 0)),
+                     np.abs((nadirPoints[-1] - nadirPoints[past_gen]) / np.max([nadirPoints[past_gen], delta], 0))])
+            violation, count = ea.mergecv(
+                population.CV if population.CV is not None else np.zeros((population.sizes, 1)), return_count=True)
+            if self.rk <= self.varient_epsilon and self.pushStage:
+                self.epsilon_0 = np.max(violation)
+                self.epsilon_k = self.epsilon_0
+                self.pushStage = False
+            if not self.pushStage:
+                rf = count / population.sizes
+                if rf < self.alpha:
+                    self.epsilon_k *= (1 - self.tao)
+                else:
+                    self.epsilon_k = (1 - self.currentGen / self.Tc) ** self.cp * self.epsilon_0
+        else:
+            self.epsilon_k = 0
+
     def updateNDSet(self, population, globalNDSet=None):
 
         """
@@ -143,77 +264,72 @@ moea_PPS_MOEAD_DE_archive_templet : class - 基于pps策略的带全局存档的
         # ==========================初始化配置===========================
         population = self.population
         self.initialization()  # 初始化算法类的一些动态参数
-        pushStage = True  # 一开始是push stage
-        rk = 1.0  # 论文中的rk，k的含义在论文中是代数，这里保留名称不作变化，下同
-        epsilon_k = 0  # 论文中的𝜀(k)
-        epsilon_0 = 0  # 论文中的𝜀(0)
-        idealPoints = []  # 存储历代的理想点的列表
-        nadirPoints = []  # 存储历代的反理想点的列表
         delta = np.array([1e-6] * self.problem.M)  # 论文中为了避免分母为0而设的delta
         self.Tc *= self.MAXGEN
         self.LastLGen = min(self.LastLGen, self.MAXGEN)
         # ===========================准备进化============================
         uniformPoint, NIND = ea.crtup(self.problem.M, population.sizes)  # 生成在单位目标维度上均匀分布的参考点集
-        population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            self.pushStage = True  # 一开始是push stage
+            self.rk = 1.0  # 论文中的rk，k的含义在论文中是代数，这里保留名称不作变化，下同
+            self.epsilon_k = 0  # 论文中的𝜀(k)
+            self.epsilon_0 = 0  # 论文中的𝜀(0)
+            self.idealPoints = []  # 存储历代的理想点的列表
+            self.nadirPoints = []  # 存储历代的反理想点的列表
+            population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            # 计算理想点
+            self.idealPoint = ea.crtidp(population.ObjV, maxormins=self.problem.maxormins)
+            # 创建全局存档
+            self.globalNDSet = self.updateNDSet(population)
         # 确定邻域大小
         if self.neighborSize is None:
             self.neighborSize = population.sizes // 10
         self.neighborSize = max(self.neighborSize, 2)  # 确保不小于2
         # 生成由所有邻居索引组成的矩阵
         neighborIdx = np.argsort(ea.cdist(uniformPoint, uniformPoint), axis=1, kind='mergesort')[:, :self.neighborSize]
-        # 计算理想点
-        idealPoint = ea.crtidp(population.ObjV, maxormins=self.problem.maxormins)
-        # 创建全局存档
-        globalNDSet = self.updateNDSet(population)
         # ===========================开始进化============================
         while not self.terminated(population):
-            idealPoints.append(idealPoint)
-            nadirPoints.append(ea.crtidp(population.ObjV, maxormins=self.problem.maxormins, reverse=True))
-            # 更新epsilon_k
-            if self.currentGen < self.Tc:
-                # 更新rk
-                if self.currentGen >= self.LastLGen:
-                    past_gen = self.currentGen - self.LastLGen
-                    rk = np.max(
-                        [np.abs((idealPoints[-1] - idealPoints[past_gen]) / np.max([idealPoints[past_gen], delta], 0)),
-                         np.abs((nadirPoints[-1] - nadirPoints[past_gen]) / np.max([nadirPoints[past_gen], delta], 0))])
-                violation, count = ea.mergecv(
-                    population.CV if population.CV is not None else np.zeros((population.sizes, 1)), return_count=True)
-                if rk <= self.varient_epsilon and pushStage:
-                    epsilon_0 = np.max(violation)
-                    epsilon_k = epsilon_0
-                    pushStage = False
-                if not pushStage:
-                    rf = count / population.sizes
-                    if rf < self.alpha:
-                        epsilon_k *= (1 - self.tao)
-                    else:
-                        epsilon_k = (1 - self.currentGen / self.Tc) ** self.cp * epsilon_0
-            else:
-                epsilon_k = 0
+            self.idealPoints.append(self.idealPoint)
+            self.nadirPoints.append(ea.crtidp(population.ObjV, maxormins=self.problem.maxormins, reverse=True))
+            self.updateEpsilon(population, delta)  # 更新epsilon_k
             # 分开push stage和pull stage进行进化
-            select_rands = np.random.rand(population.sizes)
-            Masks = np.random.rand(population.sizes, population.Lind) < self.Cr
-            if pushStage:
+            select_rands = self.rng.random(population.sizes)
+            Masks = self.rng.random((population.sizes, population.Lind)) < self.Cr
+            if self.batchSize is not None:
+                for start in range(0, population.sizes, max(self.batchSize, 1)):
+                    subIdx = np.arange(start, min(start + max(self.batchSize, 1), population.sizes))
+                    # 产生一批后代
+                    offspring, inNeighbor, self.idealPoint = self.create_offspring_batch(population, subIdx,
+                                                                                         select_rands[subIdx],
+                                                                                         Masks[subIdx, :], neighborIdx,
+                                                                                         self.idealPoint)
+                    # 批量重插入
+                    self.batch_reinsertion(subIdx, inNeighbor, neighborIdx, population, offspring, self.idealPoint,
+                                           uniformPoint, None if self.pushStage else self.epsilon_k)
+            elif self.pushStage:
                 for i in range(population.sizes):
                     # 产生后代
-                    offspring, indices, idealPoint = self.create_offspring(population, population.Chrom[[i], :],
-                                                                           select_rands[i], Masks[i], neighborIdx[i, :],
-                                                                           idealPoint)
+                    offspring, indices, self.idealPoint = self.create_offspring(population, population.Chrom[[i], :],
+                                                                                select_rands[i], Masks[i],
+                                                                                neighborIdx[i, :], self.idealPoint)
                     # 重插入
-                    self.push_stage_reinsertion(indices, population, offspring, idealPoint, uniformPoint)  # 重插入更新种群个体
+                    self.push_stage_reinsertion(indices, population, offspring, self.idealPoint,
+                                                uniformPoint)  # 重插入更新种群个体
             else:
                 for i in range(population.sizes):
                     # 产生后代
-                    offspring, indices, idealPoint = self.create_offspring(population, population.Chrom[[i], :],
-                                                                           select_rands[i], Masks[i], neighborIdx[i, :],
-                                                                           idealPoint)
+                    offspring, indices, self.idealPoint = self.create_offspring(population, population.Chrom[[i], :],
+                                                                                select_rands[i], Masks[i],
+                                                                                neighborIdx[i, :], self.idealPoint)
                     # 重插入
-                    self.pull_stage_reinsertion(indices, population, offspring, idealPoint, uniformPoint, epsilon_k)
+                    self.pull_stage_reinsertion(indices, population, offspring, self.idealPoint, uniformPoint,
+                                                self.epsilon_k)
             # 完成当代的进化后，更新全局存档
-            globalNDSet = self.updateNDSet(population, globalNDSet)
-        return self.finishing(population, globalNDSet)  # 调用finishing完成后续工作并返回结果
+            self.globalNDSet = self.updateNDSet(population, self.globalNDSet)
+        return self.finishing(population, self.globalNDSet)  # 调用finishing完成后续工作并返回结果
@@ -20,6 +20,8 @@ moea_psy_RVEA_RES_templet : class - 带参考点再生策略的多染色体多
     
     """
 
+    stateAttrs = ('refPoint',)  # 采用断点协议，进化循环的状态为种群以及参考点
+
     def __init__(self,
                  problem,
                  population,
@@ -59,6 +61,7 @@ moea_psy_RVEA_RES_templet : class - 带参考点再生策略的多染色体多
             self.mutOpers.append(mutOper)
         self.a = 2  # RVEA算法中的参数alpha
         self.fr = 0.1  # RVEA算法中的参数fr
+        self.refPoint = None  # 参考点，在run()中初始化
 
     def reinsertion(self, population, offspring, refPoint):
 
@@ -83,7 +86,7 @@ moea_psy_RVEA_RES_templet : class - 带参考点再生策略的多染色体多
         _ObjV = ObjV - np.min(ObjV, 0)
         linkIdx = np.argmax(ea.cdist(_ObjV, refPoint, 'cosine_similarity'), 1)  # 找到与参考点关联的点的索引
         noLinkIdx = list(set(range(refPoint.shape[0])) - set(linkIdx))  # 找到不与参考点关联的点的索引
-        refPoint[noLinkIdx, :] = np.random.rand(len(noLinkIdx), refPoint.shape[1]) * np.max(_ObjV, 0)
+        refPoint[noLinkIdx, :] = self.rng.random((len(noLinkIdx), refPoint.shape[1])) * np.max(_ObjV, 0)
         return refPoint
 
     def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
@@ -92,13 +95,16 @@ moea_psy_RVEA_RES_templet : class - 带参考点再生策略的多染色体多
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
         uniformPoint, NIND = ea.crtup(self.problem.M, population.sizes)  # 生成在单位目标维度上均匀分布的参考点集
-        refPoint = np.vstack([uniformPoint, np.random.rand(NIND, self.problem.M)])  # 初始化参考点（详见注释中的参考文献）
-        population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            print('本算法需谨慎使用先验知识，有可能会导致结果比先验知识差。')
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            self.refPoint = np.vstack([uniformPoint, self.rng.random((NIND, self.problem.M))])  # 初始化参考点（详见注释中的参考文献）
+            population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                print('本算法需谨慎使用先验知识，有可能会导致结果比先验知识差。')
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
         # ===========================开始进化============================
         while not self.terminated(population):
             # 选择个体参与进化
@@ -109,11 +115,11 @@ moea_psy_RVEA_RES_templet : class - 带参考点再生策略的多染色体多
                 offspring.Chroms[i] = self.mutOpers[i].do(offspring.Encodings[i], offspring.Chroms[i],
                                                           offspring.Fields[i])  # 变异
             self.call_aimFunc(offspring)  # 求进化后个体的目标函数值
-            population = self.reinsertion(population, offspring, refPoint)  # 重插入生成新一代种群
+            population = self.reinsertion(population, offspring, self.refPoint)  # 重插入生成新一代种群
             # 修改refPoint
-            refPoint[NIND:, :] = self.renewRefPoint(population.ObjV, refPoint[NIND:, :])
+            self.refPoint[NIND:, :] = self.renewRefPoint(population.ObjV, self.refPoint[NIND:, :])
             if (self.currentGen) % np.ceil(self.fr * self.MAXGEN) == 0:
-                refPoint[:NIND, :] = uniformPoint * (np.max(population.ObjV, 0) - np.min(population.ObjV, 0))
+                self.refPoint[:NIND, :] = uniformPoint * (np.max(population.ObjV, 0) - np.min(population.ObjV, 0))
         # 后续处理，限制种群规模（因为此时种群规模有可能大于NIND）
         [levels, criLevel] = self.ndSort(population.ObjV, NIND, None, population.CV,
                                          self.problem.maxormins)  # 对NIND个个体进行非支配分层
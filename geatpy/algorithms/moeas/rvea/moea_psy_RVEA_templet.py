@@ -19,6 +19,8 @@ moea_psy_RVEA_templet : class - 多染色体多目标进化优化RVEA算法类
     
     """
 
+    stateAttrs = ('refPoint', 'Gamma')  # 采用断点协议，进化循环的状态为种群、参考点以及Gamma
+
     def __init__(self,
                  problem,
                  population,
@@ -57,6 +59,7 @@ moea_psy_RVEA_templet : class - 多染色体多目标进化优化RVEA算法类
             self.mutOpers.append(mutOper)
         self.a = 2  # RVEA算法中的参数alpha
         self.fr = 0.1  # RVEA算法中的参数fr
+        self.refPoint = None  # 参考点，在run()中初始化
         self.Gamma = None  # RVEA算法中的Gamma（详见参考文献的公式10），在每次更新参考点后Gamma要重置为None以便重新计算
 
     def reinsertion(self, population, offspring, refPoint):
@@ -67,12 +70,12 @@ moea_psy_RVEA_templet : class - 多染色体多目标进化优化RVEA算法类
         """
 
         # 父子两代合并
-        population = population + offspring
+        population += offspring
         # 选择个体保留到下一代
         chooseFlag, self.Gamma = ea.refgselect(population.ObjV, refPoint,
                                                self.problem.M * ((self.currentGen + 1) / self.MAXGEN) ** self.a,
                                                population.CV, self.Gamma, self.problem.maxormins)
-        return population[chooseFlag]
+        return population.keep(chooseFlag)
 
     def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
         # ==========================初始化配置===========================
@@ -80,13 +83,17 @@ moea_psy_RVEA_templet : class - 多染色体多目标进化优化RVEA算法类
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
         uniformPoint, NIND = ea.crtup(self.problem.M, population.sizes)  # 生成在单位目标维度上均匀分布的参考点集
-        refPoint = uniformPoint.copy()  # 初始化参考点为uniformPoint
-        population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            print('本算法需谨慎使用先验知识，有可能会导致结果比先验知识差。')
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            self.refPoint = uniformPoint.copy()  # 初始化参考点为uniformPoint
+            population.initChrom(NIND)  # 初始化种群染色体矩阵，此时种群规模将调整为uniformPoint点集的大小，initChrom函数会把种群规模给重置
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                print('本算法需谨慎使用先验知识，有可能会导致结果比先验知识差。')
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            population.reserve(2 * NIND)  # 预分配父子合并所需的存储空间，使合并与选择都在原地进行
         # ===========================开始进化============================
         while not self.terminated(population):
             # 选择个体参与进化
@@ -97,9 +104,9 @@ moea_psy_RVEA_templet : class - 多染色体多目标进化优化RVEA算法类
                 offspring.Chroms[i] = self.mutOpers[i].do(offspring.Encodings[i], offspring.Chroms[i],
                                                           offspring.Fields[i])  # 变异
             self.call_aimFunc(offspring)  # 求进化后个体的目标函数值
-            population = self.reinsertion(population, offspring, refPoint)  # 重插入生成新一代种群
+            population = self.reinsertion(population, offspring, self.refPoint)  # 重插入生成新一代种群
             # 修改refPoint
             if (self.currentGen) % np.ceil(self.fr * self.MAXGEN) == 0:
-                refPoint = uniformPoint * (np.max(population.ObjV, 0) - np.min(population.ObjV, 0))
+                self.refPoint = uniformPoint * (np.max(population.ObjV, 0) - np.min(population.ObjV, 0))
                 self.Gamma = None  # 重置Gamma为None
         return self.finishing(population)  # 调用finishing完成后续工作并返回结果
@@ -24,6 +24,8 @@ class soea_DE_best_1_bin_templet(ea.SoeaAlgorithm):
 
     """
 
+    stateAttrs = ()  # 采用断点协议，进化循环中除种群以外没有其他状态
+
     def __init__(self,
                  problem,
                  population,
@@ -72,14 +74,18 @@ class soea_DE_best_1_bin_templet(ea.SoeaAlgorithm):
         NIND = population.sizes
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
-        population.initChrom(NIND)  # 初始化种群染色体矩阵
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
-        population.FitnV = ea.scaling(population.ObjV,
-                                      population.CV,
-                                      self.problem.maxormins)  # 计算适应度
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom(NIND)  # 初始化种群染色体矩阵
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            population.FitnV = ea.scaling(population.ObjV,
+                                          population.CV,
+                                          self.problem.maxormins)  # 计算适应度
+            population.reserve(2 * NIND)  # 预分配父子合并所需的存储空间，使合并与选择都在原地进行
         # ===========================开始进化============================
         while not self.terminated(population):
             # 进行差分进化操作
@@ -93,11 +99,11 @@ class soea_DE_best_1_bin_templet(ea.SoeaAlgorithm):
             experimentPop.Chrom = self.recOper.do(
                 np.vstack([population.Chrom, experimentPop.Chrom]))  # 重组
             self.call_aimFunc(experimentPop)  # 计算目标函数值
-            tempPop = population + experimentPop  # 临时合并，以调用otos进行一对一生存者选择
-            tempPop.FitnV = ea.scaling(tempPop.ObjV,
-                                       tempPop.CV,
-                                       self.problem.maxormins)  # 计算适应度
-            population = tempPop[ea.selecting(
-                'otos', tempPop.FitnV,
-                NIND)]  # 采用One-to-One Survivor选择，产生新一代种群
+            population += experimentPop  # 临时合并，以调用otos进行一对一生存者选择
+            population.FitnV = ea.scaling(population.ObjV,
+                                          population.CV,
+                                          self.problem.maxormins)  # 计算适应度
+            population.keep(ea.selecting(
+                'otos', population.FitnV,
+                NIND))  # 采用One-to-One Survivor选择，产生新一代种群
         return self.finishing(population)  # 调用finishing完成后续工作并返回结果
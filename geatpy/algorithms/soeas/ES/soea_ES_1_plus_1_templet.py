@@ -26,6 +26,8 @@ class soea_ES_1_plus_1_templet(ea.SoeaAlgorithm):
 
     """
 
+    stateAttrs = ('Sigma3',)  # 采用断点协议，进化循环的状态为种群以及高斯变异的Sigma3
+
     def __init__(self,
                  problem,
                  population,
@@ -62,6 +64,7 @@ class soea_ES_1_plus_1_templet(ea.SoeaAlgorithm):
             raise RuntimeError('编码方式必须为'
                                'RI'
                                '.')
+        self.Sigma3 = None  # 高斯变异算子的Sigma3，在run()中初始化
 
     def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
         # ==========================初始化配置===========================
@@ -69,16 +72,18 @@ class soea_ES_1_plus_1_templet(ea.SoeaAlgorithm):
         NIND = population.sizes
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
-        population.initChrom(NIND)  # 初始化种群染色体矩阵
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
-        population.FitnV = ea.scaling(population.ObjV,
-                                      population.CV,
-                                      self.problem.maxormins)  # 计算适应度
-        Sigma3 = 0.5 * (population.Field[1, :] - population.Field[0, :]
-                        )  # 初始化高斯变异算子的Sigma3
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom(NIND)  # 初始化种群染色体矩阵
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            population.FitnV = ea.scaling(population.ObjV,
+                                          population.CV,
+                                          self.problem.maxormins)  # 计算适应度
+            self.Sigma3 = 0.5 * (population.Field[1, :] - population.Field[0, :])  # 初始化高斯变异算子的Sigma3
         # ===========================开始进化============================
         while not self.terminated(population):
             # 进行进化操作
@@ -89,7 +94,7 @@ class soea_ES_1_plus_1_templet(ea.SoeaAlgorithm):
                                             population.Chrom,
                                             population.Field,
                                             1,
-                                            Sigma3)  # 高斯变异
+                                            self.Sigma3)  # 高斯变异
             self.call_aimFunc(experimentPop)  # 计算目标函数值
             tempPop = population + experimentPop  # 临时合并，以调用otos进行一对一生存者选择
             tempPop.FitnV = ea.scaling(tempPop.ObjV,
@@ -101,7 +106,7 @@ class soea_ES_1_plus_1_templet(ea.SoeaAlgorithm):
             # 利用1/5规则调整变异压缩概率
             successfulRate = len(np.where(chooseIdx >= NIND)[0]) / (2 * NIND)
             if successfulRate < 1 / 5:
-                Sigma3 *= 0.817
+                self.Sigma3 *= 0.817
             elif successfulRate > 1 / 5:
-                Sigma3 /= 0.817
+                self.Sigma3 /= 0.817
         return self.finishing(population)  # 调用finishing完成后续工作并返回结果
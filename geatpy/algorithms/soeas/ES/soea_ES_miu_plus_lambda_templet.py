@@ -17,6 +17,8 @@ class soea_ES_miu_plus_lambda_templet(ea.SoeaAlgorithm):
 
     """
 
+    stateAttrs = ('Sigma3',)  # 采用断点协议，进化循环的状态为种群以及各个体高斯变异的Sigma3
+
     def __init__(self,
                  problem,
                  population,
@@ -58,6 +60,7 @@ class soea_ES_miu_plus_lambda_templet(ea.SoeaAlgorithm):
             0.5 * population.sizes)  # 这里用NSel代指算法中的lambda，默认设为种群规模的0.5倍
         self.recOper = ea.Recint(RecOpt=None, Half_N=self.NSel,
                                  Alpha=0.5)  # 默认采用全局重组方式的中间重组
+        self.Sigma3 = None  # 各个体高斯变异算子的Sigma3，在run()中初始化
 
     def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
         # ==========================初始化配置===========================
@@ -65,17 +68,20 @@ class soea_ES_miu_plus_lambda_templet(ea.SoeaAlgorithm):
         NIND = population.sizes
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
-        population.initChrom(NIND)  # 初始化种群染色体矩阵
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
-        population.FitnV = ea.scaling(population.ObjV,
-                                      population.CV,
-                                      self.problem.maxormins)  # 计算适应度
-        Sigma3 = np.random.rand(population.sizes, population.Lind) * (
-            population.Field[1, :]
-            - population.Field[0, :]) * 0.5  # 初始化高斯变异算子的Sigma3
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom(NIND)  # 初始化种群染色体矩阵
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            population.FitnV = ea.scaling(population.ObjV,
+                                          population.CV,
+                                          self.problem.maxormins)  # 计算适应度
+            self.Sigma3 = self.rng.random((population.sizes, population.Lind)) * (
+                population.Field[1, :]
+                - population.Field[0, :]) * 0.5  # 初始化高斯变异算子的Sigma3
         # ===========================开始进化============================
         while not self.terminated(population):
             # 选择
@@ -83,7 +89,7 @@ class soea_ES_miu_plus_lambda_templet(ea.SoeaAlgorithm):
                                         population.FitnV,
                                         self.NSel)
             offspring = population[choose_index]
-            offspring_Sigma3 = Sigma3[choose_index]
+            offspring_Sigma3 = self.Sigma3[choose_index]
             # 进行进化操作
             offspring.Chrom = self.recOper.do(offspring.Chrom)  # 重组
             offspring_Sigma3 = self.recOper.do(
@@ -97,7 +103,7 @@ class soea_ES_miu_plus_lambda_templet(ea.SoeaAlgorithm):
                     offspring_Sigma3[i]).reshape(-1)  # 高斯变异
             self.call_aimFunc(offspring)  # 计算目标函数值
             population = population + offspring  # 父子合并
-            Sigma3 = np.vstack([Sigma3, offspring_Sigma3])
+            self.Sigma3 = np.vstack([self.Sigma3, offspring_Sigma3])
             population.FitnV = ea.scaling(population.ObjV,
                                           population.CV,
                                           self.problem.maxormins)  # 计算适应度
@@ -105,5 +111,5 @@ class soea_ES_miu_plus_lambda_templet(ea.SoeaAlgorithm):
             choose_index = ea.selecting('dup', population.FitnV,
                                         NIND)  # 采用基于适应度排序的直接复制选择
             population = population[choose_index]
-            Sigma3 = Sigma3[choose_index]
+            self.Sigma3 = self.Sigma3[choose_index]
         return self.finishing(population)  # 调用finishing完成后续工作并返回结果
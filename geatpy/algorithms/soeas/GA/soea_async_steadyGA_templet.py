@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+import geatpy as ea  # 导入geatpy库
+from geatpy.algorithms.soeas.GA.soea_steadyGA_templet import soea_steadyGA_templet
+
+
+class soea_async_steadyGA_templet(soea_steadyGA_templet):
+    """
+    soea_async_steadyGA_templet : class - Asynchronous Steady State GA Algorithm(异步稳态遗传算法类).
+
+    算法类说明:
+        该算法类是内置算法类soea_steadyGA_templet的异步版本。
+        它借助算法类的评价器(evaluator)同时保持maxPending对后代处于评价之中，
+        每当有一对后代完成评价，就立即与其母体所在位置上的个体进行一对一生存者竞争选择，
+        并马上繁殖出新的一对后代提交评价，从而消除各代之间的同步等待，适用于个体评价耗时差异较大的情形。
+        当没有设置评价器时，其行为与soea_steadyGA_templet一致。
+
+    算法描述:
+        本算法类实现的是异步稳态遗传算法，算法流程如下：
+        1) 根据编码规则初始化N个个体的种群。
+        2) 独立地从当前种群中选取2个母体，交叉、变异后提交评价，重复直至有maxPending对后代处于评价之中。
+        3) 若满足停止条件则停止，否则继续执行。
+        4) 对当前种群进行统计分析，比如记录其最优个体、平均适应度等等。
+        5) 等待任意一对后代完成评价。
+        6) 将这2个后代与当前种群中原母体所在位置的个体进行一对一生存者竞争选择，并替换这些位置上的个体。
+        7) 独立地从当前种群中选取2个母体，交叉、变异后提交评价。
+        8) 回到第3步。
+
+    属性:
+        maxPending : int - 最多同时处于评价之中的后代对数。当设置为None时，默认等于评价器的poolSize。
+
+    注意:
+        该算法类不支持断点：处于评价之中的后代无法保存到断点中，因此设置checkpoint或从断点恢复时会报错。
+
+    """
+
+    stateAttrs = None  # 不采用断点协议（父类soea_steadyGA_templet采用了），见上面的注意事项
+
+    def __init__(self,
+                 problem,
+                 population,
+                 MAXGEN=None,
+                 MAXTIME=None,
+                 MAXEVALS=None,
+                 MAXSIZE=None,
+                 logTras=None,
+                 verbose=None,
+                 outFunc=None,
+                 drawing=None,
+                 trappedValue=None,
+                 maxTrappedCount=None,
+                 dirName=None,
+                 **kwargs):
+        # 先调用父类构造方法
+        super().__init__(problem,
+                         population,
+                         MAXGEN,
+                         MAXTIME,
+                         MAXEVALS,
+                         MAXSIZE,
+                         logTras,
+                         verbose,
+                         outFunc,
+                         drawing,
+                         trappedValue,
+                         maxTrappedCount,
+                         dirName)
+        self.name = 'asyncSteadyGA'
+        self.maxPending = None
+
+    def breed(self, population):
+
+        """
+        描述:
+            从当前种群中选出2个母体，交叉、变异后把得到的2个后代异步地提交评价。
+
+        """
+
+        chooseIdx = ea.selecting(self.selFunc, population.FitnV, 2)
+        offspring = population[chooseIdx]
+        # 进行进化操作
+        offspring.Chrom = self.recOper.do(offspring.Chrom)  # 重组
+        offspring.Chrom = self.mutOper.do(offspring.Encoding,
+                                          offspring.Chrom,
+                                          offspring.Field)  # 变异
+        self.submit_aimFunc(offspring, chooseIdx)  # 提交评价，母体的索引作为任务标记
+
+    def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
+        # ==========================初始化配置===========================
+        population = self.population
+        NIND = population.sizes
+        if NIND < 2:
+            raise RuntimeError('error: Population'
+                               ' size is too small. (种群规模不能小于2。)')
+        self.initialization()  # 初始化算法类的一些动态参数
+        # ===========================准备进化============================
+        population.initChrom(NIND)  # 初始化种群染色体矩阵
+        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+        if prophetPop is not None:
+            population = (prophetPop + population)[:NIND]  # 插入先知种群
+        self.call_aimFunc(population)  # 计算种群的目标函数值
+        population.FitnV = ea.scaling(population.ObjV,
+                                      population.CV,
+                                      self.problem.maxormins)  # 计算适应度
+        maxPending = self.maxPending
+        if maxPending is None:
+            maxPending = self.evaluator.poolSize if self.evaluator is not None else 1
+        pendingNum = max(maxPending, 1)  # 处于评价之中的后代对数
+        for _ in range(pendingNum):
+            self.breed(population)
+        # ===========================开始进化============================
+        while not self.terminated(population):
+            offspring, chooseIdx = self.collect_aimFunc()  # 取回任意一对完成了评价的后代
+            tempPop = population[chooseIdx] + offspring  # 与母体所在位置上的当前个体合并
+            tempPop.FitnV = ea.scaling(tempPop.ObjV,
+                                       tempPop.CV,
+                                       self.problem.maxormins)  # 计算适应度
+            tempPop = tempPop[ea.selecting('otos', tempPop.FitnV,
+                                           2)]  # 采用One-to-One Survivor选择
+            population[chooseIdx] = tempPop
+            population.FitnV = ea.scaling(population.ObjV,
+                                          population.CV,
+                                          self.problem.maxormins)  # 计算适应度
+            self.breed(population)  # 立即繁殖新的一对后代补充进评价队列
+        # 等待仍在评价中的后代完成，其结果不再参与进化，但仍计入评价次数
+        for _ in range(pendingNum):
+            self.collect_aimFunc()
+        return self.finishing(population)  # 调用finishing完成后续工作并返回结果
@@ -24,6 +24,8 @@ class soea_multi_SEGA_templet(ea.SoeaAlgorithm):
 
     """
 
+    stateAttrs = ('subPopulations',)  # 采用断点协议，进化循环的状态为各个种群（传入terminated()的只是由它们合并得到的联合种群）
+
     def __init__(self,
                  problem,
                  population,
@@ -57,6 +59,7 @@ class soea_multi_SEGA_templet(ea.SoeaAlgorithm):
             raise RuntimeError('传入的种群对象列表必须为list类型')
         self.name = 'multi-SEGA'
         self.PopNum = len(population)  # 种群数目
+        self.subPopulations = None  # 当前的各个种群，在run()中更新
         self.selFunc = 'tour'  # 锦标赛选择算子
         self.migFr = 5  # 发生种群迁移的间隔代数
         self.migOpers = ea.Migrate(MIGR=0.2,
@@ -141,18 +144,24 @@ class soea_multi_SEGA_templet(ea.SoeaAlgorithm):
         # ==========================初始化配置===========================
         self.initialization()  # 初始化算法类的一些动态参数
         population = self.population  # 密切注意本算法类的population是一个存储种群类对象的列表
-        NindAll = 0  # 记录所有种群个体总数
         # ===========================准备进化============================
-        for i in range(self.PopNum):  # 遍历每个种群，初始化每个种群的染色体矩阵
-            NindAll += population[i].sizes
-            population[i].initChrom(population[i].sizes)  # 初始化种群染色体矩阵
-            # 插入先验知识（注意：这里不会对先知种群列表prophetPops的合法性进行检查）
-            if prophetPops is not None:
-                population[i] = (
-                    prophetPops[i]
-                    + population[i])[:population[i].sizes]  # 插入先知种群
-            self.call_aimFunc(population[i])  # 计算种群的目标函数值
-        self.calFitness(population)  # 统一计算适应度
+        if self.resumeState is not None:
+            self.restore()  # 从断点恢复搜索状态，跳过进化前的准备工作
+            population = self.subPopulations
+            NindAll = sum(pop.sizes for pop in population)  # 记录所有种群个体总数
+        else:
+            NindAll = 0  # 记录所有种群个体总数
+            for i in range(self.PopNum):  # 遍历每个种群，初始化每个种群的染色体矩阵
+                NindAll += population[i].sizes
+                population[i].initChrom(population[i].sizes)  # 初始化种群染色体矩阵
+                # 插入先验知识（注意：这里不会对先知种群列表prophetPops的合法性进行检查）
+                if prophetPops is not None:
+                    population[i] = (
+                        prophetPops[i]
+                        + population[i])[:population[i].sizes]  # 插入先知种群
+                self.call_aimFunc(population[i])  # 计算种群的目标函数值
+            self.calFitness(population)  # 统一计算适应度
+        self.subPopulations = population
         unitePop = self.unite(population)  # 得到联合种群unitePop
         # ===========================开始进化============================
         while not self.terminated(unitePop):
@@ -162,17 +171,19 @@ class soea_multi_SEGA_templet(ea.SoeaAlgorithm):
                 offspring = pop[ea.selecting(self.selFunc,
                                              pop.FitnV,
                                              pop.sizes)]
+                basePop = offspring.view(slice(None))  # 进化操作前的个体（不复制），用于增量评价
                 # 进行进化操作
                 offspring.Chrom = self.recOpers[i].do(offspring.Chrom)  # 重组
                 offspring.Chrom = self.mutOpers[i].do(offspring.Encoding,
                                                       offspring.Chrom,
                                                       offspring.Field)  # 变异
-                self.call_aimFunc(offspring)  # 计算目标函数值
+                self.call_aimFunc(offspring, basePop)  # 计算目标函数值（设置了deltaEval并且问题类支持时进行增量评价）
                 population[i] = population[i] + offspring  # 父子合并
             self.calFitness(population)  # 统一计算适应度
             population = self.EnvSelection(population,
                                            NUM=NindAll)  # 选择个体得到新一代种群
             if self.currentGen % self.migFr == 0:
                 population = self.migOpers.do(population)  # 进行种群迁移
+            self.subPopulations = population
             unitePop = self.unite(population)  # 更新联合种群
         return self.finishing(unitePop)  # 调用finishing完成后续工作并返回结果
@@ -20,6 +20,8 @@ class soea_steadyGA_templet(ea.SoeaAlgorithm):
 
     """
 
+    stateAttrs = ()  # 采用断点协议，进化循环中除种群以外没有其他状态
+
     def __init__(self,
                  problem,
                  population,
@@ -83,25 +85,29 @@ class soea_steadyGA_templet(ea.SoeaAlgorithm):
                                ' size is too small. (种群规模不能小于2。)')
         self.initialization()  # 初始化算法类的一些动态参数
         # ===========================准备进化============================
-        population.initChrom(NIND)  # 初始化种群染色体矩阵
-        # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
-        if prophetPop is not None:
-            population = (prophetPop + population)[:NIND]  # 插入先知种群
-        self.call_aimFunc(population)  # 计算种群的目标函数值
-        population.FitnV = ea.scaling(population.ObjV,
-                                      population.CV,
-                                      self.problem.maxormins)  # 计算适应度
+        if self.resumeState is not None:
+            population = self.restore()  # 从断点恢复种群和搜索状态，跳过进化前的准备工作
+        else:
+            population.initChrom(NIND)  # 初始化种群染色体矩阵
+            # 插入先验知识（注意：这里不会对先知种群prophetPop的合法性进行检查）
+            if prophetPop is not None:
+                population = (prophetPop + population)[:NIND]  # 插入先知种群
+            self.call_aimFunc(population)  # 计算种群的目标函数值
+            population.FitnV = ea.scaling(population.ObjV,
+                                          population.CV,
+                                          self.problem.maxormins)  # 计算适应度
         # ===========================开始进化============================
         while not self.terminated(population):
             # 选择
             chooseIdx = ea.selecting(self.selFunc, population.FitnV, 2)
             offspring = population[chooseIdx]
+            basePop = offspring.view(slice(None))  # 进化操作前的个体（不复制），用于增量评价
             # 进行进化操作
             offspring.Chrom = self.recOper.do(offspring.Chrom)  # 重组
             offspring.Chrom = self.mutOper.do(offspring.Encoding,
                                               offspring.Chrom,
                                               offspring.Field)  # 变异
-            self.call_aimFunc(offspring)  # 计算目标函数值
+            self.call_aimFunc(offspring, basePop)  # 计算目标函数值（设置了deltaEval并且问题类支持时进行增量评价）
             tempPop = population[chooseIdx] + offspring  # 父子合并
             tempPop.FitnV = ea.scaling(tempPop.ObjV,
                                        tempPop.CV,
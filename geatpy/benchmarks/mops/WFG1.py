@@ -2,6 +2,7 @@
 import numpy as np
 
 import geatpy as ea
+from geatpy.benchmarks.mops.gridSearch import nearestGrid
 
 
 class WFG1(ea.Problem):  # 继承Problem父类
@@ -73,26 +74,18 @@ class WFG1(ea.Problem):  # 继承Problem父类
         f = D * x[:, [M - 1]] + S * h
         return f
 
-    def calReferObjV(self):  # 设定目标数参考值（本问题目标函数参考值设定为理论最优值，即“真实帕累托前沿点”）
-        N = 10000  # 设置所要生成的全局最优解的个数
+    def calReferObjV(self, N=10000):  # 设定目标数参考值（本问题目标函数参考值设定为理论最优值，即“真实帕累托前沿点”），N为所要生成的点数
         Point, num = ea.crtup(self.M, N)  # 生成N个在各目标的单位维度上均匀分布的参考点
         M = self.M
         c = np.ones((num, M))
-        for i in range(num):
-            for j in range(1, M):
-                temp = Point[i, j] / Point[i,
-                                           0] * np.prod(1 - c[i, M - j:M - 1])
-                c[i, M - j
-                  - 1] = (temp**2 - temp + np.sqrt(2 * temp)) / (temp**2 + 1)
-        x = np.arccos(c) * 2 / np.pi
-        temp = (1 - np.sin(
-            np.pi / 2 * x[:, [1]])) * Point[:, [M - 1]] / Point[:, [M - 2]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for j in range(1, M):  # 对所有点同时求解
+                temp = Point[:, j] / Point[:, 0] * np.prod(1 - c[:, M - j:M - 1], 1)
+                c[:, M - j - 1] = (temp**2 - temp + np.sqrt(2 * temp)) / (temp**2 + 1)
+            x = np.arccos(c) * 2 / np.pi
+            temp = (1 - np.sin(np.pi / 2 * x[:, 1])) * Point[:, M - 1] / Point[:, M - 2]
         a = np.linspace(0, 1, 10000 + 1)
-        for i in range(num):
-            E = np.abs(temp[i] * (1 - np.cos(np.pi / 2 * a)) - 1 + a
-                       + np.cos(10 * np.pi * a + np.pi / 2) / 10 / np.pi)
-            rank = np.argsort(E, kind='mergesort')
-            x[i, 0] = a[np.min(rank[0:10])]
+        x[:, 0] = a[searchMixed(temp, a)]
         Point = convex(x)
         Point[:, [M - 1]] = mixed(x)
         referenceObjV = np.array([list(range(2, 2 * self.M + 1, 2))]) * Point
@@ -116,6 +109,40 @@ def mixed(x):
                  [0]] - np.cos(10 * np.pi * x[:, [0]] + np.pi / 2) / 10 / np.pi
 
 
+def searchMixed(temp, a, window=22):
+
+    """
+    描述:
+        对temp中的每个元素，在网格a上找出使|temp*(1-cos(pi/2*a))-1+a+cos(10*pi*a+pi/2)/10/pi|最小的10个网格点，
+        返回其中最小的网格点的序号。由于该式在绝对值符号内关于a单调递增，
+        先对所有元素同时二分查找其零点所在的位置，再只在零点附近的window个网格点上比较，
+        这样每个元素只需计算O(log(len(a)))次，与网格的逐点搜索结果相同。temp为inf或nan的元素仍在整个网格上搜索。
+
+    """
+
+    u = 1 - np.cos(np.pi / 2 * a)
+    z = np.cos(10 * np.pi * a + np.pi / 2) / 10 / np.pi
+    idx = np.zeros(len(temp), dtype=int)
+    finite = np.isfinite(temp)
+    t = temp[finite]
+    lo = np.zeros(len(t), dtype=int)  # 满足f(a[lo]) < 0
+    hi = np.full(len(t), len(a))  # 第一个满足f(a[hi]) >= 0的序号（不存在时为len(a)）
+    while np.any(hi - lo > 1):
+        mid = (lo + hi) // 2
+        negative = t * u[mid] - 1 + a[mid] + z[mid] < 0
+        lo = np.where(negative, mid, lo)
+        hi = np.where(negative, hi, mid)
+    start = np.clip(hi - window // 2, 0, len(a) - window)
+    cols = start[:, None] + np.arange(window)
+    E = np.abs(t[:, None] * u[cols] - 1 + a[cols] + z[cols])
+    idx[finite] = start + nearestGrid(E)
+    if not np.all(finite):
+        with np.errstate(invalid='ignore'):
+            E = np.abs(temp[~finite, None] * u - 1 + a + z)
+        idx[~finite] = nearestGrid(E)
+    return idx
+
+
 def s_linear(x, A):
     return np.abs(x - A) / np.abs(np.floor(A - x) + A)
 
@@ -2,6 +2,7 @@
 import numpy as np
 
 import geatpy as ea
+from geatpy.benchmarks.mops.gridSearch import searchPiecewise
 
 
 class WFG2(ea.Problem):  # 继承Problem父类
@@ -71,26 +72,18 @@ class WFG2(ea.Problem):  # 继承Problem父类
         f = D * x[:, [M - 1]] + S * h
         return f
 
-    def calReferObjV(self):  # 设定目标数参考值（本问题目标函数参考值设定为理论最优值，即“真实帕累托前沿点”）
-        N = 10000  # 设置所要生成的全局最优解的个数
+    def calReferObjV(self, N=10000):  # 设定目标数参考值（本问题目标函数参考值设定为理论最优值，即“真实帕累托前沿点”），N为所要生成的点数
         Point, num = ea.crtup(self.M, N)  # 生成N个在各目标的单位维度上均匀分布的参考点
         M = self.M
         c = np.ones((num, M))
-        for i in range(num):
-            for j in range(1, M):
-                temp = Point[i, j] / Point[i,
-                                           0] * np.prod(1 - c[i, M - j:M - 1])
-                c[i, M - j
-                  - 1] = (temp**2 - temp + np.sqrt(2 * temp)) / (temp**2 + 1)
-        x = np.arccos(c) * 2 / np.pi
-        temp = (1 - np.sin(
-            np.pi / 2 * x[:, [1]])) * Point[:, [M - 1]] / Point[:, [M - 2]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for j in range(1, M):  # 对所有点同时求解
+                temp = Point[:, j] / Point[:, 0] * np.prod(1 - c[:, M - j:M - 1], 1)
+                c[:, M - j - 1] = (temp**2 - temp + np.sqrt(2 * temp)) / (temp**2 + 1)
+            x = np.arccos(c) * 2 / np.pi
+            temp = (1 - np.sin(np.pi / 2 * x[:, 1])) * Point[:, M - 1] / Point[:, M - 2]
         a = np.linspace(0, 1, 10000 + 1)
-        for i in range(num):
-            E = np.abs(temp[i] * (1 - np.cos(np.pi / 2 * a)) - 1
-                       + a * np.cos(5 * np.pi * a)**2)
-            rank = np.argsort(E, kind='mergesort')
-            x[i, 0] = a[np.min(rank[0:10])]
+        x[:, 0] = a[searchDisc(temp, a)]
         Point = convex(x)
         Point[:, [M - 1]] = disc(x)
         [levels, criLevel] = ea.ndsortESS(Point, None, 1)  # 非支配分层，只分出第一层即可
@@ -115,6 +108,19 @@ def disc(x):
     return 1 - x[:, [0]] * (np.cos(5 * np.pi * x[:, [0]]))**2
 
 
+def searchDisc(temp, a):
+
+    """
+    描述:
+        对temp中的每个元素，在网格a上找出使|temp*(1-cos(pi/2*a))-1+a*cos(5*pi*a)**2|最小的10个网格点，
+        返回其中最小的网格点的序号。a*cos(5*pi*a)**2在网格上是分段单调的，
+        因此用searchPiecewise()在各单调区间上二分查找，不必在整个网格上搜索。
+
+    """
+
+    return searchPiecewise(temp, 1 - np.cos(np.pi / 2 * a), a * np.cos(5 * np.pi * a)**2)
+
+
 def s_linear(x, A):
     return np.abs(x - A) / np.abs(np.floor(A - x) + A)
 
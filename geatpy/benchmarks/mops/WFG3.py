@@ -70,8 +70,7 @@ class WFG3(ea.Problem):  # 继承Problem父类
         f = D * x[:, [M - 1]] + S * h
         return f
 
-    def calReferObjV(self):  # 设定目标数参考值（本问题目标函数参考值设定为理论最优值，即“真实帕累托前沿点”）
-        N = 10000  # 设置所要生成的全局最优解的个数
+    def calReferObjV(self, N=10000):  # 设定目标数参考值（本问题目标函数参考值设定为理论最优值，即“真实帕累托前沿点”），N为所要生成的点数
         X = np.hstack([
             np.array([np.linspace(0, 1, N)]).T,
             np.zeros((N, self.M - 2)) + 0.5,
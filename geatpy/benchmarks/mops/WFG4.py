@@ -68,8 +68,7 @@ class WFG4(ea.Problem):  # 继承Problem父类
         f = D * x[:, [M - 1]] + S * h
         return f
 
-    def calReferObjV(self):  # 设定目标数参考值（本问题目标函数参考值设定为理论最优值，即“真实帕累托前沿点”）
-        N = 10000  # 设置所要生成的全局最优解的个数
+    def calReferObjV(self, N=10000):  # 设定目标数参考值（本问题目标函数参考值设定为理论最优值，即“真实帕累托前沿点”），N为所要生成的点数
         Point, num = ea.crtup(self.M, N)  # 生成N个在各目标的单位维度上均匀分布的参考点
         Point = Point / np.sqrt(np.sum(Point**2, 1, keepdims=True))
         referenceObjV = np.array([list(range(2, 2 * self.M + 1, 2))]) * Point
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+
+def nearestGrid(E):
+
+    """
+    描述:
+        对矩阵E的每一行，找出其中最小的10个元素（相等时列号小的优先）所在列号中的最小值。
+        其结果与对每一行用np.argsort(kind='mergesort')排序后取前10个列号的最小值相同。
+        WFG系列问题在计算目标函数参考值时用它在网格上搜索决策变量的取值。
+
+    """
+
+    kth = np.partition(E, 9, axis=1)[:, [9]]  # 每一行第10小的元素（nan排在最后）
+    return np.argmax(E <= kth, axis=1)
+
+
+def bisectFirst(condition, lo, hi):
+
+    """
+    描述:
+        对每个元素同时二分查找，返回区间[lo, hi)中第一个满足condition的序号（都不满足时为hi）。
+        condition(idx)对idx中的每个元素返回一个布尔值，并且它在每个区间内必须是先False后True的。
+
+    """
+
+    lo = lo.copy()
+    hi = hi.copy()
+    while np.any(lo < hi):
+        mid = (lo + hi) // 2
+        satisfied = condition(np.minimum(mid, hi - 1)) | (mid >= hi)
+        lo = np.where(satisfied, lo, mid + 1)
+        hi = np.where(satisfied, mid, hi)
+    return lo
+
+
+def searchPiecewise(temp, u, w, window=22, chunkSize=4096):
+
+    """
+    描述:
+        对temp中的每个元素t，在网格上找出使|t*u-1+w|最小的10个网格点，返回其中最小的网格点的序号，
+        其中u是网格上严格单调递增的一维数组，w是网格上的任意一维数组，结果与对整个网格逐点搜索相同。
+        相邻网格点之间f=t*u-1+w的增减由t与r=-diff(w)/diff(u)的大小关系决定，r与t无关，
+        因此先把r划分成若干个单调的区间（对WFG2只有11个），对每个区间二分查找t的位置，
+        从而把网格划分成f在其中单调的若干段；再在每一段上二分查找f的零点，
+        最后只在这些零点（或段的端点）附近的window个网格点上比较。
+        对temp分块处理，每次只处理chunkSize个元素以限制内存占用。temp为inf或nan的元素仍在整个网格上搜索。
+
+    """
+
+    n = len(u)
+    r = -np.diff(w) / np.diff(u)
+    d = np.sign(np.diff(r))
+    nz = np.nonzero(d)[0]
+    breaks = np.hstack([0, nz[1:][d[nz[1:]] != d[nz[:-1]]] + 1, n - 1])  # r在[breaks[k], breaks[k + 1])上单调
+    idx = np.zeros(len(temp), dtype=int)
+    finite = np.where(np.isfinite(temp))[0]
+    for start in range(0, len(finite), chunkSize):
+        rows = finite[start:start + chunkSize]
+        t = temp[rows]
+        centers = []
+        for k in range(len(breaks) - 1):
+            lo = np.full(len(t), breaks[k])
+            hi = np.full(len(t), breaks[k + 1])
+            if r[breaks[k + 1] - 1] >= r[breaks[k]]:  # r在区间内单调递增，f先递增后递减
+                split = bisectFirst(lambda i: r[i] > t, lo, hi)
+            else:  # r在区间内单调递减，f先递减后递增
+                split = bisectFirst(lambda i: r[i] <= t, lo, hi)
+            for x, y in ((lo, split), (split, hi)):  # f在网格点x到y上单调
+                s = np.where(t * u[y] + w[y] >= t * u[x] + w[x], 1, -1)
+                centers.append(bisectFirst(lambda i: s * (t * u[i] - 1 + w[i]) >= 0, x, y + 1))
+        starts = np.clip(np.sort(np.vstack(centers).T, axis=1) - window // 2, 0, n - window)
+        cols = starts[:, :, None] + np.arange(window)
+        E = np.abs(t[:, None, None] * u[cols] - 1 + w[cols])
+        E[:, 1:][cols[:, 1:] < starts[:, :-1, None] + window] = np.inf  # 与前一个窗口重叠的网格点只保留一个
+        cols = cols.reshape(len(t), -1)  # 各窗口按起点排序，因此去掉重复的网格点后列号是递增的
+        idx[rows] = cols[np.arange(len(t)), nearestGrid(E.reshape(len(t), -1))]
+    if len(finite) < len(temp):
+        with np.errstate(invalid='ignore'):  # temp为inf时inf*0得到nan
+            E = np.abs(temp[~np.isfinite(temp), None] * u - 1 + w)
+        idx[~np.isfinite(temp)] = nearestGrid(E)
+    return idx
@@ -5,10 +5,14 @@ import os
 
 
 class TSP(ea.Problem):  # 继承Problem父类
-    def __init__(self, testName):  # testName为测试集名称
+    def __init__(self, testName, dtype=np.float32, chunkSize=1024):  # testName为测试集名称
         name = testName  # 初始化name
         # 读取城市坐标数据
         self.places = np.loadtxt(os.path.dirname(os.path.realpath(__file__)) + "/data/" + testName + ".csv", delimiter=",", usecols=(0, 1))
+        # 预先计算城市之间的距离矩阵，用dtype存储以节省内存和带宽（累加路程时仍采用float64）
+        diff = self.places[:, np.newaxis, :] - self.places[np.newaxis, :, :]
+        self.distances = np.sqrt(np.sum(diff**2, 2)).astype(dtype)
+        self.chunkSize = chunkSize  # 每次计算的最大个体数，用于限制大规模测试集上的内存占用
         M = 1  # 初始化M（目标维数）
         Dim = self.places.shape[0]  # 初始化Dim（决策变量维数）
         maxormins = [1] * M  # 初始化maxormins（目标最小最大化标记列表，1：最小化该目标；-1：最大化该目标）
@@ -22,12 +26,23 @@ class TSP(ea.Problem):  # 继承Problem父类
 
     def evalVars(self, x):  # 目标函数
         N = x.shape[0]
-        # 添加最后回到出发地
-        X = np.hstack([x, x[:, [0]]]).astype(int)
-        ObjV = []  # 存储所有种群个体对应的总路程
-        for i in range(N):
-            journey = self.places[X[i], :]  # 按既定顺序到达的地点坐标
-            distance = np.sum(np.sqrt(np.sum(np.diff(journey.T) ** 2, 0)))  # 计算总路程
-            ObjV.append(distance)
-        f = np.array([ObjV]).T
+        X = x.astype(int)
+        f = np.zeros((N, 1))
+        for start in range(0, N, self.chunkSize):  # 分块计算
+            tour = X[start:start + self.chunkSize]
+            # 按既定顺序取出各段路程的长度（包括最后回到出发地的一段），并求和得到总路程
+            edges = self.distances[tour, np.roll(tour, -1, axis=1)]
+            f[start:start + self.chunkSize, 0] = np.sum(edges, 1, dtype=np.float64)
+        return f
+
+    def evalDelta(self, Vars, OldVars, OldObjV, OldCV, start, end):  # 增量评价，只重新计算变化区间内的路段
+        # 第j段路程连接第j-1个和第j个城市，区间两端的路段也要重新计算（区间覆盖整条路线时每段只计算一次）
+        lengths = np.where(end > start, np.minimum(end - start + 1, Vars.shape[1]), 0)
+        rows = np.repeat(np.arange(Vars.shape[0]), lengths)
+        cols = (np.arange(len(rows)) - np.repeat(np.cumsum(lengths) - lengths - start, lengths)) % Vars.shape[1]
+        prev = cols - 1  # 为-1时即最后回到出发地的一段
+        delta = self.distances[Vars[rows, prev].astype(int), Vars[rows, cols].astype(int)].astype(np.float64) - \
+            self.distances[OldVars[rows, prev].astype(int), OldVars[rows, cols].astype(int)]
+        f = np.array(OldObjV, dtype=np.float64)
+        f[:, 0] += np.bincount(rows, delta, minlength=Vars.shape[0])
         return f
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+
+import numpy as np
+import geatpy as ea
+
+from geatpy.evaluators.Evaluator import Evaluator
+
+
+class CacheEvaluator(Evaluator):
+    """
+    CacheEvaluator - class : 带缓存的评价器，它包装另一个评价器，以决策变量（即解码后的Phen的每一行）的内容为键缓存评价结果。
+                             评价时只把缓存中没有的决策变量（同一种群中重复的决策变量也只算一次）交给被包装的评价器评价，
+                             其余个体直接从缓存中取得目标函数值和违反约束程度，
+                             适用于目标函数耗时且进化后期种群中存在大量重复个体的情况。
+                             缓存采用LRU（最近最少使用）策略淘汰，条目数不超过maxSize。
+                             还可以设置一个磁盘存储store作为第二级缓存，内存缓存未命中的个体会先到store中查找，
+                             新的评价结果也会写入store，从而在多次运行之间复用评价结果。
+
+    属性:
+        evaluator : class <Evaluator> - 被包装的评价器，实际的评价由它完成。当设置为None时，采用串行评价器。
+
+        maxSize   : int   - 缓存的最大条目数。
+
+        hits      : int   - 命中缓存的个体数。
+
+        misses    : int   - 实际调用问题类进行评价的个体数。
+
+        store     : class <EvalStore> - (可选)磁盘存储，可以传入EvalStore对象或存储文件的路径。
+
+    注意:
+        由于缓存中的个体不会再被评价，被包装的评价器只会收到由未命中的个体组成的只包含Phen的种群，
+        因此此时aimFunc()中只能使用pop.Phen和pop.sizes，并且目标函数必须是确定性的（相同的决策变量总是得到相同的结果）。
+        异步评价（submit()和collect()）不经过缓存，直接交给被包装的评价器。
+        算法类的evalsNum只统计实际评价的次数，命中缓存的次数记录在hits中。
+
+    """
+
+    def __init__(self, evaluator=None, maxSize=100000, store=None):
+        self.evaluator = ea.SerialEvaluator() if evaluator is None else evaluator
+        super().__init__(self.evaluator.poolSize, self.evaluator.chunkSize)
+        self.maxSize = maxSize
+        self.store = ea.EvalStore(store) if isinstance(store, str) else store
+        self.hits = 0
+        self.misses = 0
+        self.cache = OrderedDict()  # 缓存，键为决策变量的字节串，值为(ObjV的对应行, CV的对应行)
+        self.problem = None  # 缓存所对应的问题类对象
+
+    def clear(self):  # 清空缓存
+        self.cache.clear()
+
+    def lookupCache(self, keys):
+
+        """
+        描述:
+            在内存缓存中查找各决策变量，返回未命中的个体的索引（同一种群中重复的决策变量只返回第一次出现的索引）。
+
+        """
+
+        missIdx = []
+        missKeys = set()
+        for i, key in enumerate(keys):
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            elif key not in missKeys:
+                missKeys.add(key)
+                missIdx.append(i)
+        return missIdx
+
+    def lookupStore(self, Phen, keys, missIdx, results):
+
+        """
+        描述:
+            到磁盘存储中查找内存缓存未命中的个体，找到的结果写入results，返回仍未找到的个体的索引。
+
+        """
+
+        found, ObjV, CV = self.store.lookup(Phen[missIdx])
+        for j, i in enumerate(np.array(missIdx)[found]):
+            results[keys[i]] = (ObjV[j], CV[j] if CV is not None else None)
+        return [i for i, isFound in zip(missIdx, found) if not isFound]
+
+    def evaluateMisses(self, problem, Phen, keys, missIdx, results):
+
+        """
+        描述:
+            用被包装的评价器评价未命中的个体，结果写入results，并追加写入磁盘存储。
+            若评价结果的格式不合法，则不写入results，返回由未命中的个体组成的种群，以便交由call_aimFunc()报错；否则返回None。
+
+        """
+
+        missPop = ea.Population(None, None, len(missIdx))
+        missPop.Phen = Phen[missIdx]
+        self.evaluator.do(problem, missPop)
+        ObjV = np.asarray(missPop.ObjV)
+        CV = missPop.CV
+        if ObjV.ndim != 2 or ObjV.shape[0] != len(missIdx):
+            return missPop
+        for j, i in enumerate(missIdx):
+            results[keys[i]] = (ObjV[j].copy(), CV[j].copy() if CV is not None else None)
+        if self.store is not None:
+            self.store.append(missPop.Phen, ObjV, CV)
+        return None
+
+    def assemble(self, pop, keys, results):
+
+        """
+        描述:
+            由新得到的结果results以及内存缓存拼接得到种群的ObjV和CV，然后把新的结果加入缓存并按LRU策略淘汰。
+
+        """
+
+        entries = [results[key] if key in results else self.cache[key] for key in keys]
+        pop.ObjV = np.array([entry[0] for entry in entries])
+        pop.CV = np.array([entry[1] for entry in entries]) if entries[0][1] is not None else None
+        self.cache.update(results)
+        while len(self.cache) > self.maxSize:
+            self.cache.popitem(last=False)
+
+    def do(self, problem, pop):  # 执行评价，返回实际评价的个体数
+        if problem is not self.problem:  # 问题发生了变化，缓存的结果不再有效
+            self.clear()
+            self.problem = problem
+        Phen = np.ascontiguousarray(pop.Phen)
+        if Phen.shape[0] == 0:
+            self.evaluator.do(problem, pop)
+            return 0
+        keys = [row.tobytes() for row in Phen]
+        missIdx = self.lookupCache(keys)  # 找出缓存中没有的决策变量
+        results = {}
+        if self.store is not None and len(missIdx) > 0:  # 到磁盘存储中查找
+            missIdx = self.lookupStore(Phen, keys, missIdx, results)
+        if len(missIdx) > 0:
+            missPop = self.evaluateMisses(problem, Phen, keys, missIdx, results)
+            if missPop is not None:  # 格式不合法，交由call_aimFunc()报错
+                pop.ObjV, pop.CV = missPop.ObjV, missPop.CV
+                return len(missIdx)
+        self.assemble(pop, keys, results)
+        self.hits += pop.sizes - len(missIdx)
+        self.misses += len(missIdx)
+        return len(missIdx)
+
+    def submit(self, problem, Phen, tag=None):  # 异步地提交一个评价任务，不经过缓存
+        self.evaluator.submit(problem, Phen, tag)
+
+    def collect(self):
+        return self.evaluator.collect()
+
+    def close(self):  # 释放资源
+        self.evaluator.close()
+        if self.store is not None:
+            self.store.close()
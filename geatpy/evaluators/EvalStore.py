@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import hashlib
+import os
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows下没有fcntl，此时不对文件加锁
+    fcntl = None
+
+MAGIC = b'GEASTORE'
+VERSION = 1
+HEADER_SIZE = len(MAGIC) + 4 * 8  # 文件头：魔数 + (版本号, Dim, M, nCV)
+
+
+def hashRows(Phen):
+
+    """
+    描述:
+        计算决策变量矩阵每一行的摘要（把每一行转换成float64后计算），返回由16字节的摘要组成的列表。
+
+    """
+
+    Phen = np.ascontiguousarray(Phen, dtype=np.float64)
+    return [hashlib.blake2b(row.tobytes(), digest_size=16).digest() for row in Phen]
+
+
+class EvalStore:
+    """
+    EvalStore - class : 基于磁盘文件的评价结果存储，用于在多次运行、断点续跑以及参数扫描之间复用昂贵的评价结果。
+                        存储文件是一个只追加的定长记录表，每条记录依次为(决策变量的摘要, Phen, ObjV, CV)，
+                        读取时通过numpy.memmap映射到内存，并在内存中维护由摘要到记录序号的索引。
+                        多个进程可以同时读写同一个存储文件：写入时对锁文件加排他锁（见locked()），读取时只读取已完整写入的记录。
+                        重复写入的记录可以通过compact()（或命令行python -m geatpy --compact-store 文件名）清除。
+
+    属性:
+        fileName : str   - 存储文件的路径。
+
+        Dim      : int   - 决策变量的个数。在文件创建之前为None。
+
+        M        : int   - 目标维数。在文件创建之前为None。
+
+        nCV      : int   - 违反约束程度矩阵的列数，-1表示问题没有约束（CV为None）。在文件创建之前为None。
+
+        sizes    : int   - 已索引的记录数。
+
+    注意:
+        一个存储文件只能对应一个问题（要求决策变量、目标函数以及约束都相同），
+        打开文件时只会检查Dim、M和nCV是否一致，无法检查问题本身是否相同。
+        Windows下不对文件加锁，此时不支持多个进程同时写入；也不能在其他进程打开着存储文件时进行compact()。
+
+    """
+
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self.Dim = None
+        self.M = None
+        self.nCV = None
+        self.recordDtype = None
+        self.records = None  # 映射到文件的只读记录数组
+        self.index = {}  # 由摘要到记录序号的索引
+        self.sizes = 0
+        self.fileId = None  # 已索引的文件的(st_dev, st_ino)，用于发现文件被compact()替换
+        self.refresh()
+
+    def setFormat(self, Dim, M, nCV):
+        self.Dim, self.M, self.nCV = int(Dim), int(M), int(nCV)
+        fields = [('key', 'V16'), ('Phen', '<f8', (self.Dim,)), ('ObjV', '<f8', (self.M,))]
+        if self.nCV > 0:
+            fields.append(('CV', '<f8', (self.nCV,)))
+        self.recordDtype = np.dtype(fields)
+
+    def readHeader(self, file):
+
+        """
+        描述:
+            读取并检查文件头，若与已知的格式不一致则报错。
+
+        """
+
+        file.seek(0)
+        header = file.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:len(MAGIC)] != MAGIC:
+            raise RuntimeError('error in EvalStore: ' + self.fileName + ' is not a valid store file. '
+                               '(' + self.fileName + '不是合法的评价结果存储文件。)')
+        version, Dim, M, nCV = np.frombuffer(header[len(MAGIC):], dtype='<i8')
+        if version != VERSION:
+            raise RuntimeError('error in EvalStore: unsupported store version. (不支持该版本的存储文件。)')
+        self.checkFormat(Dim, M, nCV)
+        if self.recordDtype is None:
+            self.setFormat(Dim, M, nCV)
+
+    def checkFormat(self, Dim, M, nCV):
+        if self.recordDtype is not None and (Dim, M, nCV) != (self.Dim, self.M, self.nCV):
+            raise RuntimeError('error in EvalStore: the store does not match the problem. '
+                               '(存储文件中的Dim、M或约束个数与问题不一致。)')
+
+    def refresh(self):
+
+        """
+        描述:
+            把其他进程新写入的记录加入索引。若文件已被compact()替换，则重建索引。
+
+        """
+
+        try:
+            stat = os.stat(self.fileName)
+        except FileNotFoundError:
+            return
+        if stat.st_size < HEADER_SIZE:  # 文件头尚未写入
+            return
+        fileId = (stat.st_dev, stat.st_ino)
+        if fileId != self.fileId:
+            self.records = None
+            self.index = {}
+            self.sizes = 0
+            with open(self.fileName, 'rb') as file:
+                self.readHeader(file)
+            self.fileId = fileId
+        sizes = (stat.st_size - HEADER_SIZE) // self.recordDtype.itemsize  # 只读取已完整写入的记录
+        if sizes <= self.sizes:
+            return
+        self.records = np.memmap(self.fileName, dtype=self.recordDtype, mode='r', offset=HEADER_SIZE, shape=(sizes,))
+        for i in range(self.sizes, sizes):
+            self.index.setdefault(self.records['key'][i].tobytes(), i)
+        self.sizes = sizes
+
+    def lookup(self, Phen):
+
+        """
+        描述:
+            在存储中查找决策变量矩阵Phen的各行。
+
+        输出参数:
+            found : array - 布尔向量，表示每一行是否在存储中找到。
+
+            ObjV  : array - 找到的各行对应的目标函数值矩阵。
+
+            CV    : array - 找到的各行对应的违反约束程度矩阵（问题没有约束时为None）。
+
+        """
+
+        self.refresh()
+        Phen = np.asarray(Phen, dtype=np.float64)
+        found = np.zeros(Phen.shape[0], dtype=bool)
+        if self.sizes == 0 or Phen.shape[0] == 0 or Phen.shape[1] != self.Dim:
+            return found, None, None
+        idx = []
+        for i, key in enumerate(hashRows(Phen)):
+            j = self.index.get(key)
+            if j is not None and np.array_equal(self.records['Phen'][j], Phen[i]):  # 排除摘要碰撞
+                found[i] = True
+                idx.append(j)
+        records = self.records[idx]
+        ObjV = records['ObjV'].copy()
+        if self.nCV < 0:
+            CV = None
+        elif self.nCV == 0:
+            CV = np.zeros((len(idx), 0))
+        else:
+            CV = records['CV'].copy()
+        return found, ObjV, CV
+
+    @contextlib.contextmanager
+    def locked(self):
+
+        """
+        描述:
+            在with语句中对存储文件加排他锁。锁加在单独的锁文件（存储文件名加上“.lock”）上，
+            而不是存储文件本身上，因此compact()可以在持有锁的同时关闭并替换存储文件。
+
+        """
+
+        if fcntl is None:
+            yield
+            return
+        with open(self.fileName + '.lock', 'a+b') as lockFile:
+            fcntl.flock(lockFile.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lockFile.fileno(), fcntl.LOCK_UN)
+
+    def append(self, Phen, ObjV, CV=None):
+
+        """
+        描述:
+            把一批评价结果追加写入存储文件。
+
+        """
+
+        Phen = np.asarray(Phen, dtype=np.float64)
+        ObjV = np.asarray(ObjV, dtype=np.float64)
+        nCV = -1 if CV is None else CV.shape[1]
+        if Phen.shape[0] == 0:
+            return
+        with self.locked(), open(self.fileName, 'a+b') as file:
+            file.seek(0, os.SEEK_END)
+            if file.tell() == 0:  # 新建的文件，写入文件头
+                self.checkFormat(Phen.shape[1], ObjV.shape[1], nCV)
+                file.write(MAGIC + np.array([VERSION, Phen.shape[1], ObjV.shape[1], nCV], dtype='<i8').tobytes())
+            self.readHeader(file)
+            self.checkFormat(Phen.shape[1], ObjV.shape[1], nCV)
+            records = np.zeros(Phen.shape[0], dtype=self.recordDtype)
+            records['key'] = np.array(hashRows(Phen), dtype='V16')
+            records['Phen'] = Phen
+            records['ObjV'] = ObjV
+            if self.nCV > 0:
+                records['CV'] = CV
+            file.seek(0, os.SEEK_END)
+            end = file.tell()
+            if (end - HEADER_SIZE) % self.recordDtype.itemsize != 0:  # 丢弃之前中断的写入所残留的不完整记录
+                file.truncate(end - (end - HEADER_SIZE) % self.recordDtype.itemsize)
+            file.write(records.tobytes())
+            file.flush()
+        self.refresh()
+
+    def compact(self):
+
+        """
+        描述:
+            压缩存储文件：删除重复的记录以及末尾不完整的记录，写入临时文件后原子地替换原文件。
+
+        """
+
+        if not os.path.exists(self.fileName):
+            return
+        with self.locked():
+            with open(self.fileName, 'rb') as file:
+                if os.fstat(file.fileno()).st_size < HEADER_SIZE:
+                    return
+                self.readHeader(file)
+                file.seek(0)
+                header = file.read(HEADER_SIZE)
+                records = np.fromfile(file, dtype=np.uint8)
+            records = records[:len(records) // self.recordDtype.itemsize * self.recordDtype.itemsize]
+            records = records.view(self.recordDtype)
+            _, first = np.unique(records['key'], return_index=True)
+            records = records[np.sort(first)]  # 保留每个摘要最早的一条记录，并保持原有顺序
+            tempName = self.fileName + '.tmp'
+            with open(tempName, 'wb') as temp:
+                temp.write(header)
+                temp.write(records.tobytes())
+            self.close()  # 释放对原文件的映射，Windows下不能替换仍被打开或映射着的文件
+            os.replace(tempName, self.fileName)
+        self.refresh()
+
+    def close(self):  # 释放对存储文件的映射
+        self.records = None
+        self.index = {}
+        self.sizes = 0
+        self.fileId = None
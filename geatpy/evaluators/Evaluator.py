@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import queue
+
+import numpy as np
+import geatpy as ea
+
+
+def evalChunk(problem, Phen):
+
+    """
+    描述:
+        在子进程或子线程中对一个决策变量矩阵分块进行评价，返回该分块对应的目标函数值矩阵和违反约束程度矩阵。
+        传入问题类evaluation()的是一个只包含Phen的种群对象，因此此时aimFunc()中只能使用pop.Phen和pop.sizes。
+
+    输入参数:
+        problem : class <Problem> - 问题类的对象。
+
+        Phen    : array - 决策变量矩阵分块，每一行对应一组决策变量。
+
+    输出参数:
+        ObjV    : array - 该分块的目标函数值矩阵。
+
+        CV      : array - 该分块的违反约束程度矩阵（若无约束则为None）。
+
+    """
+
+    pop = ea.Population(None, None, Phen.shape[0])
+    pop.Phen = Phen  # 直接引用分块，不经过构造函数的复制
+    problem.evaluation(pop)
+    return pop.ObjV, pop.CV
+
+
+class Evaluator:
+    """
+    Evaluator - Interface : 评价器接口
+    进化算法框架中的所有评价器类都实现该接口。评价器负责调用问题类的evaluation()计算种群的目标函数值和违反约束程度。
+
+    属性:
+        poolSize  : int - 池的大小，即并发执行评价的线程数或进程数。
+
+        chunkSize : int - 每个评价任务包含的个体数目。当设置为None时，种群会被均匀地划分成poolSize份。
+
+    函数:
+        do(problem, pop)           : 执行评价，完成后pop.ObjV和pop.CV被更新。
+                                     可返回实际调用问题类进行评价的个体数，返回None时表示种群的全部个体都被评价了。
+
+        submit(problem, Phen, tag) : 异步地提交一个评价任务，立即返回。
+
+        collect()                  : 等待任意一个已提交的评价任务完成，返回(tag, ObjV, CV)。
+
+        close()                    : 释放评价器占用的线程或进程资源。
+
+    """
+
+    def __init__(self, poolSize=1, chunkSize=None):
+        self.poolSize = poolSize
+        self.chunkSize = chunkSize
+        self.finished = queue.Queue()  # 存放已完成的异步评价任务的结果
+
+    def do(self, problem, pop):  # 执行评价
+        pass
+
+    def submit(self, problem, Phen, tag=None):
+
+        """
+        描述:
+            异步地提交一个评价任务，tag为用户自定义的任务标记，会在collect()中原样返回。
+            此处的默认实现是在当前线程中立即完成评价，支持并发的评价器会重写该函数。
+
+        """
+
+        try:
+            self.finished.put((tag, evalChunk(problem, Phen)))
+        except Exception as e:
+            self.finished.put((tag, e))
+
+    def collect(self):
+
+        """
+        描述:
+            阻塞直到任意一个已提交的评价任务完成，按完成的先后顺序返回(tag, ObjV, CV)。
+            若评价过程中抛出了异常，则在此处重新抛出。
+
+        """
+
+        tag, result = self.finished.get()
+        if isinstance(result, BaseException):
+            raise result
+        return tag, result[0], result[1]
+
+    def close(self):  # 释放资源
+        pass
+
+    def getChunks(self, NIND):
+
+        """
+        描述:
+            把NIND个个体按顺序划分成若干个分块，返回由各分块对应的slice组成的列表。
+
+        """
+
+        if self.chunkSize is None:
+            chunkSize = int(np.ceil(NIND / max(self.poolSize, 1)))
+        else:
+            chunkSize = self.chunkSize
+        chunkSize = max(chunkSize, 1)
+        if NIND == 0:
+            return [slice(0, 0)]  # 空种群也照常交给问题类处理
+        return [slice(start, min(start + chunkSize, NIND)) for start in range(0, NIND, chunkSize)]
+
+    def assemble(self, pop, results):
+
+        """
+        描述:
+            把各分块的评价结果按原顺序拼接起来，写回pop.ObjV和pop.CV。
+
+        """
+
+        ObjVs = [result[0] for result in results]
+        CVs = [result[1] for result in results]
+        pop.ObjV = np.vstack(ObjVs)
+        if all(CV is None for CV in CVs):
+            pop.CV = None
+        elif any(CV is None for CV in CVs):
+            raise RuntimeError('error in Evaluator: CV disagree. (各分块的违反约束程度矩阵必须要么同时为None要么同时不为None。)')
+        else:
+            pop.CV = np.vstack(CVs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+import multiprocessing as mp
+
+from geatpy.evaluators.Evaluator import Evaluator
+from geatpy.evaluators.Evaluator import evalChunk
+
+workerProblem = None  # 子进程中常驻的问题类对象
+workerContext = None  # 子进程中常驻的用户自定义上下文对象
+
+
+def initWorker(problem, problemBuilder, builderArgs, initializer, initargs):
+
+    """
+    描述:
+        子进程启动时调用一次，在子进程中构建（或接收）问题类对象以及用户自定义的上下文对象，
+        之后的评价任务只需传入决策变量。
+
+    """
+
+    global workerProblem, workerContext
+    workerProblem = problemBuilder(*builderArgs) if problemBuilder is not None else problem
+    workerContext = initializer(*initargs) if initializer is not None else None
+
+
+def workerEvalChunk(Phen):
+
+    """
+    描述:
+        在子进程中用常驻的问题类对象评价一个决策变量矩阵分块。
+
+    """
+
+    return evalChunk(workerProblem, Phen)
+
+
+class ProcessEvaluator(Evaluator):
+    """
+    ProcessEvaluator - class : 多进程评价器，把种群的决策变量矩阵按行划分成若干个分块，在进程池中并发地评价，
+                               再按原顺序拼接得到ObjV和CV。
+                               适用于每个个体的评价都比较耗时且目标函数为纯Python计算的情况。
+                               进程池是常驻的：子进程只在第一次评价时启动一次，问题类对象也只在子进程启动时传入或构建一次，
+                               之后每个评价任务只传递决策变量矩阵的分块。
+
+    属性:
+        poolSize       : int      - 进程池的大小。当设置为None时，默认等于计算机的核心数。
+
+        chunkSize      : int      - 每个评价任务包含的个体数目。当设置为None时，种群会被均匀地划分成poolSize份。
+
+        problemBuilder : function - (可选)在每个子进程启动时调用problemBuilder(*builderArgs)来构建子进程所用的问题类对象，
+                                    例如problemBuilder可以直接是自定义问题类。
+                                    设置后主进程的问题类对象不会被传给子进程，因此它可以持有无法pickle的对象，
+                                    数据集等也只会在各子进程启动时加载一次。
+
+        builderArgs    : tuple    - 传给problemBuilder的参数。
+
+        initializer    : function - (可选)在每个子进程启动时调用initializer(*initargs)，返回值作为子进程的上下文对象，
+                                    可在目标函数中通过ea.ProcessEvaluator.getContext()获取，用于存放大型数据集等。
+
+        initargs       : tuple    - 传给initializer的参数。
+
+    注意:
+        当没有设置problemBuilder时，问题类对象在子进程启动时被pickle后传给子进程，因此它必须是可以被pickle的
+        （例如不能持有进程池、线程池、打开的文件等对象），并且之后在主进程中对它的修改不会同步到子进程中；
+        若传给do()的问题类对象发生了变化，则进程池会被重启。
+        与multiprocessing的要求一样，使用多进程评价器时，程序必须以“if __name__ == '__main__':”作为入口。
+
+    """
+
+    def __init__(self, poolSize=None, chunkSize=None, problemBuilder=None, builderArgs=(), initializer=None,
+                 initargs=()):
+        super().__init__(mp.cpu_count() if poolSize is None else poolSize, chunkSize)
+        self.problemBuilder = problemBuilder
+        self.builderArgs = builderArgs
+        self.initializer = initializer
+        self.initargs = initargs
+        self.pool = None  # 进程池在第一次评价时才创建
+        self.problem = None  # 进程池启动时所用的问题类对象
+
+    @staticmethod
+    def getContext():
+
+        """
+        描述:
+            在子进程中获取initializer返回的上下文对象。
+
+        """
+
+        return workerContext
+
+    def getPool(self, problem):
+
+        """
+        描述:
+            获取常驻的进程池，若进程池还未启动或问题类对象发生了变化，则（重新）启动进程池。
+
+        """
+
+        if self.pool is not None and self.problemBuilder is None and problem is not self.problem:
+            self.closePool()
+        if self.pool is None:
+            self.pool = mp.Pool(self.poolSize,
+                                initWorker,
+                                (problem if self.problemBuilder is None else None,
+                                 self.problemBuilder,
+                                 self.builderArgs,
+                                 self.initializer,
+                                 self.initargs))
+            self.problem = problem
+        return self.pool
+
+    def do(self, problem, pop):  # 执行评价
+        chunks = self.getChunks(pop.sizes)
+        results = self.getPool(problem).map(workerEvalChunk, [pop.Phen[chunk] for chunk in chunks])
+        self.assemble(pop, results)
+
+    def submit(self, problem, Phen, tag=None):  # 异步地提交一个评价任务
+        self.getPool(problem).apply_async(workerEvalChunk,
+                                          (Phen,),
+                                          callback=lambda result: self.finished.put((tag, result)),
+                                          error_callback=lambda e: self.finished.put((tag, e)))
+
+    def closePool(self):  # 关闭进程池
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            self.problem = None
+
+    def close(self):  # 释放资源
+        self.closePool()
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+from geatpy.evaluators.Evaluator import Evaluator
+from geatpy.evaluators.Evaluator import evalChunk
+
+
+class SerialEvaluator(Evaluator):
+    """
+    SerialEvaluator - class : 串行评价器，在当前线程中调用问题类的evaluation()完成评价。
+                              这是算法类在没有设置评价器时的默认行为。
+
+    属性:
+        chunkSize : int - 每次调用evaluation()时传入的个体数目。
+                          当设置为None时，整个种群一次性传入evaluation()，此时aimFunc()可以使用种群的所有属性。
+
+    """
+
+    def __init__(self, chunkSize=None):
+        super().__init__(1, chunkSize)
+
+    def do(self, problem, pop):  # 执行评价
+        if self.chunkSize is None:
+            problem.evaluation(pop)
+            return
+        self.assemble(pop, [evalChunk(problem, pop.Phen[chunk]) for chunk in self.getChunks(pop.sizes)])
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+import os
+
+import numpy as np
+
+from geatpy.evaluators.ProcessEvaluator import ProcessEvaluator
+from geatpy.evaluators.ProcessEvaluator import workerEvalChunk
+
+try:
+    from multiprocessing import resource_tracker
+    from multiprocessing import shared_memory
+except ImportError:  # Python 3.8之前没有shared_memory模块
+    shared_memory = None
+
+attachedBlocks = {}  # 子进程中已挂载的共享内存块，键为共享内存块的名称
+
+
+def attach(spec):
+
+    """
+    描述:
+        在子进程中根据spec=(name, shape, dtype)挂载共享内存块，返回基于该内存块的Numpy ndarray数组（不发生复制）。
+
+    """
+
+    name, shape, dtype = spec
+    if name not in attachedBlocks:
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python 3.13之前不支持track参数，挂载时会向resource_tracker登记该内存块，
+            # 导致子进程退出时报告“leaked shared_memory”，甚至删除主进程仍在使用的内存块，因此挂载期间跳过登记
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None if rtype == 'shared_memory' else register(name, rtype)
+            try:
+                shm = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+        attachedBlocks[name] = shm
+    return np.ndarray(shape, dtype, buffer=attachedBlocks[name].buf)
+
+
+def shmEvalChunk(specs, start, stop):
+
+    """
+    描述:
+        在子进程中评价共享内存中Phen的第start到stop-1行，并把结果原地写入共享内存中的ObjV和CV。
+        只有当计算结果无法写入共享内存时（例如格式不合法，或CV的列数还未知），才把结果返回给主进程。
+
+    输出参数:
+        ObjV  : array - 若已写入共享内存则为None，否则为计算得到的目标函数值矩阵。
+
+        CV    : array - 若已写入共享内存或没有约束则为None，否则为计算得到的违反约束程度矩阵。
+
+        hasCV : bool  - 表示问题是否返回了违反约束程度矩阵。
+
+    """
+
+    # 卸载主进程已经释放的旧共享内存块
+    names = [spec[0] for spec in specs.values()]
+    for name in list(attachedBlocks.keys()):
+        if name not in names:
+            attachedBlocks.pop(name).close()
+    Phen = attach(specs['Phen'])[start:stop]
+    Phen.flags.writeable = False  # 禁止在目标函数中修改共享的决策变量矩阵
+    ObjV, CV = workerEvalChunk(Phen)
+    ObjVBuf = attach(specs['ObjV'])[start:stop]
+    if isinstance(ObjV, np.ndarray) and ObjV.shape == ObjVBuf.shape:
+        ObjVBuf[:] = ObjV
+        ObjV = None
+    if CV is None:
+        return ObjV, None, False
+    if 'CV' in specs:
+        CVBuf = attach(specs['CV'])[start:stop]
+        if isinstance(CV, np.ndarray) and CV.shape == CVBuf.shape:
+            CVBuf[:] = CV
+            CV = None
+    return ObjV, CV, True
+
+
+class SharedMemoryEvaluator(ProcessEvaluator):
+    """
+    SharedMemoryEvaluator - class : 基于共享内存的多进程评价器。
+                                    Phen、ObjV和CV存放在multiprocessing.shared_memory共享内存块中，
+                                    子进程直接在共享内存中读取决策变量并原地写回计算结果，
+                                    每个评价任务只需传递分块的起止行号，避免了大规模矩阵的pickle序列化和复制。
+                                    共享内存块在各代之间复用，只有当种群规模变大或决策变量维数改变时才重新分配。
+
+    属性:
+        buffers   : dict - 存储各共享内存块的字典，键为'Phen'、'ObjV'或'CV'，值为(共享内存块, ndarray数组)。
+
+        其余属性与ProcessEvaluator的一致。
+
+    注意:
+        需要Python 3.8及以上版本。用完后需要调用close()（或使用with语句）以释放共享内存。
+
+    """
+
+    def __init__(self, poolSize=None, chunkSize=None, problemBuilder=None, builderArgs=(), initializer=None,
+                 initargs=()):
+        if shared_memory is None:
+            raise RuntimeError('error in SharedMemoryEvaluator: multiprocessing.shared_memory is not available. '
+                               '(共享内存评价器需要Python 3.8及以上版本。)')
+        super().__init__(poolSize, chunkSize, problemBuilder, builderArgs, initializer, initargs)
+        self.buffers = {}
+
+    def allocate(self, key, rows, cols, dtype):
+
+        """
+        描述:
+            获取一个至少有rows行、恰好有cols列的共享内存数组，若已有的共享内存块不满足要求则重新分配。
+
+        """
+
+        dtype = np.dtype(dtype)
+        if key in self.buffers:
+            arr = self.buffers[key][1]
+            if arr.shape[0] >= rows and arr.shape[1] == cols and arr.dtype == dtype:
+                return arr
+            self.release(key)
+        shm = shared_memory.SharedMemory(create=True, size=max(rows * cols * dtype.itemsize, 1))
+        arr = np.ndarray((rows, cols), dtype, buffer=shm.buf)
+        self.buffers[key] = (shm, arr)
+        return arr
+
+    def release(self, key):
+
+        """
+        描述:
+            释放键为key的共享内存块。
+
+        """
+
+        shm, arr = self.buffers.pop(key)
+        del arr
+        shm.close()
+        shm.unlink()
+
+    def getPool(self, problem):
+
+        """
+        描述:
+            在启动进程池之前确保主进程的resource_tracker已经运行，使子进程与主进程共用同一个resource_tracker，
+            从而避免子进程退出时误删主进程仍在使用的共享内存块。
+
+        """
+
+        if self.pool is None and os.name == 'posix':
+            resource_tracker.ensure_running()
+        return super().getPool(problem)
+
+    def getSpecs(self):
+        return {key: (shm.name, arr.shape, arr.dtype.str) for key, (shm, arr) in self.buffers.items()}
+
+    def do(self, problem, pop):  # 执行评价
+        NIND = pop.sizes
+        Phen = np.asarray(pop.Phen)
+        self.allocate('Phen', NIND, Phen.shape[1], Phen.dtype)[:NIND] = Phen
+        ObjVBuf = self.allocate('ObjV', NIND, problem.M, np.float64)
+        chunks = self.getChunks(NIND)
+        specs = self.getSpecs()
+        results = self.getPool(problem).starmap(shmEvalChunk, [(specs, chunk.start, chunk.stop) for chunk in chunks])
+        # 组装目标函数值矩阵
+        if all(result[0] is None for result in results):
+            pop.ObjV = ObjVBuf[:NIND].copy()
+        else:
+            pop.ObjV = next(result[0] for result in results if result[0] is not None)  # 格式不合法，交由call_aimFunc()报错
+        # 组装违反约束程度矩阵
+        hasCVs = [result[2] for result in results]
+        if not any(hasCVs):
+            pop.CV = None
+        elif not all(hasCVs):
+            raise RuntimeError('error in Evaluator: CV disagree. (各分块的违反约束程度矩阵必须要么同时为None要么同时不为None。)')
+        else:
+            pop.CV = np.vstack([result[1] if result[1] is not None else self.buffers['CV'][1][chunk]
+                                for chunk, result in zip(chunks, results)])
+            self.allocate('CV', NIND, pop.CV.shape[1], np.float64)  # 得知CV的列数后分配共享内存，供下一次评价使用
+
+    def close(self):  # 关闭进程池并释放共享内存
+        self.closePool()
+        for key in list(self.buffers.keys()):
+            self.release(key)
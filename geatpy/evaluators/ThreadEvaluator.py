@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from multiprocessing.dummy import Pool as ThreadPool
+
+from geatpy.evaluators.Evaluator import Evaluator
+from geatpy.evaluators.Evaluator import evalChunk
+
+
+class ThreadEvaluator(Evaluator):
+    """
+    ThreadEvaluator - class : 多线程评价器，把种群的决策变量矩阵按行划分成若干个分块，在线程池中并发地评价，
+                              再按原顺序拼接得到ObjV和CV。
+                              适用于目标函数在计算时会释放GIL的情况（例如调用外部程序、Numpy向量化计算或I/O密集型仿真）。
+
+    属性:
+        poolSize  : int - 线程池的大小。
+
+        chunkSize : int - 每个评价任务包含的个体数目。当设置为None时，种群会被均匀地划分成poolSize份。
+
+    """
+
+    def __init__(self, poolSize=2, chunkSize=None):
+        super().__init__(poolSize, chunkSize)
+        self.pool = None  # 线程池在第一次评价时才创建
+
+    def getPool(self):  # 获取线程池，若还未创建则创建之
+        if self.pool is None:
+            self.pool = ThreadPool(self.poolSize)
+        return self.pool
+
+    def do(self, problem, pop):  # 执行评价
+        chunks = self.getChunks(pop.sizes)
+        results = self.getPool().starmap(evalChunk, [(problem, pop.Phen[chunk]) for chunk in chunks])
+        self.assemble(pop, results)
+
+    def submit(self, problem, Phen, tag=None):  # 异步地提交一个评价任务
+        self.getPool().apply_async(evalChunk,
+                                   (problem, Phen),
+                                   callback=lambda result: self.finished.put((tag, result)),
+                                   error_callback=lambda e: self.finished.put((tag, e)))
+
+    def close(self):  # 关闭线程池
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
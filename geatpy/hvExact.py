@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+import bisect
+
+import numpy as np
+
+
+def hypervolume(ObjV, refPoint, maxormins=None):
+
+    """
+    描述:
+        精确计算目标函数值矩阵ObjV相对于参考点refPoint的超体积(Hypervolume)，HV的值越大越好。
+        根据目标维数采用不同的算法：
+        2个目标时采用排序扫描法，时间复杂度为O(NlogN)；
+        3个目标时沿第3个目标进行维度扫描，同时用按横坐标有序的二维阶梯维护截面面积，
+        阶梯用Python列表保存，定位为O(logN)，但插入和删除为O(N)，因此最坏情况下时间复杂度为O(N^2)，
+        由于列表元素的移动开销很小，实际运行时间接近O(NlogN)；
+        4个及以上目标时沿最后一个目标进行切片扫描，每加入一个点就按WFG算法的思路，
+        用“限制集”(limit set)计算它对截面超体积的独占贡献，并递归到低一维直至3个目标，
+        4个目标时要对N个限制集各做一次3个目标的计算，时间复杂度为O(N^2logN)（最坏情况下为O(N^3)），每多一个目标约再乘以N。
+        与ea.indicator.HV不同，该函数不对目标函数值进行归一化，也不会在高维时改用蒙特卡洛法。
+        进化过程中记录的HV指标仍由ea.indicator.HV计算，以保持与之前的运行结果可比。
+
+    用法:
+        hv = hypervolume(ObjV, refPoint)
+        hv = hypervolume(ObjV, refPoint, maxormins)
+
+    输入参数:
+        ObjV      : array - 目标函数值矩阵，每一行对应一个个体，每一列对应一个目标。
+                            其中可以包含被支配的个体和重复的个体，它们不会影响计算结果。
+
+        refPoint  : array - 参考点，是长度等于目标维数的一维数组。各目标上不优于参考点的个体不会贡献超体积。
+
+        maxormins : array - (可选参数)目标函数最小最大化标记，1表示最小化，-1表示最大化。缺省时认为所有目标都是最小化。
+
+    输出参数:
+        hv : float - 超体积指标值。
+
+    """
+
+    P, ref, _ = preprocess(ObjV, refPoint, maxormins)
+    return calHV(P, ref)
+
+
+def hvContribution(ObjV, refPoint, maxormins=None):
+
+    """
+    描述:
+        计算目标函数值矩阵ObjV中每个个体对超体积的独占贡献，即去掉该个体后超体积的减少量。
+        被支配的个体、重复的个体以及各目标上不优于参考点的个体的独占贡献均为0，
+        因此可以用它代替拥挤距离对存档等进行删减（每次删去独占贡献最小的个体）。
+        2个目标且各个体互不支配时直接由排序后相邻个体得到；
+        2个或3个目标的一般情况采用维度扫描（2个目标时补上取值相同的第3个目标），时间复杂度见contribution3D()；
+        1个以及4个及以上目标时沿最后一个目标进行切片扫描，见contributionND()。
+
+    输入参数:
+        ObjV      : array - 目标函数值矩阵，每一行对应一个个体，每一列对应一个目标。
+
+        refPoint  : array - 参考点，是长度等于目标维数的一维数组。
+
+        maxormins : array - (可选参数)目标函数最小最大化标记，1表示最小化，-1表示最大化。缺省时认为所有目标都是最小化。
+
+    输出参数:
+        contribution : array - 由各个体的独占贡献组成的一维数组。
+
+    """
+
+    P, ref, valid = preprocess(ObjV, refPoint, maxormins)
+    contribution = np.zeros(valid.shape[0])
+    idx = np.where(valid)[0]
+    if P.shape[1] == 2:
+        order = np.lexsort((P[:, 1], P[:, 0]))  # 按第1个目标升序排列，相同时按第2个目标升序排列
+        S = P[order]
+        if len(S) == 0 or np.all(S[1:, 1] < S[:-1, 1]):  # 各个体互不支配且没有重复，此时独占贡献为一个矩形
+            right = np.append(S[1:, 0], ref[0])
+            up = np.insert(S[:-1, 1], 0, ref[1])
+            contribution[idx[order]] = (right - S[:, 0]) * (up - S[:, 1])
+            return contribution
+        contribution[idx] = contribution3D(np.hstack([P, np.zeros((P.shape[0], 1))]), np.append(ref, 1.0))
+    elif P.shape[1] == 3:
+        contribution[idx] = contribution3D(P, ref)
+    else:
+        contribution[idx] = contributionND(P, ref)
+    return contribution
+
+
+class ExclusiveRegion:
+    """
+    ExclusiveRegion - class : contribution3D()中阶梯上的一个点在当前截面上的独占区域，
+                              即横坐标在[x, R)内、纵坐标在[y, h(x))内的区域，其中h是用阶梯函数表示的上边界，
+                              第i段在横坐标[bx[i], bx[i + 1])（最后一段到R为止）上取值bh[i]，并且bh是递减的。
+                              同时按截面的高度累加该区域扫过的体积。
+
+    """
+
+    def __init__(self, x, y, z, R, bx, bh):
+        self.x = x
+        self.y = y
+        self.R = R
+        self.bx = bx
+        self.bh = bh
+        self.lastZ = z
+        self.volume = 0.0
+        self.area = sum((right - left) * (h - y) for left, right, h in zip(bx, bx[1:] + [R], bh))
+
+    def cover(self, a, b, z):
+
+        """
+        描述:
+            从独占区域中去掉被点(a, b)在截面上支配的部分，即把横坐标不小于a处的上边界降低到b，z为当前截面的高度。
+
+        """
+
+        a = max(a, self.x)
+        if a >= self.R:
+            return
+        i = bisect.bisect_right(self.bx, a) - 1  # 横坐标a所在的段
+        if self.bh[i] <= b:
+            return
+        self.volume += self.area * (z - self.lastZ)
+        self.lastZ = z
+        j = i
+        while j < len(self.bh) and self.bh[j] > b:  # 上边界高于b的段，它们是连续的
+            right = self.bx[j + 1] if j + 1 < len(self.bx) else self.R
+            self.area -= (right - max(self.bx[j], a)) * (self.bh[j] - max(b, self.y))
+            j += 1
+        if b <= self.y:  # 横坐标不小于a的部分全部被支配
+            self.R = a
+            del self.bx[j:]
+            del self.bh[j:]
+            j = len(self.bh)
+        if self.bx[i] < a:
+            self.bx[i + 1:j] = [a] if b > self.y else []
+            self.bh[i + 1:j] = [b] if b > self.y else []
+        elif b > self.y:
+            self.bx[i:j] = [a]
+            self.bh[i:j] = [b]
+        else:
+            del self.bx[i:j]
+            del self.bh[i:j]
+
+    def finish(self, z):  # 截面高度达到z后不再变化，返回累计的体积
+        self.volume += self.area * (z - self.lastZ)
+        self.lastZ = z
+        return self.volume
+
+
+def contribution3D(P, ref):
+
+    """
+    描述:
+        沿第3个目标进行维度扫描计算3个目标时各点的独占贡献，P中的每个点都必须在各目标上严格优于参考点ref。
+        与hv3D()一样用有序表维护前2个目标上的非支配阶梯，同时为阶梯上的每个点维护它在当前截面上的独占区域
+        （见ExclusiveRegion），独占区域的面积乘以截面的高度变化即为该点的独占贡献的增量。
+        加入一个点时只有被它支配的阶梯上的点（之后不再有独占区域）及其左右相邻的点的独占区域会发生变化，
+        若它在截面上被支配，则只会改变支配它的最右边的阶梯上的点的独占区域，
+        而每次变化只增加常数个阶梯段，因此定位和阶梯段的更新共需O(NlogN)的时间，
+        但阶梯和独占区域的上边界都用Python列表保存，插入和删除为O(N)，最坏情况下总的时间复杂度为O(N^2)。
+
+    """
+
+    contribution = np.zeros(P.shape[0])
+    order = np.argsort(P[:, 2], kind='stable')
+    xs = [-np.inf, ref[0]]  # 阶梯上各点的横坐标，首尾为哨兵
+    ys = [ref[1], -np.inf]  # 阶梯上各点的纵坐标
+    regions = [None, None]  # 阶梯上各点的独占区域
+    ids = [-1, -1]  # 阶梯上各点在P中的序号
+    for k in order:
+        x, y, z = P[k].tolist()
+        i = bisect.bisect_left(xs, x)  # xs[i - 1] < x <= xs[i]
+        if ys[i - 1] <= y or (xs[i] == x and ys[i] <= y):  # 在前2个目标上被阶梯上的点支配，独占贡献为0
+            coverDominated(xs, ys, regions, i, x, y, z)
+            continue
+        if regions[i - 1] is not None:  # 左边相邻的点在横坐标不小于x处被覆盖
+            regions[i - 1].cover(x, y, z)
+        j, region = enterStaircase(xs, ys, regions, ids, contribution, i, x, y, z, ref[0])
+        if regions[j] is not None:  # 右边相邻的点在纵坐标不小于y处被覆盖
+            regions[j].cover(xs[j], y, z)
+        xs[i:j] = [x]
+        ys[i:j] = [y]
+        regions[i:j] = [region]
+        ids[i:j] = [k]
+    for region, k in zip(regions, ids):
+        if region is not None:
+            contribution[k] = region.finish(ref[2])
+    return contribution
+
+
+def coverDominated(xs, ys, regions, i, x, y, z):
+
+    """
+    描述:
+        contribution3D()中点(x, y)在截面上被阶梯上的点支配时，它只会覆盖横坐标不大于x的最右边的阶梯上的点的独占区域，
+        i为x在阶梯中的位置，即xs[i - 1] < x <= xs[i]。
+
+    """
+
+    owner = i if xs[i] == x else i - 1
+    if regions[owner] is not None:
+        regions[owner].cover(x, y, z)
+
+
+def enterStaircase(xs, ys, regions, ids, contribution, i, x, y, z, R):
+
+    """
+    描述:
+        contribution3D()中点(x, y)进入阶梯时，结束阶梯上从i开始的被它支配的点的独占区域，并得到它自己的独占区域，
+        这些被支配的点覆盖了(x, y)的一部分独占区域，R为独占区域横坐标的初始上限。
+        返回(被支配的点之后的第一个阶梯上的点的位置, (x, y)的独占区域)，阶梯本身由调用者更新。
+
+    """
+
+    j = i
+    bx = [x]
+    bh = [ys[i - 1]]
+    while ys[j] >= y:
+        contribution[ids[j]] = regions[j].finish(z)
+        if ys[j] <= y:
+            R = min(R, xs[j])
+        elif ys[j] < bh[-1]:
+            if xs[j] == x:
+                bh[-1] = ys[j]
+            else:
+                bx.append(xs[j])
+                bh.append(ys[j])
+        j += 1
+    R = min(R, xs[j])
+    while len(bx) > 1 and bx[-1] >= R:
+        bx.pop()
+        bh.pop()
+    return j, ExclusiveRegion(x, y, z, R, bx, bh)
+
+
+def contributionND(P, ref):
+
+    """
+    描述:
+        沿最后一个目标进行切片扫描计算1个以及4个及以上目标时各点的独占贡献，P中的每个点都必须在各目标上严格优于参考点ref。
+        按最后一个目标升序排列后，相邻两个取值之间的切片内截面（前M-1个目标）上的点集不变，
+        每个点的独占贡献等于它在各切片的截面上的独占贡献乘以切片厚度之和，截面上的独占贡献递归到低一维计算，
+        直到3个目标时用contribution3D()。每个切片都要重新计算一次截面上的独占贡献，
+        因此4个目标时要调用N次contribution3D()，时间复杂度为O(N^2logN)（最坏情况下为O(N^3)），每多一个目标约再乘以N。
+
+    """
+
+    contribution = np.zeros(P.shape[0])
+    order = np.argsort(P[:, -1], kind='stable')
+    zs = np.append(P[order, -1], ref[-1])
+    for k in range(len(order)):
+        width = zs[k + 1] - zs[k]
+        if width > 0:  # 最后一个目标取值相同的点同时进入截面
+            ids = order[:k + 1]
+            section = P[ids, :-1]
+            if section.shape[1] == 3:
+                contribution[ids] += width * contribution3D(section, ref[:-1])
+            elif section.shape[1] == 0:  # 1个目标时只有截面上唯一的点才有独占贡献
+                contribution[ids] += width * (len(ids) == 1)
+            else:
+                contribution[ids] += width * contributionND(section, ref[:-1])
+    return contribution
+
+
+def preprocess(ObjV, refPoint, maxormins):
+
+    """
+    描述:
+        检查输入参数并统一转换成最小化问题，返回(各目标均优于参考点的个体的目标函数值, 参考点, 这些个体的标记)。
+
+    """
+
+    ObjV = np.asarray(ObjV, dtype=np.float64)
+    ref = np.asarray(refPoint, dtype=np.float64).ravel()
+    if ObjV.ndim != 2 or ObjV.shape[1] != len(ref) or len(ref) == 0:
+        raise RuntimeError('error in hypervolume: ObjV must be a matrix with the same number of columns as the length '
+                           'of refPoint. (ObjV必须是一个矩阵，并且列数与参考点的长度一致。)')
+    if maxormins is not None:
+        maxormins = np.asarray(maxormins, dtype=np.float64).ravel()
+        ObjV = ObjV * maxormins
+        ref = ref * maxormins
+    valid = np.all(ObjV < ref, 1)
+    return ObjV[valid], ref, valid
+
+
+def calHV(P, ref):
+
+    """
+    描述:
+        根据目标维数选择算法计算超体积，P中的每个点都必须在各目标上严格优于参考点ref。
+
+    """
+
+    if P.shape[0] == 0:
+        return 0.0
+    M = P.shape[1]
+    if M == 1:
+        return float(ref[0] - np.min(P[:, 0]))
+    if M == 2:
+        return hv2D(P, ref)
+    if M == 3:
+        return hv3D(P, ref)
+    return hvND(P, ref)
+
+
+def hv2D(P, ref):
+
+    """
+    描述:
+        排序扫描法计算2个目标的超体积。
+
+    """
+
+    P = P[np.lexsort((P[:, 1], P[:, 0]))]
+    best = np.minimum.accumulate(P[:, 1])
+    P = P[np.hstack([True, P[1:, 1] < best[:-1]])]  # 只保留非支配的点，它们组成一个阶梯
+    widths = np.diff(np.append(P[:, 0], ref[0]))
+    return float(np.sum(widths * (ref[1] - P[:, 1])))
+
+
+def hv3D(P, ref):
+
+    """
+    描述:
+        沿第3个目标进行维度扫描计算3个目标的超体积。
+        扫描过程中用按第1个目标升序（从而第2个目标降序）的有序表维护已扫描的点在前2个目标上的非支配阶梯及其面积，
+        每个点通过二分查找定位，被它支配的点在有序表中是连续的一段，可以一次删除。
+        有序表用Python列表实现，插入和删除为O(N)，因此最坏情况下时间复杂度为O(N^2)，实际接近O(NlogN)。
+
+    """
+
+    P = P[np.argsort(P[:, 2], kind='stable')]
+    xs = [-np.inf, ref[0]]  # 阶梯上各点的横坐标，首尾为哨兵
+    ys = [ref[1], -np.inf]  # 阶梯上各点的纵坐标
+    area = 0.0  # 当前阶梯的面积
+    volume = 0.0
+    lastZ = P[0, 2]
+    for x, y, z in P.tolist():
+        volume += area * (z - lastZ)
+        lastZ = z
+        i = bisect.bisect_left(xs, x)  # xs[i - 1] < x <= xs[i]
+        if ys[i - 1] <= y or (xs[i] == x and ys[i] <= y):  # 在前2个目标上被阶梯上的点支配
+            continue
+        gain = (xs[i] - x) * (ys[i - 1] - y)
+        j = i
+        while ys[j] >= y:  # 阶梯上被(x, y)支配的点
+            gain += (xs[j + 1] - xs[j]) * (ys[j] - y)
+            j += 1
+        xs[i:j] = [x]
+        ys[i:j] = [y]
+        area += gain
+    return float(volume + area * (ref[2] - lastZ))
+
+
+def hvND(P, ref):
+
+    """
+    描述:
+        沿最后一个目标进行切片扫描计算4个及以上目标的超体积。
+        按最后一个目标升序加入各点，每个点对截面超体积的独占贡献等于它所支配的区域的体积减去其“限制集”的超体积，
+        限制集即此前加入的点与它逐目标取最大值（并去掉其中被支配的点）后得到的点集，它的超体积在低一维上递归计算。
+        由于3个目标的维度扫描本身就能跳过被支配的点，递归到3个目标时不再对限制集进行非支配筛选。
+        4个目标时对N个限制集各调用一次hv3D()，时间复杂度为O(N^2logN)（最坏情况下为O(N^3)），每多一个目标约再乘以N。
+
+    """
+
+    P = P[np.argsort(P[:, -1], kind='stable')]
+    area = 0.0  # 当前截面（前M-1个目标）的超体积
+    volume = 0.0
+    for i in range(P.shape[0]):
+        p = P[i, :-1]
+        limitSet = np.maximum(P[:i, :-1], p)
+        if not np.any(np.all(limitSet == p, 1)):  # 否则p在截面上被此前加入的点支配，独占贡献为0
+            if limitSet.shape[1] > 3:
+                limitSet = nondominated(limitSet)
+            area += np.prod(ref[:-1] - p) - calHV(limitSet, ref[:-1])
+        nextZ = P[i + 1, -1] if i + 1 < P.shape[0] else ref[-1]
+        volume += area * (nextZ - P[i, -1])
+    return float(volume)
+
+
+def nondominated(P, chunkSize=1024):
+
+    """
+    描述:
+        返回点集P中互不相同的非支配点（最小化），分块比较以限制内存占用。
+
+    """
+
+    if P.shape[0] <= 1:
+        return P
+    P = np.unique(P, axis=0)
+    dominated = np.zeros(P.shape[0], dtype=bool)
+    for start in range(0, P.shape[0], chunkSize):
+        chunk = P[start:start + chunkSize]
+        # weakly[i, j]表示chunk[i]在各目标上都不劣于P[j]，由于P中没有重复的点，此时P[j]被chunk[i]支配
+        weakly = np.all(chunk[:, np.newaxis, :] <= P[np.newaxis, :, :], 2)
+        weakly[np.arange(chunk.shape[0]), np.arange(start, start + chunk.shape[0])] = False
+        dominated |= np.any(weakly, 0)
+    return P[~dominated]
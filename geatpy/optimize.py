@@ -15,6 +15,8 @@ def optimize(algorithm,
              drawLog=True,
              saveFlag=True,
              dirName=None,
+             evalCache=None,
+             resume=None,
              **kwargs):
 
     """
@@ -24,7 +26,8 @@ def optimize(algorithm,
     输入参数:
         algorithm : <class: class> - 算法类的引用。
 
-        seed      : int  - 随机数种子。
+        seed      : int  - 随机数种子。它会同时用于设置numpy的全局随机数发生器（内核中的进化算子使用）
+                           以及算法类自己的随机数发生器algorithm.rng。
 
         prophet   : <class: Population> / Numpy ndarray - 先验知识。可以是种群对象，
                                                           也可以是一组或多组决策变量组成的矩阵（矩阵的每一行对应一组决策变量）。
@@ -45,10 +48,17 @@ def optimize(algorithm,
 
         drawLog   : bool - 用于控制是否根据日志绘制迭代变化图像。
 
-        saveFlag  : bool - 控制是否保存结果。
+        saveFlag  : bool - 控制是否保存结果。其中最优种群被保存为二进制文件optPop.npz，可以用ea.Population.load()读取。
 
         dirName   : str  - 文件保存的路径。当缺省或为None时，默认保存在当前工作目录的'result of job xxxx-xx-xx xxh-xxm-xxs'文件夹下。
 
+        evalCache : str  - (可选)评价结果存储文件的路径。设置后会在算法类的评价器外面包装一层带磁盘存储的CacheEvaluator，
+                           已存储的个体不会被重复评价，新的评价结果也会被写入该文件，供之后的运行（或其他进程）复用。
+                           详见ea.EvalStore。
+
+        resume    : str  - (可选)断点文件的路径。设置后将从该断点继续进化，详见algorithm.checkpoint以及algorithm.resume()。
+                           此时seed和prophet不起作用，因为随机数发生器的状态和种群都会从断点中恢复。
+
     输出参数:
         result    : dict - 一个保存着结果的字典。内容为：
                            {'success': True or False,  # 表示算法是否成功求解。
@@ -81,6 +91,7 @@ def optimize(algorithm,
         algorithm.dirName = dirName  # 只有在设置了saveFlag=True时，才让algorithm的dirName同步成一致。
     if seed is not None:
         np.random.seed(seed)
+        algorithm.setSeed(seed)
     # 处理先验知识
     prophetPop = None
     if prophet is not None:
@@ -100,8 +111,19 @@ def optimize(algorithm,
     # 参数设置
     algorithm.verbose = verbose if verbose is not None else algorithm.verbose
     algorithm.drawing = drawing if drawing is not None else algorithm.drawing
+    if resume is not None:
+        algorithm.resume(resume)
     # 开始求解
-    [optPop, lastPop] = algorithm.run(prophetPop)
+    evaluator = algorithm.evaluator
+    if evalCache is not None:
+        algorithm.evaluator = ea.CacheEvaluator(evaluator, store=evalCache)
+    try:
+        [optPop, lastPop] = algorithm.run(prophetPop)
+    finally:
+        algorithm.close()  # 释放后台资源，run()因异常而中断时后台指标计算器的子进程也会被关闭
+        if evalCache is not None:
+            algorithm.evaluator.store.close()
+            algorithm.evaluator = evaluator  # 恢复用户设置的评价器
     # 生成结果
     result = {}
     result['success'] = True if optPop.sizes > 0 else False
@@ -159,9 +181,13 @@ def optimize(algorithm,
         else:
             drawNameList = ['GD', 'IGD', 'HV', 'Spacing']
             for drawName in drawNameList:
-                trace = np.array(algorithm.log[drawName.lower()])
-                if trace[0] is not None:
-                    plotter = ea.ParCoordPlotter(len(trace), grid=True, legend=True, title=drawName + ' Trace Plot', coordLabels=['Generation Number', 'Value'], saveName=dirName + drawName + ' Trace Plot' if saveFlag else None)
+                # 只绘制计算了该指标的日志记录（设置了算法类的indicatorTras时，部分记录中的指标为None）
+                values = algorithm.log[drawName.lower()]
+                gens = [gen for gen, value in zip(algorithm.log['gen'], values) if value is not None]
+                trace = np.array([value for value in values if value is not None])
+                if len(trace) != 0:
+                    xtickList = gens if len(gens) != len(algorithm.log['gen']) else None
+                    plotter = ea.ParCoordPlotter(len(trace), xtickList, grid=True, legend=True, title=drawName + ' Trace Plot', coordLabels=['Generation Number', 'Value'], saveName=dirName + drawName + ' Trace Plot' if saveFlag else None)
                     plotter.add(trace, color='blue', label=drawName)
                     plotter.draw()
                     plotter.show()
@@ -170,7 +196,7 @@ def optimize(algorithm,
     result['endTime'] = endTime
     # 保存结果
     if saveFlag:
-        optPop.save(dirName+'optPop')
+        optPop.save(dirName + 'optPop.npz')
         # 记录问题
         with open(dirName + 'problem info.txt', 'w') as file:
             file.write(str(algorithm.problem))
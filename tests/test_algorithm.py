@@ -0,0 +1,129 @@
+import multiprocessing as mp
+import types
+
+import numpy as np
+import pytest
+
+import geatpy
+
+
+def two_objectives(Vars):
+    return np.hstack([Vars[:, [0]], 1 - Vars[:, [0]]])
+
+
+class ToyMOEA(geatpy.MoeaAlgorithm):
+    """Re-evaluates a random population every generation."""
+
+    def run(self, prophetPop=None):
+        population = self.population
+        self.initialization()
+        population.Chrom = self.rng.random((population.sizes, self.problem.Dim))
+        self.call_aimFunc(population)
+        while not self.terminated(population):
+            population.Chrom = self.rng.random(population.Chrom.shape)
+            self.call_aimFunc(population)
+        return self.finishing(population)
+
+
+def test_MoeaAlgorithm_computes_indicators_on_schedule(monkeypatch):
+    monkeypatch.setattr(geatpy, 'ndsortDED', lambda ObjV, **kwargs: (np.ones(ObjV.shape[0]), 1))
+
+    def referSizes(ObjV, PF=None):  # which reference front was used
+        return PF.shape[0]
+
+    monkeypatch.setattr(geatpy, 'indicator', types.SimpleNamespace(GD=referSizes, IGD=referSizes, HV=referSizes,
+                                                                   Spacing=lambda ObjV: 0.0))
+    problem = geatpy.Problem('toy', 2, [1, 1], 2, [0, 0], [0, 0], [1, 1], evalVars=two_objectives)
+    problem.ReferObjV = np.linspace(0, 1, 2000).reshape(-1, 2)
+    algorithm = ToyMOEA(problem, geatpy.Population('RI', np.zeros((3, 2)), 6), MAXGEN=7, logTras=1,
+                        verbose=False, drawing=0)
+    algorithm.indicatorTras = 3
+    algorithm.tinyRefer = True
+    algorithm.run()
+    assert algorithm.log['gen'] == list(range(7))
+    assert algorithm.log['igd'] == [100, None, None, 100, None, None, 1000]  # the last generation is fully logged
+    assert algorithm.indicatorWorker is None
+
+
+def test_submit_aimFunc_without_evaluator_keeps_call_aimFunc_path():
+    problem = geatpy.Problem('toy', 2, [1, 1], 2, [0, 0], [0, 0], [1, 1], evalVars=two_objectives)
+    algorithm = ToyMOEA(problem, geatpy.Population('RI', np.zeros((3, 2)), 6), MAXGEN=1, verbose=False, drawing=0)
+    population = algorithm.population
+    population.Chrom = np.random.default_rng(0).random((population.sizes, 2))
+    algorithm.submit_aimFunc(population, 'parents')
+    assert algorithm.evaluator is None  # the serial fallback is not installed as the evaluator
+    collected, tag = algorithm.collect_aimFunc()
+    assert tag == 'parents' and collected is population
+    assert algorithm.evalsNum == population.sizes
+    np.testing.assert_allclose(population.ObjV, two_objectives(population.Chrom))
+
+
+def kernels_available():
+    try:
+        geatpy.ndsortDED(np.array([[0., 1.], [1., 0.]]), needLevel=1)
+    except Exception:  # the compiled kernels are not available in this build
+        return False
+    return True
+
+
+class LazyFrontProblem(geatpy.Problem):
+    calls = 0
+
+    def __init__(self):
+        super().__init__('lazyFront', 2, [1, 1], 2, [0, 0], [0, 0], [1, 1], evalVars=two_objectives)
+
+    def calReferObjV(self):
+        LazyFrontProblem.calls += 1
+        x = np.linspace(0, 1, 500)[:, np.newaxis]
+        return np.hstack([x, 1 - x])
+
+
+def test_IndicatorWorker_does_not_load_reference_front_in_main_process(tmp_path, monkeypatch):
+    monkeypatch.setattr(geatpy.Problem, 'referenceDir', str(tmp_path))
+    LazyFrontProblem.calls = 0
+    problem = LazyFrontProblem()
+    worker = geatpy.IndicatorWorker(problem)
+    worker.close()
+    assert LazyFrontProblem.calls == 0 and 'ReferObjV' not in problem.__dict__  # loaded by the worker when needed
+
+
+@pytest.mark.skipif(not kernels_available(), reason='requires the compiled kernels')
+def test_MoeaAlgorithm_async_indicators_match_synchronous(tmp_path, monkeypatch):
+    monkeypatch.setattr(geatpy.Problem, 'referenceDir', str(tmp_path))
+    logs = []
+    for asyncIndicators in (False, True):
+        algorithm = ToyMOEA(LazyFrontProblem(), geatpy.Population('RI', np.zeros((3, 2)), 20), MAXGEN=6, logTras=1,
+                            verbose=False, drawing=0)
+        algorithm.setSeed(3)
+        algorithm.indicatorTras = 2
+        algorithm.tinyRefer = True
+        algorithm.asyncIndicators = asyncIndicators  # computed in a worker process from real data
+        algorithm.run()
+        logs.append(algorithm.log)
+    assert logs[1]['gen'] == logs[0]['gen']
+    for key in ['gd', 'igd', 'hv', 'spacing']:
+        assert [value is None for value in logs[1][key]] == [value is None for value in logs[0][key]]
+        assert [value for value in logs[1][key] if value is not None] == \
+            pytest.approx([value for value in logs[0][key] if value is not None])
+
+
+class FailingMOEA(ToyMOEA):
+    def terminated(self, pop):
+        if self.currentGen == 3:
+            raise ValueError('interrupted')
+        return super().terminated(pop)
+
+
+def test_optimize_closes_indicator_worker_when_run_raises(monkeypatch):
+    monkeypatch.setattr(geatpy, 'ndsortDED', lambda ObjV, **kwargs: (np.ones(ObjV.shape[0]), 1))
+    monkeypatch.setattr(geatpy, 'indicator', types.SimpleNamespace(HV=lambda ObjV, PF=None: 0.0,
+                                                                   Spacing=lambda ObjV: 0.0))
+    problem = geatpy.Problem('toy', 2, [1, 1], 2, [0, 0], [0, 0], [1, 1], evalVars=two_objectives)
+    problem.ReferObjV = None
+    algorithm = FailingMOEA(problem, geatpy.Population('RI', np.zeros((3, 2)), 6), MAXGEN=7, logTras=1,
+                            verbose=False, drawing=0)
+    algorithm.asyncIndicators = True
+    children = set(mp.active_children())
+    with pytest.raises(ValueError):
+        geatpy.optimize(algorithm, verbose=False, drawing=0, outputMsg=False, drawLog=False, saveFlag=False)
+    assert algorithm.indicatorWorker is None and set(mp.active_children()) == children
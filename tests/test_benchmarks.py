@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+import geatpy
+from geatpy.benchmarks.mops import WFG1, WFG2
+from geatpy.benchmarks.tsps.TSP import TSP
+
+
+def grid_search(E):
+    return np.array([np.min(np.argsort(row, kind='mergesort')[0:10]) for row in E])
+
+
+@pytest.mark.parametrize('search, error', [
+    (WFG1.searchMixed, lambda t, a: np.abs(t * (1 - np.cos(np.pi / 2 * a)) - 1 + a
+                                           + np.cos(10 * np.pi * a + np.pi / 2) / 10 / np.pi)),
+    (WFG2.searchDisc, lambda t, a: np.abs(t * (1 - np.cos(np.pi / 2 * a)) - 1 + a * np.cos(5 * np.pi * a)**2)),
+])
+def test_WFG_reference_search_matches_grid_scan(search, error):
+    a = np.linspace(0, 1, 10000 + 1)
+    temp = np.hstack([np.random.default_rng(0).exponential(2, 300), [0, 1e-12, 1e12, np.inf, np.nan]])
+    with np.errstate(invalid='ignore'):
+        expected = grid_search(error(temp[:, None], a))
+    np.testing.assert_array_equal(search(temp, a), expected)
+
+
+def test_TSP_scores_tours_with_distance_matrix():
+    problem = TSP('att48', dtype=np.float64, chunkSize=7)
+    tours = np.array([np.random.default_rng(i).permutation(problem.Dim) for i in range(20)])
+    journeys = problem.places[np.hstack([tours, tours[:, [0]]])]
+    expected = np.sum(np.sqrt(np.sum(np.diff(journeys, axis=1)**2, 2)), 1, keepdims=True)
+    np.testing.assert_allclose(problem.evalVars(tours), expected, rtol=1e-12)
+
+
+def test_TSP_delta_evaluation_matches_full_evaluation():
+    problem = TSP('eil51', dtype=np.float64)
+    rng = np.random.default_rng(1)
+    OldVars = np.array([rng.permutation(problem.Dim) for _ in range(10)])
+    Vars = OldVars.copy()
+    Vars[:, [0, 5]] = Vars[:, [5, 0]]  # 交换
+    Vars[:3, 10:20] = Vars[:3, 19:9:-1]  # 逆转
+    Vars[3] = np.roll(Vars[3], 1)  # 整体移位
+    Vars[4, [-1, 7]] = Vars[4, [7, -1]]  # 变化区间延伸到最后一个城市
+    Vars[9] = OldVars[9]
+    start, end = problem.changedBounds(Vars, OldVars)
+    assert start[9] == end[9] == 0 and (start[4], end[4]) == (0, problem.Dim)
+    ObjV = problem.evalDelta(Vars, OldVars, problem.evalVars(OldVars), None, start, end)
+    np.testing.assert_allclose(ObjV, problem.evalVars(Vars), rtol=1e-12)
+
+
+def test_TSP_delta_evaluation_is_opt_in():
+    problem = TSP('eil51', dtype=np.float64)
+    rng = np.random.default_rng(2)
+    Chrom = np.array([rng.permutation(problem.Dim) for _ in range(6)])
+    basePop = geatpy.Population('P', np.zeros((3, problem.Dim)), 6, Chrom)
+    algorithm = geatpy.SoeaAlgorithm(problem, basePop)
+    algorithm.evaluator = geatpy.SerialEvaluator()
+    algorithm.call_aimFunc(basePop)
+    calls = []
+    algorithm.evaluator.do = lambda problem, pop: calls.append(pop.sizes)
+    offspring = basePop.copy()
+    offspring.Chrom = offspring.Chrom.copy()
+    offspring.Chrom[:, 3:9] = offspring.Chrom[:, 8:2:-1]
+    algorithm.call_aimFunc(offspring, basePop)
+    assert calls == [6]  # by default the configured evaluator is used
+    algorithm.deltaEval = True
+    algorithm.call_aimFunc(offspring, basePop, (np.full(6, 3), np.full(6, 9)))
+    assert calls == [6]
+    np.testing.assert_allclose(offspring.ObjV, problem.evalVars(offspring.Chrom), rtol=1e-12)
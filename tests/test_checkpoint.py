@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+
+import geatpy
+
+
+def eval_vars(Vars):
+    return np.sum((Vars - 3) ** 2, 1, keepdims=True)
+
+
+class ToyES(geatpy.SoeaAlgorithm):
+    """A (mu+mu) evolution strategy that keeps its step size on self."""
+
+    stateAttrs = ('sigma',)
+
+    def __init__(self, problem, population, **kwargs):
+        super().__init__(problem, population, **kwargs)
+        self.name = 'ToyES'
+        self.sigma = None
+
+    def run(self, prophetPop=None):
+        population = self.population
+        self.initialization()
+        if self.resumeState is not None:
+            population = self.restore()
+        else:
+            population.Chrom = self.rng.random((population.sizes, self.problem.Dim)) * 10
+            self.call_aimFunc(population)
+            population.FitnV = -population.ObjV
+            self.sigma = 1.0
+        while not self.terminated(population):
+            offspring = population.copy()
+            offspring.Chrom = np.clip(offspring.Chrom + self.sigma * self.rng.standard_normal(offspring.Chrom.shape),
+                                      0, 10)
+            self.call_aimFunc(offspring)
+            offspring.FitnV = -offspring.ObjV
+            population = population + offspring
+            population = population[np.argsort(-population.FitnV[:, 0])[:self.population.sizes]]
+            self.sigma *= 0.9
+        return self.finishing(population)
+
+
+class LegacyES(ToyES):
+    """A templet that has not adopted the state protocol."""
+
+    stateAttrs = None
+
+
+def make_algorithm(templet=ToyES, calls=None):
+    problem = geatpy.Problem('toy',
+                             M=1,
+                             maxormins=[1],
+                             Dim=3,
+                             varTypes=np.zeros(3),
+                             lb=np.zeros(3),
+                             ub=10 * np.ones(3),
+                             evalVars=eval_vars if calls is None else
+                             lambda Vars: calls.append(len(Vars)) or eval_vars(Vars))
+    population = geatpy.Population('RI', np.zeros((3, 3)), 8)
+    return templet(problem, population, MAXGEN=30, logTras=0, verbose=False, drawing=0)
+
+
+def test_resume_continues_bit_for_bit(tmp_path):
+    fileName = str(tmp_path / 'toy.ckpt')
+    algorithm = make_algorithm()
+    algorithm.setSeed(1)
+    algorithm.checkpoint = fileName
+    best, lastPop = algorithm.run()  # the last checkpoint is written at generation 20
+    calls = []
+    resumed = make_algorithm(calls=calls)
+    resumed.setSeed(2)  # the random state is restored from the checkpoint
+    resumed.resume(fileName)
+    resumedBest, resumedLastPop = resumed.run()
+    assert len(calls) == 9  # generations 21-29 only, the setup is not re-evaluated
+    assert np.array_equal(resumedLastPop.Chrom, lastPop.Chrom)
+    assert np.array_equal(resumedBest.ObjV, best.ObjV)
+    assert resumed.evalsNum == algorithm.evalsNum
+    assert resumed.trace == algorithm.trace
+
+
+def test_seeded_algorithms_are_independent_of_global_state():
+    results = []
+    for globalSeed in [1, 2]:
+        np.random.seed(globalSeed)
+        algorithm = make_algorithm()
+        algorithm.setSeed(42)
+        best, _ = algorithm.run()
+        results.append(best.ObjV)
+    assert np.array_equal(results[0], results[1])
+    draws = []
+    for _ in range(2):
+        algorithm = make_algorithm()
+        algorithm.setSeed(42)
+        draws.append([rng.random() for rng in algorithm.spawnRng(2)])
+    assert draws[0] == draws[1]  # child streams are reproducible
+    assert draws[0][0] != draws[0][1]  # and independent of each other
+
+
+def test_templets_without_state_protocol_refuse_checkpoints(tmp_path):
+    algorithm = make_algorithm(LegacyES)
+    algorithm.checkpoint = str(tmp_path / 'legacy.ckpt')
+    with pytest.raises(RuntimeError, match='does not support checkpoints'):
+        algorithm.run()
+    with pytest.raises(RuntimeError, match='does not support checkpoints'):
+        make_algorithm(LegacyES).resume(str(tmp_path / 'legacy.ckpt'))
+    assert geatpy.soea_SEGA_templet.stateAttrs == ()
+    assert geatpy.moea_MOEAD_templet.stateAttrs == ('idealPoint',)
+
+
+def test_all_templets_adopt_the_state_protocol():
+    templets = {name: getattr(geatpy, name) for name in dir(geatpy) if name.endswith('_templet')}
+    unsupported = sorted(name for name, templet in templets.items() if templet.stateAttrs is None)
+    assert unsupported == ['soea_async_steadyGA_templet']  # in-flight evaluations cannot be checkpointed
+    assert geatpy.moea_NSGA2_archive_templet.stateAttrs == ('globalNDSet',)
+    assert geatpy.soea_multi_SEGA_templet.stateAttrs == ('subPopulations',)
+
+
+def test_global_seed_reproduces_unseeded_runs():
+    results = []
+    for globalSeed in [3, 3, 4]:
+        np.random.seed(globalSeed)
+        best, _ = make_algorithm().run()
+        results.append(best.ObjV)
+    assert np.array_equal(results[0], results[1])
+    assert not np.array_equal(results[0], results[2])
+
+
+def test_constructing_an_algorithm_does_not_consume_global_state():
+    np.random.seed(5)
+    expected = np.random.random(3)
+    np.random.seed(5)
+    algorithm = make_algorithm()
+    assert algorithm.rng is None  # built from the global state in initialization()
+    assert np.array_equal(np.random.random(3), expected)
+
+
+def test_MOEAD_rng_follows_global_seed():
+    def first_draws(globalSeed):
+        problem = geatpy.benchmarks.ZDT1()
+        Field = np.vstack([problem.lb, problem.ub, problem.varTypes])  # FieldDR, so no crtfld call
+        algorithm = geatpy.moea_MOEAD_templet(problem,
+                                              geatpy.Population('RI', Field, 20),
+                                              MAXGEN=1,
+                                              logTras=0,
+                                              verbose=False,
+                                              drawing=0)
+        np.random.seed(globalSeed)
+        algorithm.initialization()  # run() derives rng from the global state here
+        return algorithm.rng.random(20)  # the selection masks MOEA/D draws
+
+    assert np.array_equal(first_draws(7), first_draws(7))
+    assert not np.array_equal(first_draws(7), first_draws(8))
@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+
+import geatpy
+
+
+def eval_vars(Vars):
+    return np.sum(Vars, 1, keepdims=True), Vars[:, [0]] - 5
+
+
+def make_problem():
+    return geatpy.Problem('test',
+                          M=1,
+                          maxormins=[1],
+                          Dim=3,
+                          varTypes=np.zeros(3),
+                          lb=np.zeros(3),
+                          ub=10 * np.ones(3),
+                          evalVars=eval_vars)
+
+
+@pytest.fixture
+def population():
+    Phen = np.arange(30, dtype=float).reshape(10, 3)
+    yield geatpy.Population(None, NIND=10, Phen=Phen)
+
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+
+@pytest.mark.parametrize('make_evaluator', [
+    lambda: geatpy.SerialEvaluator(),
+    lambda: geatpy.SerialEvaluator(chunkSize=3),
+    lambda: geatpy.ThreadEvaluator(3),
+    lambda: geatpy.ThreadEvaluator(2, chunkSize=4),
+    lambda: geatpy.ProcessEvaluator(2),
+    pytest.param(lambda: geatpy.SharedMemoryEvaluator(2, chunkSize=3),
+                 marks=pytest.mark.skipif(shared_memory is None,
+                                          reason='requires Python 3.8+')),
+])
+def test_Evaluator_keeps_order(population, make_evaluator):
+    with make_evaluator() as evaluator:
+        for _ in range(2):  # the second call reuses pools and buffers
+            population.ObjV = population.CV = None
+            evaluator.do(make_problem(), population)
+            ObjV, CV = eval_vars(population.Phen)
+            assert np.array_equal(population.ObjV, ObjV)
+            assert np.array_equal(population.CV, CV)
+
+
+def test_Evaluator_empty_population():
+    pop = geatpy.Population(None, NIND=0, Phen=np.zeros((0, 3)))
+    with geatpy.ThreadEvaluator(2) as evaluator:
+        evaluator.do(make_problem(), pop)
+    assert pop.ObjV.shape == (0, 1)
+
+
+@pytest.mark.skipif(shared_memory is None, reason='requires Python 3.8+')
+def test_SharedMemoryEvaluator_attach_does_not_track(monkeypatch):
+    from multiprocessing import resource_tracker
+    from geatpy.evaluators import SharedMemoryEvaluator as module
+    registered = []
+    monkeypatch.setattr(resource_tracker, 'register',
+                        lambda name, rtype: registered.append((name, rtype)))
+    monkeypatch.setattr(resource_tracker, 'unregister', lambda name, rtype: None)
+    shm = shared_memory.SharedMemory(create=True, size=8)
+    try:
+        arr = module.attach((shm.name, (1,), '<f8'))
+        arr[0] = 1.5
+        assert np.ndarray((1,), '<f8', buffer=shm.buf)[0] == 1.5
+        assert registered == [(shm._name, 'shared_memory')]  # only the creator
+        del arr
+        module.attachedBlocks.pop(shm.name).close()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def make_context(offset):
+    return {'offset': offset}
+
+
+def eval_vars_with_context(Vars):
+    return np.sum(Vars, 1, keepdims=True) \
+        + geatpy.ProcessEvaluator.getContext()['offset']
+
+
+def build_context_problem():
+    problem = make_problem()
+    problem.evalVars = eval_vars_with_context
+    return problem
+
+
+def test_ProcessEvaluator_builds_problem_in_workers(population):
+    with geatpy.ProcessEvaluator(2,
+                                 problemBuilder=build_context_problem,
+                                 initializer=make_context,
+                                 initargs=(100,)) as evaluator:
+        evaluator.do(make_problem(), population)
+        pool = evaluator.pool
+        evaluator.do(make_problem(), population)
+        assert evaluator.pool is pool  # workers persist across calls
+    assert np.array_equal(population.ObjV,
+                          np.sum(population.Phen, 1, keepdims=True) + 100)
+    assert population.CV is None
+
+
+@pytest.mark.parametrize('make_evaluator', [
+    lambda: geatpy.SerialEvaluator(),
+    lambda: geatpy.ThreadEvaluator(2),
+    lambda: geatpy.ProcessEvaluator(2),
+])
+def test_Evaluator_submit_collect(population, make_evaluator):
+    problem = make_problem()
+    with make_evaluator() as evaluator:
+        for i in range(population.sizes):
+            evaluator.submit(problem, population.Phen[[i]], i)
+        results = dict()
+        for _ in range(population.sizes):
+            tag, ObjV, CV = evaluator.collect()
+            results[tag] = ObjV
+    ObjV, CV = eval_vars(population.Phen)
+    assert np.array_equal(np.vstack([results[i] for i in range(population.sizes)]), ObjV)
+
+
+def test_CacheEvaluator_evaluates_misses_only():
+    calls = []
+
+    def counting_eval_vars(Vars):
+        calls.append(Vars.shape[0])
+        return eval_vars(Vars)
+
+    problem = make_problem()
+    problem.evalVars = counting_eval_vars
+    Phen = np.array([[1., 2, 3], [4, 5, 6], [1, 2, 3], [7, 8, 9]])
+    pop = geatpy.Population(None, NIND=4, Phen=Phen)
+    with geatpy.CacheEvaluator(maxSize=3) as evaluator:
+        assert evaluator.do(problem, pop) == 3  # the duplicated row is evaluated once
+        ObjV, CV = eval_vars(Phen)
+        assert np.array_equal(pop.ObjV, ObjV)
+        assert np.array_equal(pop.CV, CV)
+        pop.ObjV = pop.CV = None
+        assert evaluator.do(problem, pop) == 0
+        assert np.array_equal(pop.ObjV, ObjV)
+        assert (evaluator.hits, evaluator.misses) == (5, 3)
+        pop.Phen = np.array([[0., 0, 0]])
+        assert evaluator.do(problem, pop) == 1
+        assert len(evaluator.cache) == 3  # the least recently used entry is evicted
+    assert calls == [3, 1]
+
+
+def test_CacheEvaluator_shares_store_across_runs(tmp_path):
+    fileName = str(tmp_path / 'evals.store')
+    Phen = np.array([[1., 2, 3], [4, 5, 6]])
+    problem = make_problem()
+    for expected in [2, 0]:  # the second evaluator starts with an empty memory cache
+        pop = geatpy.Population(None, NIND=2, Phen=Phen)
+        with geatpy.CacheEvaluator(store=fileName) as evaluator:
+            assert evaluator.do(problem, pop) == expected
+        ObjV, CV = eval_vars(Phen)
+        assert np.array_equal(pop.ObjV, ObjV)
+        assert np.array_equal(pop.CV, CV)
+    store = geatpy.EvalStore(fileName)
+    store.append(Phen, *eval_vars(Phen))  # duplicated records
+    assert store.sizes == 4
+    store.compact()
+    assert store.sizes == 2
+    found, ObjV, CV = store.lookup(np.array([[4., 5, 6], [0, 0, 0]]))
+    assert found.tolist() == [True, False]
+    assert np.array_equal(ObjV, [[15.]])
+    store.close()
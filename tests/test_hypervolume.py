@@ -0,0 +1,43 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import geatpy
+
+
+def inclusion_exclusion(P, ref):
+    P = P[np.all(P < ref, 1)]
+    return sum((-1) ** (k + 1) * np.prod(ref - np.max(P[list(S)], 0))
+               for k in range(1, len(P) + 1) for S in itertools.combinations(range(len(P)), k))
+
+
+@pytest.mark.parametrize('M', [1, 2, 3, 4, 5])
+def test_hypervolume_is_exact(M):
+    rng = np.random.default_rng(M)
+    for _ in range(20):
+        # a coarse grid gives ties, duplicates and dominated points
+        P = np.round(rng.random((rng.integers(1, 8), M)), 1)
+        ref = np.full(M, 1.05)
+        expected = inclusion_exclusion(P, ref)
+        assert geatpy.hypervolume(P, ref) == pytest.approx(expected)
+        contributions = [expected - inclusion_exclusion(np.delete(P, i, 0), ref) for i in range(len(P))]
+        np.testing.assert_allclose(geatpy.hvContribution(P, ref), contributions, atol=1e-12)
+
+
+def test_hypervolume_respects_maxormins():
+    P = np.array([[0.2, 0.8], [0.5, 0.5], [0.8, 0.1]])
+    assert geatpy.hypervolume(-P, [-1, -1], maxormins=[-1, -1]) == pytest.approx(geatpy.hypervolume(P, [1, 1]))
+
+
+@pytest.mark.parametrize('M', [2, 3, 4])
+def test_hvContribution_sweep_matches_removal(M):
+    rng = np.random.default_rng(M)
+    front = rng.random((60, M))
+    front /= front.sum(1, keepdims=True)
+    dominated = front[rng.integers(0, 60, 40)] + rng.random((40, 1)) * 0.1 * rng.integers(0, 2, (40, 1))
+    P = np.round(np.vstack([front, dominated]), 2)
+    ref = np.full(M, 1.05)
+    total = geatpy.hypervolume(P, ref)
+    contributions = [total - geatpy.hypervolume(np.delete(P, i, 0), ref) for i in range(len(P))]
+    np.testing.assert_allclose(geatpy.hvContribution(P, ref), contributions, atol=1e-12)
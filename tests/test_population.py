@@ -0,0 +1,193 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import geatpy
+
+
+@pytest.fixture
+def population():
+    Chrom = np.arange(30, dtype=float).reshape(10, 3)
+    yield geatpy.Population('RI', np.zeros((3, 3)), 10, Chrom, ObjV=Chrom[:, [0]], FitnV=Chrom[:, [1]], Phen=Chrom)
+
+
+@pytest.mark.parametrize('index', [slice(2, 5), slice(None, None, 3), slice(-4, None),
+                                   [1, 3, 3], np.arange(10) < 4, 7])
+def test_Population_getitem_copies(population, index):
+    pop = population[index]
+    expected = population.Chrom[index].reshape(-1, 3)
+    assert pop.sizes == expected.shape[0]
+    assert np.array_equal(pop.Chrom, expected)
+    assert np.array_equal(pop.Phen, expected)
+    assert not np.shares_memory(pop.Chrom, population.Chrom)
+    assert not np.shares_memory(pop.ObjV, population.ObjV)
+
+
+def test_Population_view_shares_memory(population):
+    view = population.view(slice(2, 6))
+    assert view.sizes == 4
+    assert np.shares_memory(view.Chrom, population.Chrom)
+    view.ObjV[:] = -1
+    assert np.all(population.ObjV[2:6] == -1)
+    assert np.all(population.ObjV[6:] != -1)
+    assert np.array_equal(population.view(-1).Chrom, population.Chrom[[-1]])
+    assert not np.shares_memory(population.view([0, 1]).Chrom, population.Chrom)  # fancy indexing falls back to a copy
+
+
+def test_Population_reserve_merges_in_place(population):
+    reference = population.copy()
+    offspring = population[::-1]
+    population.reserve(20)
+    buffers = {name: [id(buffer) for buffer in pair] for name, pair in population.buffers.items()}
+    for flag in ([0, 12, 5, 19, 3], np.arange(15) % 2 == 0):
+        population += offspring
+        reference = reference + offspring
+        population.FitnV = -population.ObjV  # reassigned arrays are written back into the buffers
+        reference.FitnV = -reference.ObjV
+        population.keep(flag)
+        reference = reference[flag]
+        for name, arr in reference.getArrays().items():
+            assert np.array_equal(population.getArrays()[name], arr)
+        assert population.sizes == reference.sizes and population.Lind == 3
+        assert np.shares_memory(population.FitnV, population.buffers['FitnV'][population.bufferIdx])
+    assert {name: [id(buffer) for buffer in pair] for name, pair in population.buffers.items()} == buffers
+    population += population.copy() + population  # growing beyond the capacity reallocates the buffers
+    assert population.capacity == 40 and population.sizes == 24
+
+
+def test_Population_reserve_writes_back_aliased_views():
+    Chrom = np.arange(9, dtype=float).reshape(3, 3)
+    pop = geatpy.Population('RI', np.zeros((3, 3)), 3, Chrom, ObjV=Chrom[:, [0]])
+    pop.reserve(6)
+    pop.Chrom = pop.Chrom.T  # same start address and shape as the buffer, different strides
+    pop.keep(slice(None))
+    assert np.array_equal(pop.Chrom, Chrom.T)
+
+
+def test_Population_dtypes_apply_to_every_assignment():
+    Chrom = np.array([np.random.permutation(5) for _ in range(6)])
+    pop = geatpy.Population('P', np.zeros((3, 5)), 6, Chrom, dtypes={'Chrom': np.int16, 'ObjV': np.float32})
+    pop.ObjV = Chrom[:, [0]] * 0.5
+    pop.FitnV = np.ones((6, 1))
+    assert pop.Chrom.dtype == np.int16 and pop.ObjV.dtype == np.float32 and pop.FitnV.dtype == np.float64
+    for other in (pop[[0, 2]], pop.copy(), pop + pop, pickle.loads(pickle.dumps(pop))):
+        assert other.Chrom.dtype == np.int16 and other.ObjV.dtype == np.float32
+    pop.reserve(12)
+    pop += pop[:3]
+    pop.keep(slice(2, 8))
+    assert pop.buffers['Chrom'][0].dtype == np.int16 and pop.ObjV.dtype == np.float32
+    assert np.array_equal(pop.Chrom, np.vstack([Chrom, Chrom[:3]])[2:8])
+
+
+def test_Population_decoding_only_decodes_changed_rows(monkeypatch):
+    decodedRows = []
+
+    def bs2ri(Chrom, FieldD):  # plain binary decoding of a single variable, counting the decoded rows
+        decodedRows.append(Chrom.shape[0])
+        return Chrom @ (2 ** np.arange(Chrom.shape[1])[::-1]).reshape(-1, 1).astype(float)
+
+    monkeypatch.setattr(geatpy, 'bs2ri', bs2ri)
+    Chrom = np.random.randint(0, 2, (8, 6))
+    pop = geatpy.Population('BG', np.zeros((7, 1)), 8, Chrom)
+    pop.decoding()
+    offspring = pop[[1, 3, 5, 7]]
+    offspring.Chrom = offspring.Chrom.copy()
+    offspring.Chrom[2] = 1 - offspring.Chrom[2]
+    Phen = offspring.decoding()
+    assert decodedRows == [8, 1]
+    assert np.array_equal(Phen, bs2ri(offspring.Chrom, None))
+    pop = geatpy.Population('RI', np.zeros((3, 6)), 8, Chrom)
+    Phen = pop.decoding()
+    assert not np.shares_memory(Phen, pop.Chrom)
+    Phen[0] = -1  # objectives may repair Vars in place by default
+    pop = geatpy.Population('RI', np.zeros((3, 6)), 8, Chrom, phenView=True)
+    assert not pop[2:].decoding().flags.writeable  # phenView is passed on to slices
+    Phen = pop.decoding()
+    assert np.shares_memory(Phen, pop.Chrom) and not Phen.flags.writeable
+    pop[[0]] = pop[[1]]  # replacing individuals copies the read-only Phen before writing
+    assert np.array_equal(pop.Phen[0], Chrom[1])
+
+
+def test_PsyPopulation_stores_chromosomes_contiguously(monkeypatch):
+    monkeypatch.setattr(geatpy, 'bs2ri', lambda Chrom, FieldD: Chrom[:, :1] * 2.0)
+    Chroms = [np.random.randint(0, 2, (6, 4)), np.arange(18.).reshape(6, 3), np.arange(12.).reshape(6, 2)]
+    Fields = [np.zeros((7, 1)), np.zeros((3, 3)), np.zeros((3, 2))]
+    pop = geatpy.PsyPopulation(['BG', 'RI', 'RI'], Fields, 6, Chroms, EncoIdxs=[[0], [1, 2, 3], [4, 5]])
+    assert pop.ChromLayout == ((0, 0, 4), (1, 0, 3), (1, 3, 5)) and pop.Linds == [4, 3, 2]
+    pop.Chroms[1] = pop.Chroms[1] * 10  # assignments are written back into the shared buffer
+    assert np.shares_memory(pop.Chroms[1], pop.ChromBuffers[1])
+    assert np.array_equal(pop.ChromBuffers[1], np.hstack([Chroms[1] * 10, Chroms[2]]))
+    Phen = pop.decoding()
+    assert np.array_equal(Phen, np.hstack([Chroms[0][:, :1] * 2.0, Chroms[1] * 10, Chroms[2]]))
+    merged = pop[[4, 1]] + pop
+    for i in range(3):
+        assert np.array_equal(merged.Chroms[i], np.vstack([pop.Chroms[i][[4, 1]], pop.Chroms[i]]))
+    assert np.array_equal(merged.Phen, np.vstack([Phen[[4, 1]], Phen]))
+
+
+def test_PsyPopulation_decoding_is_not_changed_by_chromosome_assignment():
+    Chroms = [np.arange(12.).reshape(6, 2), np.arange(18.).reshape(6, 3)]
+    Fields = [np.zeros((3, 2)), np.zeros((3, 3))]
+    pop = geatpy.PsyPopulation(['RI', 'RI'], Fields, 6, Chroms, EncoIdxs=[[0, 1], [2, 3, 4]])
+    Phen = pop.decoding()
+    assert not np.shares_memory(Phen, pop.ChromBuffers[0])
+    Phen[0] = -1  # objectives may repair Vars in place by default
+    pop = geatpy.PsyPopulation(['RI', 'RI'], Fields, 6, Chroms, EncoIdxs=[[0, 1], [2, 3, 4]], phenView=True)[1:]
+    Phen = pop.decoding()  # phenView is passed on to slices
+    assert np.shares_memory(Phen, pop.ChromBuffers[0]) and not Phen.flags.writeable
+    pop.Chroms[0] = pop.Chroms[0] * 10  # copy-on-write: the held Phen keeps the old chromosomes
+    assert np.array_equal(Phen, np.hstack(Chroms)[1:])
+    assert np.array_equal(pop.Chroms[0], Chroms[0][1:] * 10)
+
+
+def test_PsyPopulation_view_chromosome_assignment_leaves_parent_untouched():
+    Chroms = [np.arange(12.).reshape(6, 2), np.arange(18.).reshape(6, 3)]
+    Fields = [np.zeros((3, 2)), np.zeros((3, 3))]
+    pop = geatpy.PsyPopulation(['RI', 'RI'], Fields, 6, Chroms, EncoIdxs=[[0, 1], [2, 3, 4]])
+    view = pop.view(slice(1, 4))
+    view.Chroms[0][:, 0] = -1  # in-place changes are shared like Population.view()
+    assert np.all(pop.Chroms[0][1:4, 0] == -1)
+    view.Chroms[1] = view.Chroms[1] * 10  # reassignments are not
+    assert np.array_equal(pop.Chroms[1], Chroms[1])
+    assert np.array_equal(view.Chroms[1], Chroms[1][1:4] * 10)
+
+
+def test_Population_reserve_maps_buffers_to_files(population, tmp_path):
+    reference = population + population[:4]
+    population.reserve(12, str(tmp_path))
+    population += population[:4]
+    population[[0]] = population[[13]]
+    reference[[0]] = reference[[13]]
+    population.keep(slice(None, None, 2))
+    reference = reference[::2]
+    assert isinstance(population.buffers['Chrom'][0], np.memmap)
+    mapped = geatpy.Population.loadMapped(str(tmp_path))  # what another process would see
+    assert set(mapped) == {'Chrom', 'ObjV', 'FitnV', 'Phen'}
+    for name, arr in mapped.items():
+        assert np.array_equal(arr, reference.getArrays()[name])
+    population += reference + reference  # growing beyond the capacity moves the buffers to new files
+    assert len(list(tmp_path.glob('*.npy'))) == 2 * len(mapped)
+    assert np.array_equal(geatpy.Population.loadMapped(str(tmp_path))['ObjV'], population.ObjV)
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_Population_save_load_roundtrip(population, tmp_path, compress):
+    population.dtypes = {'ObjV': np.dtype(np.float32)}
+    population.ObjV = population.ObjV / 3
+    population.save(str(tmp_path / 'pop.npz'), compress)
+    pop = geatpy.Population.load(str(tmp_path / 'pop.npz'))
+    assert type(pop) is geatpy.Population and pop.Encoding == 'RI' and pop.sizes == 10 and pop.Lind == 3
+    assert pop.dtypes == population.dtypes and pop.CV is None
+    for name, arr in population.getArrays().items():
+        loaded = pop.getArrays()[name]
+        assert np.array_equal(loaded, arr) and (arr is None or loaded.dtype == arr.dtype)
+    Chroms = [np.random.randint(0, 2, (4, 5)), np.random.rand(4, 2)]
+    psyPop = geatpy.PsyPopulation(['BG', 'RI'], [np.zeros((7, 1)), np.zeros((3, 2))], 4, Chroms, ObjV=np.ones((4, 2)),
+                                  EncoIdxs=[[0], [1, 2]])
+    psyPop.save(str(tmp_path / 'psyPop.npz'), compress)
+    pop = geatpy.Population.load(str(tmp_path / 'psyPop.npz'))
+    assert type(pop) is geatpy.PsyPopulation and pop.Encodings == ['BG', 'RI'] and pop.EncoIdxs == [[0], [1, 2]]
+    assert all(np.array_equal(a, b) for a, b in zip(pop.Chroms, Chroms))
+    assert all(np.array_equal(a, b) for a, b in zip(pop.Fields, psyPop.Fields))
+    assert np.array_equal(pop.ObjV, psyPop.ObjV) and pop.Phen is None
@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pytest
 
@@ -82,3 +84,72 @@ def test_Problem_evaluation_with_aimFunc_and_evalVars(
                              evalVars=eval_function)
     problem.evaluation(pop)
     assert np.array_equal(pop.ObjV, [[10]])
+
+
+def sum_vars(Vars):
+    return np.sum(Vars, 1, keepdims=True)
+
+
+class FrontProblem(geatpy.Problem):
+    calls = 0
+
+    def __init__(self, M=2):
+        super().__init__('Front', M, [1] * M, 3, np.zeros(3), np.zeros(3), np.ones(3), evalVars=sum_vars)
+
+    def calReferObjV(self, N=150):
+        FrontProblem.calls += 1
+        return np.linspace(0, 1, N * self.M).reshape(-1, self.M)
+
+
+def test_Problem_caches_ReferObjV_as_npy(tmp_path, monkeypatch):
+    monkeypatch.setattr(geatpy.Problem, 'referenceDir', str(tmp_path))
+    FrontProblem.calls = 0
+    first = FrontProblem()
+    second = FrontProblem()
+    assert FrontProblem.calls == 0  # reference fronts are computed on first access
+    first.ReferObjV
+    second.ReferObjV
+    assert FrontProblem.calls == 1
+    assert isinstance(second.ReferObjV, np.memmap) and not second.ReferObjV.flags.writeable
+    assert np.array_equal(second.ReferObjV, first.ReferObjV) and second.TinyReferObjV.shape == (100, 2)
+    FrontProblem(M=3).ReferObjV  # a different M gets its own cache entry
+    assert FrontProblem.calls == 2
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == ['.npy', '.npy']
+    second.getReferObjV(reCalculate=True)
+    assert FrontProblem.calls == 3
+    assert second.getReferObjV(N=40).shape == (40, 2)  # keyword arguments reach calReferObjV and the cache key
+    assert FrontProblem.calls == 4 and FrontProblem().getReferObjV(N=40).shape == (40, 2)
+    assert FrontProblem.calls == 4 and len(list(tmp_path.glob('Front_M2_D3_N40_*.npy'))) == 1
+
+
+def test_Problem_prefetches_ReferObjV_in_background(tmp_path, monkeypatch):
+    monkeypatch.setattr(geatpy.Problem, 'referenceDir', str(tmp_path))
+    problem = FrontProblem()
+    problem.prefetchReferObjV()
+    assert problem.TinyReferObjV.shape == (100, 2)
+    assert not problem.referenceThread.is_alive()
+    clone = pickle.loads(pickle.dumps(problem))
+    assert 'referenceThread' not in clone.__dict__ and np.array_equal(clone.ReferObjV, problem.ReferObjV)
+
+
+class DeltaProblem(geatpy.Problem):
+    def __init__(self):
+        super().__init__('Delta', 1, [1], 4, np.zeros(4), np.zeros(4), np.ones(4) * 9, evalVars=sum_vars)
+
+    def evalDelta(self, Vars, OldVars, OldObjV, OldCV, start, end):
+        self.bounds = (start, end)
+        return OldObjV + np.sum(Vars - OldVars, 1, keepdims=True)
+
+
+def test_Problem_deltaEvaluation_passes_bounds_and_keeps_CV():
+    problem = DeltaProblem()
+    basePop = geatpy.Population(None, NIND=3, Phen=np.arange(12.).reshape(3, 4))
+    basePop.ObjV = np.sum(basePop.Phen, 1, keepdims=True)
+    basePop.CV = np.array([[1.], [-1.], [0.]])
+    pop = geatpy.Population(None, NIND=3, Phen=basePop.Phen.copy())
+    pop.Phen[0, 1:3] = 0
+    pop.Phen[2, 3] = 1
+    assert problem.deltaEvaluation(pop, basePop)
+    assert np.array_equal(problem.bounds[0], [1, 0, 3]) and np.array_equal(problem.bounds[1], [3, 0, 4])
+    assert np.array_equal(pop.ObjV, np.sum(pop.Phen, 1, keepdims=True))
+    assert np.array_equal(pop.CV, basePop.CV) and pop.CV is not basePop.CV